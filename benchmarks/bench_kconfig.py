@@ -0,0 +1,148 @@
+#
+# KConfig engine benchmark suite for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+Times the KConfig engine on a synthetic tree (see synth.py) and writes the
+results as JSON. With --baseline, compares against an earlier result file
+and exits with status 1 if any stage got slower than --threshold allows.
+
+    python benchmarks/bench_kconfig.py --output base.json
+    python benchmarks/bench_kconfig.py --baseline base.json [--threshold 0.10]
+"""
+
+# ---[ Libraries ]--- #
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from synth import add_shape_arguments, generate_tree, shape_from_args
+
+from mesonconfig import kconfig
+from mesonconfig.cli import build_meson_options
+from mesonconfig.visibility import VisibilityView
+
+# ---[ Functions ]--- #
+def _time(fn: Callable[[], object], repeat: int, setup: Optional[Callable[[], object]] = None) -> list[float]:
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+def run_suite(root: Path, work: Path, repeat: int) -> dict[str, list[float]]:
+    """Time every stage; each entry is the list of run times in seconds."""
+    config = str(work / "local.conf")
+    options = str(work / "meson_options.txt")
+    results = {}
+
+    results["init"] = _time(lambda: kconfig.KConfig(str(root)), repeat)
+
+    kc = kconfig.KConfig(str(root))
+    names = list(kc._options_index)
+
+    results["get_visible_entries"] = _time(kc.get_visible_entries, repeat)
+
+    # Every menu once through a fresh view, as when browsing the whole tree
+    menus = [None] + [e for e in kc._walk_entries(kc.entries) if isinstance(e, kconfig.KMenu)]
+    results["view_children"] = _time(lambda: [VisibilityView(kc).children(m) for m in menus], repeat)
+
+    # Flip every tenth bool so enforcement has something to undo
+    def perturb() -> None:
+        for name in names[::10]:
+            opt = kc._options_index[name]
+            if opt.opt_type == "bool":
+                opt.value = not opt.value
+
+    results["enforce_dependencies"] = _time(kc.enforce_dependencies, repeat, setup=perturb)
+
+    results["save_config"] = _time(lambda: kc.save_config(config), repeat)
+    results["load_config"] = _time(lambda: kc.load_config(config), repeat)
+    results["has_changes"] = _time(lambda: kc.has_changes(config), repeat)
+    results["build_meson_options"] = _time(lambda: build_meson_options(kc, options), repeat)
+
+    return results
+
+def summarize(runs: dict[str, list[float]]) -> dict[str, dict]:
+    return {
+        stage: {"best": min(times), "median": statistics.median(times), "runs": times}
+        for stage, times in runs.items()
+    }
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print a stage-by-stage comparison of best times; return the regressed stages."""
+    regressed = []
+
+    print(f"{'stage':<22} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for stage, res in current["results"].items():
+        base = baseline["results"].get(stage)
+        if base is None:
+            print(f"{stage:<22} {'-':>10} {res['best']:>9.4f}s {'new':>7}")
+            continue
+
+        ratio = res["best"] / base["best"] if base["best"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            regressed.append(stage)
+            flag = "  REGRESSION"
+        print(f"{stage:<22} {base['best']:>9.4f}s {res['best']:>9.4f}s {ratio:>6.2f}x{flag}")
+
+    if baseline.get("shape") != current["shape"]:
+        print("warning: baseline was recorded with a different tree shape", file=sys.stderr)
+
+    return regressed
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Compare against this JSON result file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown before a stage counts as regressed (0.10 = 10%%)")
+    add_shape_arguments(parser)
+    args = parser.parse_args()
+
+    shape = shape_from_args(args)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        root = generate_tree(tmp / "tree", shape)
+        work = tmp / "work"
+        work.mkdir()
+
+        runs = run_suite(root, work, args.repeat)
+
+    current = {
+        "shape": shape.as_dict(),
+        "repeat": args.repeat,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": summarize(runs),
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressed = compare(current, baseline, args.threshold)
+        if regressed:
+            print(f"Regressed: {', '.join(regressed)}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        for stage, res in current["results"].items():
+            print(f"{stage:<22} best {res['best']:.4f}s  median {res['median']:.4f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#
+# Parse throughput benchmark for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+Times mesonconfig.kconfig.parse_file on a synthetic KConfig file and
+reports lines/second.
+
+    python benchmarks/bench_parse.py [--lines 100000] [--repeat 5]
+"""
+
+# ---[ Libraries ]--- #
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from mesonconfig.kconfig import parse_file
+
+# ---[ Functions ]--- #
+def write_synthetic(path: Path, target_lines: int) -> int:
+    """Write a flat-ish KConfig file of about `target_lines` lines."""
+    out = ['mainmenu "Parse benchmark"', ""]
+    i = 0
+    # Conditions only name earlier symbols, so KConfig() loads the file too
+    previous = None
+
+    while len(out) < target_lines:
+        out.append(f'menu "Menu {i}"')
+        out.append(f"    depends on OPT_{i - 1}" if i else "    comment \"first\"")
+
+        for j in range(8):
+            name = f"OPT_{i}_{j}"
+            out.append(f"    config {name}")
+            out.append(f'        bool "Option {i}.{j}"')
+            out.append(f"        default y if {previous}" if previous else "        default y")
+            previous = name
+            if j:
+                out.append(f"        depends on OPT_{i}_{j - 1} && !OPT_{i}_0")
+            out.append("        help")
+            out.append(f"          Help text for option {i}.{j}.")
+            out.append("          It spans a couple of lines.")
+
+        out.append("    choice")
+        out.append(f'        prompt "Choice {i}"')
+        for j in range(2):
+            out.append(f"        config CH_{i}_{j}")
+            out.append(f'            bool "Choice {i}.{j}"')
+        out.append("    endchoice")
+
+        out.append(f"    config OPT_{i}")
+        out.append(f'        int "Number {i}"')
+        out.append(f"        default {i}")
+        out.append(f'    comment "End of menu {i}"')
+        out.append("endmenu")
+        out.append("")
+        i += 1
+
+    path.write_text("\n".join(out) + "\n", encoding="utf-8")
+    return len(out)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "KConfig"
+        nlines = write_synthetic(path, args.lines)
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            parse_file(str(path))
+            best = min(best, time.perf_counter() - start)
+
+    print(f"{nlines} lines, best of {args.repeat}: {best:.3f} s "
+          f"({nlines / best:,.0f} lines/s)")
+
+if __name__ == "__main__":
+    main()
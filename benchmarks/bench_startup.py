@@ -0,0 +1,102 @@
+#
+# Headless startup budget check for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+Checks that headless use of the CLI stays cheap to start:
+
+    python benchmarks/bench_startup.py [--budget-ms 150] [--repeat 5]
+
+Times `import mesonconfig.cli` with `python -X importtime` (best of
+--repeat runs), then runs --version, --help, --build-meson-options and a
+headless subcommand and checks that none of them imported the TUI stack. Exits with status 1 if
+the import took longer than --budget-ms or a forbidden module was loaded.
+tests/test_startup.py runs the same checks under pytest, with a looser budget.
+"""
+
+# ---[ Libraries ]--- #
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from synth import TreeShape, generate_tree
+
+# ---[ Variables ]--- #
+# Top-level packages that headless code paths must never import
+FORBIDDEN = ("textual", "rich", "mesonconfig.tui.app")
+
+# Runs cli.main() with the given argv, then reports the forbidden modules loaded
+_PROBE = """
+import json, sys
+from mesonconfig import cli
+argv, forbidden = json.loads(sys.argv[1]), json.loads(sys.argv[2])
+sys.argv = ["mesonconfig"] + argv
+try:
+    cli.main()
+except SystemExit:
+    pass
+loaded = sorted(m for m in sys.modules if any(m == f or m.startswith(f + ".") for f in forbidden))
+print(json.dumps(loaded), file=sys.stderr)
+"""
+
+# ---[ Functions ]--- #
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of `module`, in milliseconds, from -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+def loaded_modules(argv: list[str], cwd: Path) -> list[str]:
+    """Forbidden modules imported by running the CLI with `argv` in `cwd`."""
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE, json.dumps(argv), json.dumps(FORBIDDEN)],
+        capture_output=True, text=True, cwd=cwd,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"mesonconfig {' '.join(argv)} failed:\n{proc.stderr}")
+    return json.loads(proc.stderr.strip().splitlines()[-1])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="Allowed import time of mesonconfig.cli, in milliseconds")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+
+    best = min(import_time_ms("mesonconfig.cli") for _ in range(max(args.repeat, 1)))
+    status = "ok" if best <= args.budget_ms else "OVER BUDGET"
+    print(f"import mesonconfig.cli   {best:8.1f} ms  (budget {args.budget_ms:.0f} ms)  {status}")
+    failed |= best > args.budget_ms
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        root = generate_tree(tmp, TreeShape(options=50, choices=2, fanout=2))
+
+        headless = (
+            ["--version"], ["--help"], ["--build-meson-options", "--no-cache", str(root)],
+            ["list", "--no-cache", "--kconfig-file", str(root)],
+        )
+        for argv in headless:
+            loaded = loaded_modules(argv, tmp)
+            status = "ok" if not loaded else "imports " + ", ".join(loaded[:5])
+            print(f"mesonconfig {' '.join(argv[:1]):<22} {status}")
+            failed |= bool(loaded)
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#
+# Synthetic KConfig tree generator for Mesonconfig benchmarks
+# 2026, Remeny
+#
+
+"""
+Writes a deterministic, valid KConfig tree of a given shape:
+
+    python benchmarks/synth.py OUTDIR [--options 5000] [--depth 3] ...
+
+The root file sources `fanout` files. Each of those holds a stack of
+`depth` nested menus, and the options are spread evenly across them.
+`density` is the fraction of options, menus and choices that get a
+'depends on' of `expr_len` symbols; expressions only reference bool
+options declared earlier, so the tree never has dependency cycles.
+"""
+
+# ---[ Libraries ]--- #
+import argparse
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# ---[ Classes ]--- #
+@dataclass
+class TreeShape:
+    options: int = 5000         # config entries, choice members included
+    depth: int = 3              # nested menus per sourced file
+    choices: int = 50           # choice blocks of `choice_size` bool options
+    choice_size: int = 3
+    fanout: int = 8             # files sourced from the root KConfig
+    expr_len: int = 3           # symbols per 'depends on' expression
+    density: float = 0.5        # fraction of options/menus/choices with a 'depends on'
+    seed: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _Writer:
+    def __init__(self, shape: TreeShape) -> None:
+        self.shape = shape
+        self.rng = random.Random(shape.seed)
+        # bool symbols declared so far, usable in expressions
+        self.bools: list[str] = []
+        self.count = 0
+
+    def expr(self) -> str:
+        rng = self.rng
+        picks = [rng.choice(self.bools) for _ in range(self.shape.expr_len)]
+
+        out = []
+        for i, sym in enumerate(picks):
+            if i:
+                out.append(rng.choice(("&&", "&&", "||")))
+            out.append(f"!{sym}" if rng.random() < 0.2 else sym)
+
+        # Occasionally group the tail, to exercise parentheses
+        if len(picks) > 2 and rng.random() < 0.3:
+            out[2] = "(" + out[2]
+            out[-1] += ")"
+
+        return " ".join(out)
+
+    def wants_depends(self) -> bool:
+        return bool(self.bools) and self.rng.random() < self.shape.density
+
+    def option(self, out: list[str], indent: str) -> None:
+        rng = self.rng
+        name = f"SYM_{self.count}"
+        self.count += 1
+
+        kind = rng.random()
+        out.append(f"{indent}config {name}")
+
+        if kind < 0.8:
+            out.append(f'{indent}    bool "Option {name}"')
+            if self.bools and rng.random() < 0.3:
+                out.append(f"{indent}    default y if {rng.choice(self.bools)}")
+            elif rng.random() < 0.5:
+                out.append(f"{indent}    default y")
+        elif kind < 0.9:
+            out.append(f'{indent}    int "Number {name}"')
+            out.append(f"{indent}    default {rng.randrange(1000)}")
+        else:
+            out.append(f'{indent}    string "Text {name}"')
+            out.append(f'{indent}    default "value {self.count}"')
+
+        if self.wants_depends():
+            out.append(f"{indent}    depends on {self.expr()}")
+
+        out.append(f"{indent}    help")
+        out.append(f"{indent}      Help text for {name}.")
+
+        if kind < 0.8:
+            self.bools.append(name)
+
+    def choice(self, out: list[str], indent: str) -> None:
+        out.append(f"{indent}choice")
+        out.append(f'{indent}    prompt "Choice {self.count}"')
+        if self.wants_depends():
+            out.append(f"{indent}    depends on {self.expr()}")
+
+        members = []
+        for _ in range(self.shape.choice_size):
+            name = f"SYM_{self.count}"
+            self.count += 1
+            members.append(name)
+            out.append(f"{indent}    config {name}")
+            out.append(f'{indent}        bool "Member {name}"')
+
+        out.append(f"{indent}endchoice")
+        self.bools.extend(members)
+
+    def file(self, index: int, options: int, choices: int) -> str:
+        depth = max(self.shape.depth, 1)
+        out = []
+
+        # Options go to every level, choices only inside menus
+        per_level = [options // depth + (1 if i < options % depth else 0) for i in range(depth)]
+        choice_level = [choices // depth + (1 if i < choices % depth else 0) for i in range(depth)]
+
+        for level in range(depth):
+            indent = "    " * level
+            out.append(f'{indent}menu "File {index} level {level}"')
+            if self.wants_depends():
+                out.append(f"{indent}    depends on {self.expr()}")
+
+            for _ in range(per_level[level]):
+                self.option(out, indent + "    ")
+            for _ in range(choice_level[level]):
+                self.choice(out, indent + "    ")
+            out.append(f'{indent}    comment "End of level {level}"')
+
+        for level in reversed(range(depth)):
+            out.append("    " * level + "endmenu")
+
+        return "\n".join(out) + "\n"
+
+# ---[ Functions ]--- #
+def generate_tree(directory: Path, shape: TreeShape) -> Path:
+    """Write the tree for `shape` under `directory` and return the root KConfig path."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    writer = _Writer(shape)
+    fanout = max(shape.fanout, 1)
+    plain = max(shape.options - shape.choices * shape.choice_size, 0)
+
+    root = ['mainmenu "Synthetic benchmark tree"', ""]
+
+    # A few root options, so the first file has symbols to depend on
+    for _ in range(min(plain, 4)):
+        writer.option(root, "")
+    plain -= min(plain, 4)
+
+    for i in range(fanout):
+        opts = plain // fanout + (1 if i < plain % fanout else 0)
+        chs = shape.choices // fanout + (1 if i < shape.choices % fanout else 0)
+
+        name = f"part{i}.kconfig"
+        (directory / name).write_text(writer.file(i, opts, chs), encoding="utf-8")
+        root.append(f'source "{name}"')
+
+    path = directory / "KConfig"
+    path.write_text("\n".join(root) + "\n", encoding="utf-8")
+    return path
+
+def add_shape_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = TreeShape()
+    for name, value in defaults.as_dict().items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+
+def shape_from_args(args: argparse.Namespace) -> TreeShape:
+    return TreeShape(**{name: getattr(args, name) for name in TreeShape().as_dict()})
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("directory", type=Path)
+    add_shape_arguments(parser)
+    args = parser.parse_args()
+
+    path = generate_tree(args.directory, shape_from_args(args))
+    print(path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#
+# Configuration bisection for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+Finds a minimal set of option changes from a good configuration to a bad
+one that still makes a test command fail, by delta debugging (ddmin) over
+the options whose values differ.
+
+Every candidate is the good configuration with some of the bad values
+applied and dependencies enforced, so it is always one the tree allows.
+Candidates are keyed by a fingerprint of every resolved value: subsets
+that enforcement turns into the same configuration are tested only once.
+The candidates of one ddmin step are independent, so they run together,
+up to `workers` at a time, each in its own build directory (see matrix.py
+for how the command is run).
+
+The command passes with exit status 0 and fails with any other, except
+125, which like `git bisect run` means it could not tell; a timeout counts
+the same way. Such candidates are neither kept nor ruled out.
+"""
+
+# ---[ Libraries ]--- #
+import hashlib
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+from mesonconfig import core, matrix
+from mesonconfig.kconfig import KConfig
+
+# ---[ Variables ]--- #
+PASS = "pass"
+FAIL = "fail"
+UNRESOLVED = "unresolved"
+
+SKIP_STATUS = 125
+
+# ---[ Classes ]--- #
+@dataclass
+class Probe:
+    changes: tuple                  # names that take the bad value
+    fingerprint: str
+    outcome: str
+    cached: bool = False
+    result: Optional[matrix.JobResult] = None
+
+
+@dataclass
+class BisectResult:
+    changes: List[str]              # the minimal failing difference
+    config: Path                    # its resolved configuration
+    difference: List[str]           # every option that differs
+    probes: List[Probe] = field(default_factory=list)
+
+    @property
+    def tested(self) -> int:
+        return sum(not p.cached for p in self.probes)
+
+
+class Bisector:
+    def __init__(self, kc: KConfig, good: str, bad: str, command: list[str], builddir: str,
+                 workers: int = 0, timeout: Optional[float] = None,
+                 on_probe: Optional[Callable[[Probe], None]] = None) -> None:
+        self.kc = kc
+        self.command = list(command)
+        self.builddir = Path(builddir).resolve()
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.on_probe = on_probe
+        self.version = core.get_version()
+
+        # Both ends resolved the same way: defaults, the file, enforcement
+        kc.merge_configs([good])
+        self.good = {name: opt.value for name, opt in kc._options_index.items()}
+        self.good_text = self._snapshot()
+        kc.merge_configs([bad])
+        self.bad = {name: opt.value for name, opt in kc._options_index.items()}
+        self.bad_text = self._snapshot()
+
+        self.difference = [name for name in kc._options_index if self.good_text[name] != self.bad_text[name]]
+        # fingerprint -> outcome
+        self.cache: dict[str, str] = {}
+        self.probes: list[Probe] = []
+
+    def _snapshot(self) -> dict[str, Optional[str]]:
+        kc = self.kc
+        return {name: kc._serialize_value(opt) for name, opt in kc._options_index.items()}
+
+    def _resolve(self, changes: Sequence[str]) -> str:
+        """Set `kc` to the candidate for `changes`; return its fingerprint."""
+        kc = self.kc
+        taken = set(changes)
+        for name, opt in kc._options_index.items():
+            kc._assign(opt, self.bad[name] if name in taken else self.good[name])
+        kc.enforce_dependencies()
+
+        digest = hashlib.sha256()
+        for name, value in self._snapshot().items():
+            digest.update(f"{name}={value}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _config_path(self, fingerprint: str) -> Path:
+        return self.builddir / "configs" / f"{fingerprint[:16]}.conf"
+
+    @staticmethod
+    def _outcome(result: matrix.JobResult) -> str:
+        if result.status == "passed":
+            return PASS
+        if result.status == "failed" and result.returncode != SKIP_STATUS:
+            return FAIL
+        return UNRESOLVED
+
+    def test(self, pool: matrix.JobPool, candidates: list[tuple]) -> list[str]:
+        """Outcome of each candidate; the uncached ones run in parallel."""
+        fingerprints = []
+        pending: dict[str, tuple] = {}
+
+        # The tree is not thread safe: resolve and write in this thread
+        for changes in candidates:
+            fp = self._resolve(changes)
+            fingerprints.append(fp)
+            if fp not in self.cache and fp not in pending:
+                self.kc.save_config(self._config_path(fp), tool_name="Mesonconfig",
+                                    tool_version=self.version, backup=False)
+                pending[fp] = changes
+
+        futures = {
+            fp: pool.submit(matrix.MatrixJob(fp[:16], self._config_path(fp), self.builddir / fp[:16]),
+                            self.command, self.timeout)
+            for fp in pending
+        }
+
+        for fp, changes in zip(fingerprints, candidates):
+            future = futures.pop(fp, None)
+            if future is not None:
+                result = future.result()
+                self.cache[fp] = self._outcome(result)
+                probe = Probe(changes, fp, self.cache[fp], result=result)
+            else:
+                probe = Probe(changes, fp, self.cache[fp], cached=True)
+            self.probes.append(probe)
+            if self.on_probe:
+                self.on_probe(probe)
+
+        return [self.cache[fp] for fp in fingerprints]
+
+    def run(self) -> BisectResult:
+        """Run ddmin; raises ValueError if GOOD does not pass or BAD does not fail."""
+        (self.builddir / "configs").mkdir(parents=True, exist_ok=True)
+        full = tuple(self.difference)
+
+        with matrix.JobPool(self.workers) as pool:
+            good, bad = self.test(pool, [(), full])
+            if good != PASS:
+                raise ValueError(f"the command does not pass on the good configuration ({good})")
+            if bad != FAIL:
+                raise ValueError(f"the command does not fail on the bad configuration ({bad})")
+
+            current = list(full)
+            n = 2
+            while len(current) >= 2:
+                chunks = _split(current, n)
+                reduced = self._first_failing(pool, chunks)
+                if reduced is not None:
+                    current, n = reduced, 2
+                    continue
+
+                if n > 2:
+                    complements = [[c for c in current if c not in drop] for drop in map(set, chunks)]
+                    reduced = self._first_failing(pool, complements)
+                    if reduced is not None:
+                        current, n = reduced, max(n - 1, 2)
+                        continue
+
+                if n >= len(current):
+                    break
+                n = min(2 * n, len(current))
+
+        fp = self._resolve(current)
+        minimal = self.builddir / "minimal.conf"
+        core.write_if_changed(minimal, self._config_path(fp).read_text(encoding="utf-8"))
+        return BisectResult(current, minimal, list(full), self.probes)
+
+    def _first_failing(self, pool: matrix.JobPool, subsets: list[list[str]]) -> Optional[list[str]]:
+        outcomes = self.test(pool, [tuple(s) for s in subsets])
+        for subset, outcome in zip(subsets, outcomes):
+            if outcome == FAIL:
+                return subset
+        return None
+
+# ---[ Functions ]--- #
+def _split(items: list[str], n: int) -> list[list[str]]:
+    """`items` in `n` contiguous chunks whose sizes differ by at most one."""
+    size, extra = divmod(len(items), n)
+    chunks, start = [], 0
+    for i in range(n):
+        end = start + size + (i < extra)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
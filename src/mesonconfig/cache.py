@@ -0,0 +1,192 @@
+#
+# On-disk cache of parsed KConfig trees
+# 2026, Remeny
+#
+
+"""
+A cache entry holds a validated KConfig tree, pickled, together with the
+signature (path, size, mtime, content hash) of the root file and every
+file it sources. An entry is only used if all of those files still match,
+and none of the optional sources that were missing has appeared since.
+
+Entries live in $XDG_CACHE_HOME/mesonconfig (or ~/.cache/mesonconfig) and
+the directory is kept under a size limit by evicting the least recently
+used entries.
+"""
+
+# ---[ Libraries ]--- #
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# ---[ Variables ]--- #
+# Bump whenever the pickled tree layout changes
+CACHE_FORMAT = 3
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+ENTRY_SUFFIX = ".pickle"
+
+# ---[ Classes ]--- #
+@dataclass(frozen=True)
+class FileSignature:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class TreeCache:
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        version: Optional[str] = None
+    ) -> None:
+        self.directory = Path(directory) if directory else get_cache_dir()
+        self.max_bytes = max_bytes
+        self.version = version if version is not None else _package_version()
+
+    def _entry_path(self, root: str) -> Path:
+        key = f"{CACHE_FORMAT}\0{self.version}\0{Path(root).resolve()}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{digest}{ENTRY_SUFFIX}"
+
+    def load(self, root: str) -> Optional[Any]:
+        """Return the cached state for `root`, or None if missing or stale."""
+        entry = self._entry_path(root)
+
+        try:
+            with open(entry, "rb") as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or written by an incompatible version
+            self._discard(entry)
+            return None
+
+        if payload.get("format") != CACHE_FORMAT or payload.get("version") != self.version:
+            return None
+
+        for sig in payload["files"]:
+            if not signature_matches(sig):
+                return None
+
+        if any(os.path.exists(p) for p in payload["missing"]):
+            return None
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        return payload["state"]
+
+    def store(self, root: str, sources: list[str], state: Any, missing: Iterable[str] = ()) -> None:
+        """Store `state` for `root`. Failures are ignored; caching is best effort."""
+        try:
+            payload = {
+                "format": CACHE_FORMAT,
+                "version": self.version,
+                "files": [file_signature(p) for p in sources],
+                "missing": list(missing),
+                "state": state,
+            }
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            entry = self._entry_path(root)
+
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, entry)
+            except BaseException:
+                self._discard(Path(tmp))
+                raise
+
+            self.evict()
+        except (OSError, pickle.PicklingError, RecursionError):
+            pass
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        entries = []
+        total = 0
+
+        for p in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, p))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, p in entries:
+            if total <= self.max_bytes:
+                break
+            self._discard(p)
+            total -= size
+
+    def clear(self) -> None:
+        for p in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            self._discard(p)
+
+    def _discard(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+# ---[ Functions ]--- #
+def get_cache_dir() -> Path:
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "mesonconfig"
+
+def _hash_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def file_signature(path: str) -> FileSignature:
+    resolved = str(Path(path).resolve())
+    st = os.stat(resolved)
+    return FileSignature(resolved, st.st_size, st.st_mtime_ns, _hash_file(resolved))
+
+def signature_matches(sig: FileSignature) -> bool:
+    """
+    Cheap stat check first; only hash the file when the size matches but
+    the mtime moved (e.g. the file was touched or rewritten unchanged).
+    """
+    try:
+        st = os.stat(sig.path)
+    except OSError:
+        return False
+
+    if st.st_size != sig.size:
+        return False
+
+    if st.st_mtime_ns == sig.mtime_ns:
+        return True
+
+    try:
+        return _hash_file(sig.path) == sig.sha256
+    except OSError:
+        return False
+
+def _package_version() -> str:
+    from mesonconfig import core
+
+    try:
+        return core.get_version()
+    except Exception:
+        return "unknown"
@@ -4,22 +4,27 @@
 #
 
 # ---[ Libraries ]--- #
-# For nice traceback
-from rich.traceback import install
-install(show_locals=False)
-
-from mesonconfig.tui import app as tui
+# Textual and Rich are imported in main(), only when the TUI runs, so that
+# headless use (--version, --build-meson-options, ...) starts quickly
 from mesonconfig.tui import config as tui_config
 from mesonconfig import kconfig
 from mesonconfig import core
+from mesonconfig.cache import TreeCache
 from pathlib import Path
 import shutil, argparse, configparser, sys, os
 
 # ---[ Functions ]--- #
 #  -- Build meson_options.txt --  #
-def build_meson_options(kconfig_file: kconfig.KConfig, output_path: str = "meson_options.txt") -> None:
+def build_meson_options(kconfig_file: kconfig.KConfig, output_path: str = "meson_options.txt",
+                        timestamp: bool = False) -> bool:
+    """
+    Write meson_options.txt for the tree. The file is left alone (mtime
+    included, so Meson does not reconfigure) if it would not change; the
+    header only carries the time if `timestamp` is set. Returns True if
+    the file was written.
+    """
     from datetime import datetime
-    from textwrap import dedent
+    from io import StringIO
 
     def meson_type(opt_type: str) -> str:
         return {
@@ -36,28 +41,29 @@ def build_meson_options(kconfig_file: kconfig.KConfig, output_path: str = "meson
         elif opt.opt_type == "int":
             return str(opt.default if opt.default is not None else 0)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(dedent(f"""\
-                #
-                # Automatically generated by Mesonconfig {core.get_version()}
-                # From {kconfig_file}
-                # Time: {datetime.now().isoformat()}
-                #
-                \n"""))
-
-        for name, opt in sorted(kconfig_file._options_index.items()):
-            # Skip options without prompt (safety)
-            desc = opt.prompt or name
-
-            # Use default if exists, else fallback
-            value = format_value(opt)
-
-            f.write(
-                f"option('{name}', "
-                f"type: '{meson_type(opt.opt_type)}', "
-                f"value: {value}, "
-                f"description: '{desc}')\n"
-            )
+    f = StringIO()
+    f.write("#\n")
+    f.write(f"# Automatically generated by Mesonconfig {core.get_version()}\n")
+    f.write(f"# From {kconfig_file.path}\n")
+    if timestamp:
+        f.write(f"# Time: {datetime.now().isoformat()}\n")
+    f.write("#\n\n")
+
+    for name, opt in sorted(kconfig_file._options_index.items()):
+        # Skip options without prompt (safety)
+        desc = opt.prompt or name
+
+        # Use default if exists, else fallback
+        value = format_value(opt)
+
+        f.write(
+            f"option('{name}', "
+            f"type: '{meson_type(opt.opt_type)}', "
+            f"value: {value}, "
+            f"description: '{desc}')\n"
+        )
+
+    return core.write_if_changed(output_path, f.getvalue())
 
 #  -- Custom help messages --  #
 def custom_help(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
@@ -170,10 +176,26 @@ def build_normalized_ini(cfg: configparser.ConfigParser) -> dict[str, dict[str,
 
     return result
 
-def get_explicit_args() -> set[str]:
+def load_settings(settings_path: str, no_global: bool = False) -> tuple[dict[str, dict[str, str]], Path | None]:
+    """Global and project INI settings merged (project wins), and the global file used."""
+    global_cfg = {}
+    global_path = None
+
+    if not no_global:
+        global_path = get_global_config_path()
+        if global_path:
+            global_cfg = build_normalized_ini(load_ini_settings(global_path))
+
+    local_cfg = build_normalized_ini(load_ini_settings(settings_path))
+
+    # Merge: local overrides global
+    return merge_ini_configs(global_cfg, local_cfg), global_path
+
+def get_explicit_args(argv: list[str] | None = None) -> set[str]:
     result: set[str] = set()
 
-    argv = sys.argv[1:]
+    if argv is None:
+        argv = sys.argv[1:]
     i = 0
 
     while i < len(argv):
@@ -240,6 +262,11 @@ def resolve(norm_cfg, args, explicit_args, section: str, name: str, default):
 
 # ---[ Entry point ]--- #
 def main():
+    # Headless subcommands (set, get, ...) have a parser of their own
+    from mesonconfig import headless
+    if len(sys.argv) > 1 and sys.argv[1] in headless.COMMANDS:
+        return headless.main(sys.argv[1:])
+
     # Argument checking.
     parser = argparse.ArgumentParser(
         prog="mesonconfig",
@@ -269,6 +296,10 @@ def main():
         "--no-global-config", action="store_true", default=False,
         help="Do not load user-level configuration (~/.config/mesonconfig/config.ini)."
     )
+    io.add_argument(
+        "--timestamp", action="store_true", default=False,
+        help="Write the generation time into output file headers (makes every save a change)."
+    )
 
     # --- Appearance options --- #
     ui = parser.add_argument_group("Appearance")
@@ -299,6 +330,18 @@ def main():
         "--disable-minimum-size-check", action="store_true", default=False,
         help="Disables the terminal minimum size check."
     )
+    runtime.add_argument(
+        "--no-cache", action="store_true", default=False,
+        help="Always parse the KConfig file; do not read or write the parse cache."
+    )
+    runtime.add_argument(
+        "--jobs", metavar="<n>", default=1, type=int,
+        help="Parse sourced KConfig files in <n> worker processes (0 = one per CPU)."
+    )
+    runtime.add_argument(
+        "--virtual-list", action="store_true", default=False,
+        help="Draw only the menu rows on screen; for menus with thousands of entries."
+    )
 
     # --- Debug --- #
     debug = parser.add_argument_group("Debug")
@@ -355,18 +398,7 @@ def main():
         return
 
     # --- Config builder --- #
-    global_cfg = {}
-    global_path = None
-
-    if not args.no_global_config:
-        global_path = get_global_config_path()
-        if global_path:
-            global_cfg = build_normalized_ini(load_ini_settings(global_path))
-
-    local_cfg = build_normalized_ini(load_ini_settings(args.mesonconfig_settings))
-
-    # Merge: local overrides global
-    cfg = merge_ini_configs(global_cfg, local_cfg)
+    cfg, global_path = load_settings(args.mesonconfig_settings, args.no_global_config)
 
     # Validate after merge
     validate_ini_keys(cfg, args)
@@ -385,6 +417,9 @@ def main():
     # Resolve critical fields early
     resolved_kconfig = resolve(cfg, args, explicit_args, "Configuration", "kconfig_file", args.kconfig_file)
     resolved_output = resolve(cfg, args, explicit_args, "Configuration", "output_file", args.output_file)
+    resolved_no_cache = resolve(cfg, args, explicit_args, "Advanced", "no_cache", args.no_cache)
+    resolved_jobs = resolve(cfg, args, explicit_args, "Advanced", "jobs", args.jobs)
+    resolved_timestamp = resolve(cfg, args, explicit_args, "Configuration", "timestamp", args.timestamp)
 
     # --- Conditions before TUI --- #
     # If positional was provided and --kconfig-file was not explicitly used
@@ -401,10 +436,15 @@ def main():
     elif args.build_meson_options:
         print(f"\nBuilding file 'meson_options.txt' using configuration from file '{resolved_kconfig}'...")
 
-        kc = kconfig.KConfig(resolved_kconfig)
-        build_meson_options(kc, "meson_options.txt")
-
-        print("Done.\n")
+        kc = kconfig.KConfig(
+            resolved_kconfig,
+            cache=None if resolved_no_cache else TreeCache(),
+            jobs=resolved_jobs
+        )
+        if build_meson_options(kc, "meson_options.txt", timestamp=resolved_timestamp):
+            print("Done.\n")
+        else:
+            print("Already up to date.\n")
         return 0
     
 
@@ -424,6 +464,7 @@ def main():
         # --- Configuration ---
         kconfig_file=resolved_kconfig,
         output_file=resolved_output,
+        timestamp=resolved_timestamp,
 
         # --- Appearance ---
         background=resolve(cfg, args, explicit_args, "Appearance", "background", args.background).lower(),
@@ -434,6 +475,9 @@ def main():
         # --- Advanced ---
         disable_autoconfig=resolve(cfg, args, explicit_args, "Advanced", "disable_autoconfig", args.disable_autoconfig),
         disable_minimum_size_check=resolve(cfg, args, explicit_args, "Advanced", "disable_minimum_size_check", args.disable_minimum_size_check),
+        no_cache=resolved_no_cache,
+        jobs=resolved_jobs,
+        virtual_list=resolve(cfg, args, explicit_args, "Advanced", "virtual_list", args.virtual_list),
 
         # --- Debug ---
         verbose=resolve(cfg, args, explicit_args, "Debug", "verbose", args.verbose),
@@ -442,8 +486,14 @@ def main():
         debug_timer=resolve(cfg, args, explicit_args, "Debug", "debug_timer", args.debug_timer),
     )
 
+    # For nice traceback
+    from rich.traceback import install
+    install(show_locals=False)
+
+    from mesonconfig.tui.app import MCfgApp
+
     # Run TUI.
-    tui.MCfgApp(config=config).run()
+    MCfgApp(config=config).run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,31 +4,273 @@
 #
 
 # ---[ Libraries ]--- #
+import atexit
+import json
 import logging
-from importlib.metadata import version as pkg_version
-from datetime import datetime
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 
 # ---[ Variables]--- #
 # Minimum screen resolution
 min_cols: int = 80
 min_rows: int = 20
 
+# Debug log: rotated past LOG_MAX_BYTES, keeping LOG_BACKUPS old files
+# (log.1 is the newest). The writer flushes at most every LOG_FLUSH_INTERVAL
+# seconds, or once LOG_BATCH records are waiting.
+LOG_MAX_BYTES: int = 1024 * 1024
+LOG_BACKUPS: int = 3
+LOG_FLUSH_INTERVAL: float = 0.25
+LOG_BATCH: int = 256
+
+logger = logging.getLogger("mesonconfig")
+
 # ---[ Classes ]--- #
+class _LogWriter(threading.Thread):
+    """Drains queued log lines into a JSONL file, a batch per flush."""
+
+    _STOP = object()
+
+    def __init__(self, path: Path, max_bytes: int, backups: int) -> None:
+        super().__init__(name="mesonconfig-log", daemon=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._file = None
+        self._size = 0
+
+    def put(self, line: str) -> None:
+        self.queue.put(line)
+
+    def stop(self) -> None:
+        self.queue.put(self._STOP)
+        self.join()
+
+    def run(self) -> None:
+        get = self.queue.get
+        while True:
+            item = get()
+            batch = []
+            stop = False
+
+            # Gather whatever arrives within the flush interval
+            deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+            while True:
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= LOG_BATCH or remaining <= 0:
+                    break
+                try:
+                    item = get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+            except OSError:
+                # Logging must never take the app down
+                pass
+
+            if stop:
+                if self._file:
+                    self._file.close()
+                return
+
+    def _write(self, lines: list) -> None:
+        if not lines:
+            return
+        if self._file is None:
+            self._open()
+
+        for line in lines:
+            data = line.encode("utf-8")
+            if self._size and self._size + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._size += len(data)
+        self._file.flush()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backups > 0:
+            for i in range(self.backups - 1, 0, -1):
+                older = self.path.with_name(f"{self.path.name}.{i}")
+                if older.exists():
+                    older.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+        self._open()
+
+
+class _BackgroundHandler(logging.Handler):
+    """
+    Hands records to a _LogWriter as JSON lines. Only the message is
+    formatted on the caller's thread; no file I/O happens there.
+    """
+
+    def __init__(self, writer: _LogWriter) -> None:
+        super().__init__(logging.DEBUG)
+        self.writer = writer
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = json.dumps({
+                "mono": time.monotonic(),
+                "time": record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "msg": record.getMessage(),
+            }, ensure_ascii=False)
+        except Exception:
+            self.handleError(record)
+            return
+        self.writer.put(line + "\n")
+
+    def close(self) -> None:
+        self.writer.stop()
+        super().close()
 
 # ---[ Logging ]--- #
+_handler: Optional[_BackgroundHandler] = None
+_handler_path: Optional[Path] = None
+_setup_lock = threading.Lock()
+
+def setup_logging(log_file: str, max_bytes: Optional[int] = None, backups: Optional[int] = None) -> logging.Logger:
+    """
+    Send the "mesonconfig" logger to `log_file` through a background
+    writer thread. Calling it again with another file moves the log there.
+    Pending records are flushed on exit.
+    """
+    global _handler, _handler_path
+
+    path = Path(log_file)
+    with _setup_lock:
+        if _handler is not None and _handler_path == path:
+            return logger
+
+        _close_handler()
+
+        writer = _LogWriter(
+            path,
+            LOG_MAX_BYTES if max_bytes is None else max_bytes,
+            LOG_BACKUPS if backups is None else backups,
+        )
+        writer.start()
+        _handler = _BackgroundHandler(writer)
+        _handler_path = path
+
+        logger.addHandler(_handler)
+        logger.setLevel(logging.DEBUG)
+        # Never fall through to stderr, which the TUI owns
+        logger.propagate = False
+
+    return logger
+
+def shutdown_logging() -> None:
+    """Flush and close the debug log. Runs automatically at exit."""
+    with _setup_lock:
+        _close_handler()
+
+def _close_handler() -> None:
+    global _handler, _handler_path
+    if _handler is None:
+        return
+    logger.removeHandler(_handler)
+    _handler.close()
+    _handler = None
+    _handler_path = None
+
+atexit.register(shutdown_logging)
+
 def log_debug(msg: str, log_file: str) -> None:
     """
-    Log a debug message to a file in the format:
-    [YYYY-MM-DD HH:MM:SS] <msg>
+    Log a debug message to `log_file` as one JSON line:
+    {"mono": ..., "time": ..., "level": "DEBUG", "logger": "mesonconfig", "msg": ...}
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    line = f"[{timestamp}] {msg}\n"
+    if _handler is None or _handler_path != Path(log_file):
+        setup_logging(log_file)
+    logger.debug(msg)
+
+# ---[ Files ]--- #
+def write_if_changed(path: str, content: str, backup: Optional[str] = None) -> bool:
+    """
+    Write `content` to `path` unless the file already holds exactly that,
+    so unchanged outputs keep their mtime. The new file goes to a temporary
+    file next to it and is moved into place, so readers never see it half
+    written. If `backup` is given, the previous file is copied there first.
+    Returns True if the file was written.
+    """
+    target = Path(path)
+    data = content.encode("utf-8")
+
+    try:
+        st = target.stat()
+    except FileNotFoundError:
+        st = None
+
+    # Only read the old file when the size says it could be equal
+    if st is not None and st.st_size == len(data) and target.read_bytes() == data:
+        return False
+
+    if st is not None and backup is not None:
+        shutil.copyfile(target, backup)
+
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp files are private; give it the mode the file would have had
+        os.chmod(tmp, (st.st_mode & 0o7777) if st is not None else _default_mode())
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+    return True
+
+def _default_mode() -> int:
+    # What open() would create, i.e. 0o666 minus the umask
+    umask = _proc_umask()
+    return 0o666 & ~(umask if umask is not None else _IMPORT_UMASK)
+
+def _proc_umask() -> Optional[int]:
+    # Linux reports it without changing it; os.umask() can only swap it,
+    # which races with threads creating files meanwhile
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def _swap_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
 
-    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(line)
+# Elsewhere, read it once at import, before any worker thread exists
+_IMPORT_UMASK = 0o022 if _proc_umask() is not None else _swap_umask()
 
 # ---[ Version ]--- #
 def get_version() -> str:
+    # importlib.metadata is slow to import; only the paths that print the version need it
+    from importlib.metadata import version as pkg_version
     return pkg_version("mesonconfig")
@@ -0,0 +1,181 @@
+#
+# Compiled KConfig expressions for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+Grammar (used by 'depends on' and 'default ... if'):
+
+expr ::= or
+or   ::= and (('||' | 'or') and)*
+and  ::= not (('&&' | 'and') not)*
+not  ::= '!' not | atom
+atom ::= '(' expr ')' | NAME
+
+Expressions are compiled once into a flat postfix program, which is then
+evaluated with an explicit stack (no recursion, so long chains are fine).
+"""
+
+# ---[ Libraries ]--- #
+import re
+from collections import OrderedDict
+from typing import Callable, FrozenSet, NamedTuple, Tuple
+
+# ---[ Variables ]--- #
+TOKEN_PATTERN = re.compile(r'(!|\(|\)|\w+|&&|\|\|)')
+
+# Operator opcodes. Anything else in a program is a symbol name.
+OP_NOT = 0
+OP_AND = 1
+OP_OR = 2
+
+_BINARY = {"&&": OP_AND, "and": OP_AND, "||": OP_OR, "or": OP_OR}
+_PRECEDENCE = {OP_OR: 1, OP_AND: 2, OP_NOT: 3}
+
+DEFAULT_CACHE_SIZE = 1024
+
+# ---[ Classes ]--- #
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CompiledExpr:
+    """A parsed expression, ready to evaluate against symbol values."""
+
+    __slots__ = ("text", "program", "symbols")
+
+    def __init__(self, text: str, program: Tuple, symbols: FrozenSet[str]) -> None:
+        self.text = text
+        self.program = program
+        self.symbols = symbols
+
+    def evaluate(self, resolve: Callable[[str], bool]) -> bool:
+        program = self.program
+
+        # Most expressions are a single symbol
+        if len(program) == 1:
+            return resolve(program[0])
+
+        stack: list[bool] = []
+        for op in program:
+            if op == OP_NOT:
+                stack[-1] = not stack[-1]
+            elif op == OP_AND:
+                rhs = stack.pop()
+                stack[-1] = stack[-1] and rhs
+            elif op == OP_OR:
+                rhs = stack.pop()
+                stack[-1] = stack[-1] or rhs
+            else:
+                stack.append(resolve(op))
+
+        return stack[-1]
+
+    def __repr__(self) -> str:
+        return f"CompiledExpr({self.text!r})"
+
+
+class ExprCache:
+    """
+    Bounded LRU of compiled expressions, keyed by expression text.
+
+    Safe to share between threads without a lock: each OrderedDict call is
+    atomic, and an entry evicted by another thread in between is harmless.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CompiledExpr]" = OrderedDict()
+
+    def get(self, text: str) -> CompiledExpr:
+        entries = self._entries
+
+        compiled = entries.get(text)
+        if compiled is not None:
+            self.hits += 1
+            try:
+                entries.move_to_end(text)
+            except KeyError:
+                pass
+            return compiled
+
+        self.misses += 1
+        compiled = compile_expr(text)
+        entries[text] = compiled
+
+        if len(entries) > self.maxsize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                pass
+
+        return compiled
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+# ---[ Functions ]--- #
+def compile_expr(text: str) -> CompiledExpr:
+    """
+    Compile an expression into postfix form (shunting-yard).
+    Raises ValueError on malformed input.
+    """
+    tokens = TOKEN_PATTERN.findall(text)
+    if not tokens:
+        raise ValueError(f"Empty expression: '{text}'")
+
+    output: list = []
+    ops: list = []          # operator stack; "(" marks a group
+    symbols: set[str] = set()
+    expect_operand = True
+
+    for tok in tokens:
+        if expect_operand:
+            if tok == "!":
+                ops.append(OP_NOT)
+            elif tok == "(":
+                ops.append("(")
+            elif tok in _BINARY or tok == ")":
+                raise ValueError(f"Unexpected token '{tok}' in '{text}'")
+            else:
+                output.append(tok)
+                symbols.add(tok)
+                expect_operand = False
+            continue
+
+        if tok in _BINARY:
+            op = _BINARY[tok]
+            # Both binary operators are left-associative
+            while ops and ops[-1] != "(" and _PRECEDENCE[ops[-1]] >= _PRECEDENCE[op]:
+                output.append(ops.pop())
+            ops.append(op)
+            expect_operand = True
+        elif tok == ")":
+            while ops and ops[-1] != "(":
+                output.append(ops.pop())
+            if not ops:
+                raise ValueError(f"Unmatched ')' in '{text}'")
+            ops.pop()
+        else:
+            raise ValueError(f"Unexpected token '{tok}' in '{text}'")
+
+    if expect_operand:
+        raise ValueError(f"Unexpected end of expression '{text}'")
+
+    while ops:
+        op = ops.pop()
+        if op == "(":
+            raise ValueError(f"Unmatched '(' in '{text}'")
+        output.append(op)
+
+    return CompiledExpr(text, tuple(output), frozenset(symbols))
@@ -0,0 +1,400 @@
+#
+# Headless subcommands for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+Scriptable access to a configuration, without the TUI:
+
+    mesonconfig set NAME=VALUE ...   assign options, enforce dependencies once, save
+    mesonconfig get NAME             print the value of an option
+    mesonconfig list [--visible]     print NAME=VALUE for every option
+    mesonconfig resolve              load, enforce dependencies and save (like olddefconfig)
+    mesonconfig merge FRAGMENT ...   defaults, then each fragment in order; save
+    mesonconfig variants OUTDIR      allyes/allno/alldef/random configs (see variants.py)
+    mesonconfig matrix CONFIG ... -- COMMAND ...
+                                     run COMMAND once per config (see matrix.py)
+    mesonconfig bisect GOOD BAD -- COMMAND ...
+                                     fewest changes from GOOD to BAD that fail (see bisection.py)
+
+Except for merge, variants, matrix and bisect, the existing output file is loaded first.
+Every command takes the same --kconfig-file, --output-file, --no-cache and --jobs
+as the TUI, and honours the same .mesonconfig.ini and global settings.
+"""
+
+# ---[ Libraries ]--- #
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+from mesonconfig import cli, core
+from mesonconfig.cache import TreeCache
+from mesonconfig.kconfig import KConfig, KOption, MergeReport
+
+# ---[ Variables ]--- #
+COMMANDS = ("set", "get", "list", "resolve", "merge", "variants", "matrix", "bisect")
+
+# Commands that take a command line to run after "--"
+RUNNERS = ("matrix", "bisect")
+
+# ---[ Functions ]--- #
+def _error(text: str) -> int:
+    print(f"mesonconfig: error: {text}", file=sys.stderr)
+    return 1
+
+def _format(kc: KConfig, opt: KOption) -> str:
+    # Same spelling as in the saved file, without the quotes
+    value = kc._serialize_value(opt)
+    return "" if value is None else value
+
+def _kinds(text: str) -> list[str]:
+    return [k.strip() for k in text.split(",") if k.strip()]
+
+def _split_command(argv: list[str]) -> tuple[list[str], list[str]]:
+    """For RUNNERS, cut `argv` at the first "--" into our arguments and the command."""
+    if argv and argv[0] in RUNNERS and "--" in argv:
+        cut = argv.index("--")
+        return argv[:cut], argv[cut + 1:]
+    return argv, []
+
+def _common_options() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--kconfig-file", metavar="<file>", default="KConfig",
+        help="Path to the KConfig file to load."
+    )
+    common.add_argument(
+        "--output-file", metavar="<file>", default="local.conf",
+        help="Configuration file to read and write."
+    )
+    common.add_argument(
+        "--mesonconfig-settings", metavar="<file>", default=".mesonconfig.ini",
+        help="Load Mesonconfig settings from this file."
+    )
+    common.add_argument(
+        "--no-global-config", action="store_true", default=False,
+        help="Do not load user-level configuration."
+    )
+    common.add_argument(
+        "--no-cache", action="store_true", default=False,
+        help="Always parse the KConfig file; do not read or write the parse cache."
+    )
+    common.add_argument(
+        "--jobs", metavar="<n>", default=1, type=int,
+        help="Parse sourced KConfig files in <n> worker processes (0 = one per CPU)."
+    )
+    common.add_argument(
+        "--timestamp", action="store_true", default=False,
+        help="Write the generation time into the saved file's header."
+    )
+    return common
+
+def build_parser() -> argparse.ArgumentParser:
+    common = _common_options()
+    parser = argparse.ArgumentParser(
+        prog="mesonconfig",
+        description="Headless configuration commands"
+    )
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    cmd = commands.add_parser("set", parents=[common], help="Assign options and save.")
+    cmd.add_argument("assignments", nargs="+", metavar="NAME=VALUE")
+
+    cmd = commands.add_parser("get", parents=[common], help="Print the value of an option.")
+    cmd.add_argument("name", metavar="NAME")
+
+    cmd = commands.add_parser("list", parents=[common], help="Print NAME=VALUE for every option.")
+    cmd.add_argument("--visible", action="store_true", default=False,
+                     help="Only options that would show in the menus.")
+
+    commands.add_parser("resolve", parents=[common],
+                        help="Enforce dependencies on the saved configuration and save it.")
+
+    cmd = commands.add_parser("merge", parents=[common],
+                              help="Merge config fragments over the defaults and save.")
+    cmd.add_argument("fragments", nargs="+", metavar="FRAGMENT")
+    cmd.add_argument("--provenance", action="store_true", default=False,
+                     help="Print NAME=VALUE and the file:line that set it, for every option.")
+
+    cmd = commands.add_parser("variants", parents=[common],
+                              help="Generate allyes/allno/alldef/random configurations into a directory.")
+    cmd.add_argument("directory", metavar="OUTDIR")
+    cmd.add_argument("--kinds", metavar="<kind,...>", default="allyesconfig,allnoconfig,alldefconfig",
+                     help="Comma separated: allyesconfig, allnoconfig, alldefconfig.")
+    cmd.add_argument("--randconfig", metavar="<n>", type=int, default=0,
+                     help="Also generate <n> random configurations.")
+    cmd.add_argument("--seed", metavar="<n>", type=int, default=0,
+                     help="Seed for the random configurations; the same seed gives the same files.")
+    cmd.add_argument("--workers", metavar="<n>", type=int, default=0,
+                     help="Worker processes (0 = one per CPU).")
+
+    cmd = commands.add_parser("matrix", parents=[common],
+                              usage="mesonconfig matrix [options] [CONFIG ...] -- COMMAND ...",
+                              help="Run a command once per configuration, each in its own build directory.")
+    cmd.add_argument("configs", nargs="*", metavar="CONFIG")
+    cmd.add_argument("--kinds", metavar="<kind,...>", default="",
+                     help="Also generate these variants (see 'variants') and run them.")
+    cmd.add_argument("--randconfig", metavar="<n>", type=int, default=0,
+                     help="Also generate and run <n> random configurations.")
+    cmd.add_argument("--seed", metavar="<n>", type=int, default=0,
+                     help="Seed for the random configurations.")
+    cmd.add_argument("--builddir", metavar="<dir>", default="matrix",
+                     help="Each configuration builds in <dir>/<name>.")
+    cmd.add_argument("--workers", metavar="<n>", type=int, default=0,
+                     help="Configurations to run at once (0 = one per CPU).")
+    cmd.add_argument("--timeout", metavar="<seconds>", type=float, default=None,
+                     help="Kill a run that takes longer than this.")
+    cmd.add_argument("--json", metavar="<file>", default=None,
+                     help="Write the summary here (default <dir>/matrix.json).")
+    cmd.add_argument("--junit", metavar="<file>", default=None,
+                     help="Also write a JUnit XML report.")
+    cmd.add_argument("--tail", metavar="<n>", type=int, default=20,
+                     help="Lines of each log to keep in the reports.")
+
+    cmd = commands.add_parser("bisect", parents=[common],
+                              usage="mesonconfig bisect [options] GOOD BAD -- COMMAND ...",
+                              help="Find the fewest option changes from GOOD to BAD that make a command fail.")
+    cmd.add_argument("good", metavar="GOOD")
+    cmd.add_argument("bad", metavar="BAD")
+    cmd.add_argument("--builddir", metavar="<dir>", default="bisect",
+                     help="Candidate configurations and their build directories go in <dir>.")
+    cmd.add_argument("--workers", metavar="<n>", type=int, default=0,
+                     help="Candidates to test at once (0 = one per CPU).")
+    cmd.add_argument("--timeout", metavar="<seconds>", type=float, default=None,
+                     help="Count a run that takes longer than this as undecided.")
+    return parser
+
+def _resolve_settings(args: argparse.Namespace, argv: list[str]) -> None:
+    """Fill in settings from the INI files where no flag was given."""
+    cfg, _ = cli.load_settings(args.mesonconfig_settings, args.no_global_config)
+    explicit = cli.get_explicit_args(argv)
+
+    args.kconfig_file = cli.resolve(cfg, args, explicit, "Configuration", "kconfig_file", args.kconfig_file)
+    args.output_file = cli.resolve(cfg, args, explicit, "Configuration", "output_file", args.output_file)
+    args.timestamp = cli.resolve(cfg, args, explicit, "Configuration", "timestamp", args.timestamp)
+    args.no_cache = cli.resolve(cfg, args, explicit, "Advanced", "no_cache", args.no_cache)
+    args.jobs = cli.resolve(cfg, args, explicit, "Advanced", "jobs", args.jobs)
+
+def open_config(args: argparse.Namespace, load: bool = True) -> KConfig:
+    """Parse the tree and load the output file, if there is one and `load` is set."""
+    kc = KConfig(
+        args.kconfig_file,
+        cache=None if args.no_cache else TreeCache(),
+        jobs=args.jobs
+    )
+    if load and Path(args.output_file).is_file():
+        kc.load_config(args.output_file)
+    return kc
+
+def _save(kc: KConfig, args: argparse.Namespace) -> bool:
+    # save_config enforces dependencies before it writes
+    return kc.save_config(
+        args.output_file,
+        tool_name="Mesonconfig",
+        tool_version=core.get_version(),
+        timestamp=args.timestamp
+    )
+
+#  -- Commands --  #
+def cmd_set(kc: KConfig, args: argparse.Namespace) -> int:
+    requested: list[tuple[KOption, str]] = []
+
+    for item in args.assignments:
+        name, sep, raw = item.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            return _error(f"expected NAME=VALUE, got '{item}'")
+
+        opt = kc.find_option(name)
+        if opt is None:
+            return _error(f"unknown option '{name}'")
+
+        try:
+            kc.set_option(name, raw)
+        except ValueError:
+            return _error(f"invalid {opt.opt_type} value for {name}: '{raw}'")
+        requested.append((opt, _format(kc, opt)))
+
+    # One enforcement pass for the whole batch
+    _save(kc, args)
+
+    for opt, wanted in requested:
+        got = _format(kc, opt)
+        if got != wanted:
+            print(f"mesonconfig: warning: {opt.name} is {got or 'unset'}, not {wanted}: "
+                  f"its dependencies are not met", file=sys.stderr)
+    return 0
+
+def cmd_get(kc: KConfig, args: argparse.Namespace) -> int:
+    opt = kc.find_option(args.name)
+    if opt is None:
+        return _error(f"unknown option '{args.name}'")
+
+    kc.enforce_dependencies()
+    print(_format(kc, opt))
+    return 0
+
+def cmd_list(kc: KConfig, args: argparse.Namespace) -> int:
+    kc.enforce_dependencies()
+
+    lines = [
+        f"{name}={_format(kc, opt)}"
+        for name, opt in kc._options_index.items()
+        if not args.visible or kc.is_visible(opt)
+    ]
+    if lines:
+        print("\n".join(lines))
+    return 0
+
+def cmd_resolve(kc: KConfig, args: argparse.Namespace) -> int:
+    _save(kc, args)
+    return 0
+
+def print_merge_report(report: MergeReport, file=None) -> None:
+    """Overridden and ignored assignments, one per line (to stderr by default)."""
+    file = file or sys.stderr
+    for earlier, later in report.overridden:
+        print(f"{later.location}: {later.name}={later.raw} overrides {earlier.location}", file=file)
+    for a, reason in report.ignored:
+        print(f"{a.location}: {a.name}={a.raw} ignored: {reason}", file=file)
+
+def cmd_merge(kc: KConfig, args: argparse.Namespace) -> int:
+    for path in args.fragments:
+        if not Path(path).is_file():
+            return _error(f"the file '{path}' does not exist")
+
+    report = kc.merge_configs(args.fragments)
+    _save(kc, args)
+
+    print_merge_report(report)
+    if args.provenance:
+        for name, a in report.provenance.items():
+            where = a.location if a.origin == "file" else f"{a.origin}, {a.location}"
+            print(f"{name}={_format(kc, kc.find_option(name))}  # {where}")
+    return 0
+
+def cmd_variants(kc: KConfig, args: argparse.Namespace) -> int:
+    from mesonconfig import variants
+
+    try:
+        plan = variants.plan_variants(_kinds(args.kinds), args.randconfig, args.seed)
+    except ValueError as e:
+        return _error(str(e))
+    if not plan:
+        return _error("nothing to generate")
+
+    report = variants.generate_variants(kc, plan, args.directory, jobs=args.workers)
+    print(f"{len(report.files)} configs in {report.elapsed:.2f}s "
+          f"({report.configs_per_second:.1f} configs/s), {report.written} changed, "
+          f"in {report.directory}")
+    return 0
+
+def _matrix_generates(args: argparse.Namespace) -> bool:
+    return bool(_kinds(args.kinds) or args.randconfig)
+
+def cmd_matrix(kc: Optional[KConfig], args: argparse.Namespace) -> int:
+    from mesonconfig import matrix, variants
+
+    if not args.run:
+        return _error("no command to run; give it after --")
+
+    configs = list(args.configs)
+    for path in configs:
+        if not Path(path).is_file():
+            return _error(f"the file '{path}' does not exist")
+
+    if kc is not None:
+        try:
+            plan = variants.plan_variants(_kinds(args.kinds), args.randconfig, args.seed)
+        except ValueError as e:
+            return _error(str(e))
+        generated = variants.generate_variants(kc, plan, Path(args.builddir) / "_variants", jobs=args.workers)
+        configs.extend(str(p) for p in generated.files)
+
+    if not configs:
+        return _error("no configurations to run")
+
+    def show(r: "matrix.JobResult") -> None:
+        detail = f" (exit {r.returncode})" if r.status == "failed" else ""
+        print(f"{r.status.upper():<7} {r.name} {r.duration:.1f}s{detail}", flush=True)
+
+    jobs = matrix.plan_jobs(configs, args.builddir)
+    report = matrix.run_matrix(jobs, args.run, args.builddir, workers=args.workers,
+                               timeout=args.timeout, tail_lines=args.tail, on_result=show)
+
+    matrix.write_json(report, args.json or str(Path(args.builddir) / "matrix.json"))
+    if args.junit:
+        matrix.write_junit(report, args.junit)
+
+    print(f"{len(report.results) - len(report.failed)} passed, {len(report.failed)} failed "
+          f"in {report.elapsed:.1f}s with {report.workers} worker{'s' if report.workers != 1 else ''}")
+    return 1 if report.failed else 0
+
+def cmd_bisect(kc: KConfig, args: argparse.Namespace) -> int:
+    from mesonconfig import bisection
+
+    if not args.run:
+        return _error("no command to run; give it after --")
+    for path in (args.good, args.bad):
+        if not Path(path).is_file():
+            return _error(f"the file '{path}' does not exist")
+
+    def show(p: "bisection.Probe") -> None:
+        note = " (cached)" if p.cached else ""
+        print(f"{p.outcome.upper():<10} {len(p.changes)} change(s)  {p.fingerprint[:16]}{note}", flush=True)
+
+    bisector = bisection.Bisector(kc, args.good, args.bad, args.run, args.builddir,
+                                  workers=args.workers, timeout=args.timeout, on_probe=show)
+    if not bisector.difference:
+        return _error("the two configurations resolve to the same values")
+
+    try:
+        result = bisector.run()
+    except ValueError as e:
+        return _error(str(e))
+
+    print(f"{len(result.changes)} of {len(result.difference)} changes make the command fail "
+          f"({result.tested} configurations tested, {len(result.probes) - result.tested} cached):")
+    for name in result.changes:
+        print(f"  {name}: {bisector.good_text[name] or 'unset'} -> {bisector.bad_text[name] or 'unset'}")
+    print(f"Configuration: {result.config}")
+    return 0
+
+_HANDLERS = {
+    "set": cmd_set,
+    "get": cmd_get,
+    "list": cmd_list,
+    "resolve": cmd_resolve,
+    "merge": cmd_merge,
+    "variants": cmd_variants,
+    "matrix": cmd_matrix,
+    "bisect": cmd_bisect,
+}
+
+def main(argv: Optional[list[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    argv, run = _split_command(argv)
+    args = build_parser().parse_args(argv)
+    args.run = run
+    _resolve_settings(args, argv)
+
+    # matrix only needs the tree to generate configurations
+    kc = None
+    if args.command != "matrix" or _matrix_generates(args):
+        if not Path(args.kconfig_file).is_file():
+            return _error(f"the file '{args.kconfig_file}' does not exist")
+
+        try:
+            kc = open_config(args, load=args.command not in ("merge", "variants", "matrix", "bisect"))
+        except KeyError as e:
+            return _error(f"{args.output_file}: unknown option {e.args[0]}")
+        except (OSError, ValueError, SyntaxError) as e:
+            return _error(str(e))
+
+    try:
+        return _HANDLERS[args.command](kc, args)
+    except OSError as e:
+        return _error(str(e))
@@ -11,17 +11,28 @@ menu     ::= 'menu' STRING entries 'endmenu'
 choice   ::= 'choice' entries 'endchoice'
 entries  ::= (menu | choice | config | comment)*
 config   ::= 'config' NAME type [default] [depends] [help]
-source   ::= 'source' STRING
+source   ::= ('source' | 'rsource' | 'osource' | 'orsource') STRING
 """
 
 # ---[ Libraries ]--- #
+import heapq
+import os
 from dataclasses import dataclass, field
-from typing import List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Iterator, List, Literal, Optional, Tuple, Union
 from enum import Enum, auto
 from pathlib import Path
 
-# ---[ Prefixes ]--- #
-TYPE_PREFIXES = ("bool ", "string ", "int ")
+from mesonconfig.core import write_if_changed
+from mesonconfig.expr import CacheInfo, ExprCache
+from mesonconfig.lexer import tokenize
+
+if TYPE_CHECKING:
+    from mesonconfig.cache import TreeCache
+
+# ---[ Variables ]--- #
+SOURCE_KEYWORDS = frozenset(("source", "osource", "rsource", "orsource"))
+# Missing files are skipped instead of being an error
+OPTIONAL_SOURCE_KEYWORDS = frozenset(("osource", "orsource"))
 
 # ---[ Classes ]--- #
 class ParseContext(Enum):
@@ -50,6 +61,10 @@ class KOption(KEntry):
     filename: Optional[str] = None
     lineno: Optional[int] = None
 
+    # Filled in by KConfig._link_tree()
+    parent: Optional[KEntry] = field(default=None, repr=False, compare=False)
+    parent_depends: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+
 
 @dataclass(repr=False)
 class KMenu(KEntry):
@@ -57,6 +72,9 @@ class KMenu(KEntry):
     depends_on: Optional[str] = None
     entries: List[KEntry] = field(default_factory=list)
 
+    parent: Optional[KEntry] = field(default=None, compare=False)
+    parent_depends: Tuple[str, ...] = field(default=(), compare=False)
+
 
 @dataclass(repr=False)
 class KChoice(KEntry):
@@ -64,287 +82,764 @@ class KChoice(KEntry):
     depends_on: Optional[str] = None
     entries: List[KEntry] = field(default_factory=list)
 
+    parent: Optional[KEntry] = field(default=None, compare=False)
+    parent_depends: Tuple[str, ...] = field(default=(), compare=False)
+
 
 @dataclass
 class KComment(KEntry):
     text: str
 
-class KConfig:
-    def __init__(self, path: str) -> None:
-        self.path = path
-        self.mainmenu: Optional[str] = None
-        self.entries: list[KEntry] = []
-        self._options_index: dict[str, KOption] = {}
-        self._depends_cache = {}
+    parent: Optional[KEntry] = field(default=None, repr=False, compare=False)
+    parent_depends: Tuple[str, ...] = field(default=(), repr=False, compare=False)
 
-        self._build_tree(path)
-        self._validate_tree()
-        self._apply_defaults()
 
-        self._initial_values = {
-            name: opt.value for name, opt in self._options_index.items()
-        }
+@dataclass
+class KSource(KEntry):
+    """Placeholder left by `source` in a KFile until the file is spliced in."""
+    path: str
+    lineno: int
+    line: str
 
-    def _normalize_value(self, opt: KOption, raw: str) -> Union[bool, int, str]:
-        raw = raw.strip()
 
-        if opt.opt_type == "bool":
-            return raw.lower() in ("y", "yes", "true", "1")
+@dataclass(repr=False)
+class KFile:
+    """Parse result of one KConfig file, kept per path by KConfig."""
+    path: str
+    signature: Tuple[int, int]
+    mainmenu: Optional[str] = None
+    entries: List[KEntry] = field(default_factory=list)
+    options: List[KOption] = field(default_factory=list)
+    sources: List[KSource] = field(default_factory=list)
+    # optional sources (osource) that did not exist when the file was parsed
+    missing: List[str] = field(default_factory=list)
+    # (owner, raw entries) for every list holding a KSource; owner None is the file itself
+    containers: List[Tuple[Optional[KEntry], List[KEntry]]] = field(default_factory=list)
 
-        if opt.opt_type == "int":
-            return int(raw)
+@dataclass
+class ConfigAssignment:
+    """One NAME = VALUE line of a config file."""
+    name: str
+    raw: str
+    path: str
+    lineno: int
+    # file; default or enforced for values that no file set, located at
+    # the option's definition
+    origin: str = "file"
 
-        if opt.opt_type == "string":
-            raw = raw.strip()
-            if (raw.startswith('"') and raw.endswith('"')) or \
-            (raw.startswith("'") and raw.endswith("'")):
-                raw = raw[1:-1]
-            return raw
+    @property
+    def location(self) -> str:
+        return f"{self.path}:{self.lineno}"
 
-        return raw
 
-    def _build_tree(self, path: str) -> None:
-        with open(path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+@dataclass
+class MergeReport:
+    """Outcome of KConfig.merge_configs."""
+    # every symbol -> where its final value came from
+    provenance: dict[str, ConfigAssignment] = field(default_factory=dict)
+    # (earlier, later) pairs where a later assignment replaced an earlier one
+    overridden: List[Tuple[ConfigAssignment, ConfigAssignment]] = field(default_factory=list)
+    # assignments that did not take effect, and why
+    ignored: List[Tuple[ConfigAssignment, str]] = field(default_factory=list)
+
+# ---[ Parsing ]--- #
+def read_assignments(path: str) -> Iterator[ConfigAssignment]:
+    """Stream the NAME = VALUE lines of a config file; comments and other lines are skipped."""
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            # Strip whitespace
+            line = line.strip()
+
+            # Ignore empty or commented lines.
+            if not line or line.startswith("#"):
+                continue
 
-        # Stack holds where new entries go
-        stack: list[list[KEntry]] = [self.entries]
-        context_stack: list[ParseContext] = [ParseContext.ROOT]
+            # No equals means it is not a valid option assignment, skip it.
+            if "=" not in line:
+                continue
 
-        current_option: Optional[KOption] = None
-        current_choice: Optional[KChoice] = None
-        current_menu: Optional[KMenu] = None
+            # Split into name and value and get rid of whitespace yet again
+            name, raw = line.split("=", 1)
+            yield ConfigAssignment(name.strip(), raw.strip(), str(path), lineno)
 
-        base_dir = Path(path).parent
+def normalize_value(opt: KOption, raw: str) -> Union[bool, int, str]:
+    raw = raw.strip()
 
-        in_help = False
-        help_indent = 0
+    if opt.opt_type == "bool":
+        return raw.lower() in ("y", "yes", "true", "1")
 
-        for lineno, raw in enumerate(lines, 1):
-            line = raw.rstrip("\n")
+    if opt.opt_type == "int":
+        return int(raw)
 
-            if not line.strip():
-                continue
+    if opt.opt_type == "string":
+        raw = raw.strip()
+        if (raw.startswith('"') and raw.endswith('"')) or \
+        (raw.startswith("'") and raw.endswith("'")):
+            raw = raw[1:-1]
+        return raw
 
-            indent = len(line) - len(line.lstrip())
+    return raw
+
+def _parse_text_after_keyword(line: str, keyword: str) -> str:
+    # We strip quotes on text after keyword, if they exist.
+    text = line[len(keyword):].strip()
+
+    # remove trailing comments
+    if "#" in text:
+        text = text.split("#",1)[0].strip()
+
+    if text.startswith('"') and text.endswith('"'):
+        text = text[1:-1]
+
+    return text
+
+def _syntax_error(lineno, line, msg):
+    raise SyntaxError(
+        f"Line {lineno}: {msg}\n"
+        f"  >> {line}"
+    )
+
+def _file_not_found_error(lineno, line, path):
+    raise FileNotFoundError(
+        f"Line {lineno}: {path}\n"
+        f"  >> {line}"
+    )
+
+def _stat_signature(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns)
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    # Like _stat_signature, with None for a file that is not there
+    try:
+        return _stat_signature(path)
+    except OSError:
+        return None
+
+def _source_path(base_dir: Path, line: str, keyword: str) -> Path:
+    # no variable expansion yet — keep it simple
+    return (base_dir / _parse_text_after_keyword(line, keyword)).resolve()
+
+def scan_sources(path: str) -> list[str]:
+    """
+    Cheap pre-scan for the files a KConfig file sources, without parsing it.
+    May over-report (e.g. a help line starting with 'source '); the parser
+    has the final say.
+    """
+    base_dir = Path(path).parent
+    found = []
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
             stripped = line.strip()
+            keyword = stripped.split(None, 1)[0] if stripped else ""
+            if keyword in SOURCE_KEYWORDS:
+                found.append(str(_source_path(base_dir, stripped, keyword)))
 
-            # ---- help block continuation ----
-            if in_help:
-                if indent > help_indent:
-                    current_option.help += stripped + "\n"
-                    continue
-                else:
-                    in_help = False
-
-            # If we're inside an option but the current line is not an option-field,
-            # then close the option context proactively.
-            # (This avoids an OPTION remaining on the context_stack when we hit endmenu.)
-            if current_option:
-                # lines that belong to an option
-                option_prefixes = ("bool ", "string ", "int ", "default ", "depends on", "help")
-                if not stripped.startswith(option_prefixes):
-                    # close option context
-                    current_option = None
-                    if context_stack and context_stack[-1] == ParseContext.OPTION:
-                        context_stack.pop()
-
-            # ---- mainmenu ----
-            if stripped.startswith("mainmenu "):
-                if self.mainmenu is not None:
-                    self._syntax_error(lineno, line, "Duplicate 'mainmenu'")
-                
-                self.mainmenu = self._parse_text_after_keyword(stripped, "mainmenu")
-                continue
+    return found
 
-            # ---- menu ----
-            if stripped.startswith("menu "):
-                if context_stack[-1] not in (ParseContext.ROOT, ParseContext.MENU):
-                    self._syntax_error(lineno, line, "unexpected 'menu'")
-
-                title = self._parse_text_after_keyword(stripped, "menu")
-                menu = KMenu(title=title)
-                stack[-1].append(menu)
-                stack.append(menu.entries)
-                context_stack.append(ParseContext.MENU)
-                current_option = None
-                current_menu = menu
-                continue
+def parse_file(path: str) -> KFile:
+    """
+    Parse a single KConfig file. `source` lines are not followed; they
+    are left in place as KSource markers for KConfig to splice in.
+    """
+    return _FileParser(path).parse()
 
-            if stripped == "endmenu":
-                # If we have an open OPTION context, close it first.
-                while context_stack and context_stack[-1] == ParseContext.OPTION:
-                    context_stack.pop()
-                    current_option = None
+def _parse_unit(path: str) -> Union[KFile, Exception]:
+    # parse_file for the process pool: an error is returned, not raised, so
+    # it only counts if the serial pass really reaches the file
+    try:
+        return parse_file(path)
+    except Exception as e:
+        return e
 
-                if context_stack[-1] != ParseContext.MENU:
-                    self._syntax_error(lineno, line, "unexpected 'endmenu'")
 
-                stack.pop()
-                context_stack.pop()
+class _FileParser:
+    """
+    Consumes the token stream of one file. Each keyword is dispatched
+    through HANDLERS; lines that fit nowhere are ignored.
+    """
 
-                # also clear choice state if any (defensive)
-                current_choice = None
-                current_option = None
-                current_menu = None
-                continue
+    # Keywords that continue the current option rather than closing it
+    OPTION_FIELDS = frozenset(("bool", "string", "int", "default", "depends", "help"))
 
-            # ---- choice ----
-            if stripped == "choice":
-                if context_stack[-1] != ParseContext.MENU:
-                    self._syntax_error(lineno, line, "nested 'choice' is not allowed'")
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.filename = Path(path).name
+        self.base_dir = Path(path).parent
+        self.unit = KFile(path=path, signature=_stat_signature(path))
+
+        # Stack holds where new entries go, owners the menu/choice owning each list
+        self.stack: list[list[KEntry]] = [self.unit.entries]
+        self.owners: list[Optional[KEntry]] = [None]
+        self.context_stack: list[ParseContext] = [ParseContext.ROOT]
+
+        self.current_option: Optional[KOption] = None
+        self.current_choice: Optional[KChoice] = None
+        self.current_menu: Optional[KMenu] = None
+
+        self.help_lines: Optional[list[str]] = None
+        self.help_indent = 0
+
+    def parse(self) -> KFile:
+        handlers = self.HANDLERS
+        option_fields = self.OPTION_FIELDS
+        tok = None
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for tok in tokenize(f):
+                # ---- help block continuation ----
+                if self.help_lines is not None:
+                    if tok.indent > self.help_indent:
+                        self.help_lines.append(tok.text)
+                        continue
+                    self._end_help()
 
-                current_choice = KChoice()
-                stack[-1].append(current_choice)
-                stack.append(current_choice.entries)
-                context_stack.append(ParseContext.CHOICE)
-                current_option = None
-                continue
+                # Anything that is not an option field closes the option,
+                # so no OPTION is left on the context_stack at endmenu.
+                if self.current_option and tok.kind not in option_fields:
+                    self._close_option()
 
-            if stripped == "endchoice":
-                # Close any open OPTION context first
-                while context_stack and context_stack[-1] == ParseContext.OPTION:
-                    context_stack.pop()
-                    current_option = None
+                handler = handlers.get(tok.kind)
+                if handler is not None:
+                    handler(self, tok)
 
-                if context_stack[-1] != ParseContext.CHOICE:
-                    self._syntax_error(lineno, line, "unexpected 'endchoice'")
+        if self.help_lines is not None:
+            self._end_help()
 
-                stack.pop()
-                context_stack.pop()
+        # Close open option at EOF
+        if self.current_option and self.context_stack[-1] == ParseContext.OPTION:
+            self.context_stack.pop()
+
+        if len(self.context_stack) != 1:
+            _syntax_error(tok.lineno, tok.line, "Unclosed block (missing endmenu or endchoice)")
+
+        return self.unit
+
+    # ---- helpers ----
+    def _close_option(self) -> None:
+        self.current_option = None
+        if self.context_stack and self.context_stack[-1] == ParseContext.OPTION:
+            self.context_stack.pop()
+
+    def _end_help(self) -> None:
+        self.current_option.help = "".join(line + "\n" for line in self.help_lines)
+        self.help_lines = None
+
+    def _push(self, entry: KEntry, entries: list[KEntry], context: ParseContext) -> None:
+        self.stack[-1].append(entry)
+        self.stack.append(entries)
+        self.owners.append(entry)
+        self.context_stack.append(context)
+
+    def _pop(self, tok, context: ParseContext, keyword: str) -> None:
+        # Close any open OPTION context first
+        while self.context_stack and self.context_stack[-1] == ParseContext.OPTION:
+            self.context_stack.pop()
+            self.current_option = None
+
+        if self.context_stack[-1] != context:
+            _syntax_error(tok.lineno, tok.line, f"unexpected '{keyword}'")
+
+        self.stack.pop()
+        self.owners.pop()
+        self.context_stack.pop()
+
+    # ---- handlers ----
+    def _mainmenu(self, tok) -> None:
+        if self.unit.mainmenu is not None:
+            _syntax_error(tok.lineno, tok.line, "Duplicate 'mainmenu'")
+
+        self.unit.mainmenu = _parse_text_after_keyword(tok.text, "mainmenu")
+
+    def _menu(self, tok) -> None:
+        if self.context_stack[-1] not in (ParseContext.ROOT, ParseContext.MENU):
+            _syntax_error(tok.lineno, tok.line, "unexpected 'menu'")
+
+        menu = KMenu(title=_parse_text_after_keyword(tok.text, "menu"))
+        self._push(menu, menu.entries, ParseContext.MENU)
+        self.current_option = None
+        self.current_menu = menu
+
+    def _endmenu(self, tok) -> None:
+        self._pop(tok, ParseContext.MENU, "endmenu")
+
+        # also clear choice state if any (defensive)
+        self.current_choice = None
+        self.current_option = None
+        self.current_menu = None
+
+    def _choice(self, tok) -> None:
+        if self.context_stack[-1] != ParseContext.MENU:
+            _syntax_error(tok.lineno, tok.line, "nested 'choice' is not allowed'")
+
+        self.current_choice = KChoice()
+        self._push(self.current_choice, self.current_choice.entries, ParseContext.CHOICE)
+        self.current_option = None
+
+    def _endchoice(self, tok) -> None:
+        self._pop(tok, ParseContext.CHOICE, "endchoice")
+
+        self.current_choice = None
+        self.current_option = None
+
+    def _comment(self, tok) -> None:
+        self.current_option = None
+        self.stack[-1].append(KComment(text=_parse_text_after_keyword(tok.text, "comment")))
+
+    def _source(self, tok) -> None:
+        # Paths are resolved so every spelling of a file maps to one KFile.
+        # Plain 'source' is already relative to the sourcing file, so
+        # 'rsource' is the same thing; the 'o' variants skip missing files.
+        src_path = _source_path(self.base_dir, tok.text, tok.kind)
+
+        if not src_path.is_file():
+            if tok.kind in OPTIONAL_SOURCE_KEYWORDS:
+                self.unit.missing.append(str(src_path))
+                return
+            _file_not_found_error(tok.lineno, tok.line, src_path)
+
+        # Leave a marker; KConfig parses the file and splices it in here
+        marker = KSource(path=str(src_path), lineno=tok.lineno, line=tok.line)
+        self.stack[-1].append(marker)
+        self.unit.sources.append(marker)
+
+        if not any(entries is self.stack[-1] for _, entries in self.unit.containers):
+            self.unit.containers.append((self.owners[-1], self.stack[-1]))
+
+    def _config(self, tok) -> None:
+        # nested config is not allowed
+        if self.context_stack[-1] == ParseContext.OPTION:
+            _syntax_error(tok.lineno, tok.line, "nested 'config' is not allowed")
+
+        # previous option missing type
+        if self.current_option and self.current_option.prompt is None:
+            _syntax_error(tok.lineno, tok.line, f"option '{self.current_option.name}' missing type")
+
+        name = tok.arg.split()[0]
+
+        self.current_option = KOption(
+            name=name,
+            opt_type="bool",
+            filename=self.filename,
+            lineno=tok.lineno
+        )
 
-                current_choice = None
-                current_option = None
-                continue
-            
-            # ---- comment ----
-            if stripped.startswith("comment "):
-                current_option = None
-                text = self._parse_text_after_keyword(stripped, "comment")
-                stack[-1].append(KComment(text=text))
-                continue
+        self.stack[-1].append(self.current_option)
+        self.unit.options.append(self.current_option)
+        self.context_stack.append(ParseContext.OPTION)
+
+    def _type(self, tok) -> None:
+        if self.current_option is None:
+            _syntax_error(tok.lineno, tok.line, "option type without 'config NAME'")
+
+        self.current_option.opt_type = tok.kind
+        self.current_option.prompt = tok.arg.strip('"')
+
+    def _depends(self, tok) -> None:
+        if not tok.arg.startswith("on "):
+            return
+        expr = tok.arg[3:].strip()
+
+        # Innermost first: a choice inside a menu owns its own depends
+        if self.current_option:
+            self.current_option.depends_on = expr
+        elif self.current_choice:
+            self.current_choice.depends_on = expr
+        elif self.current_menu:
+            self.current_menu.depends_on = expr
+        else:
+            _syntax_error(tok.lineno, tok.line, "'depends on' outside valid context")
+
+    def _prompt(self, tok) -> None:
+        if self.current_choice:
+            self.current_choice.prompt = _parse_text_after_keyword(tok.text, "prompt")
+
+    def _default(self, tok) -> None:
+        opt = self.current_option
+        if not opt:
+            return
+
+        raw = tok.arg
+        if " if " in raw:
+            val, cond = raw.split(" if ", 1)
+            opt.default = normalize_value(opt, val.strip())
+            opt.default_if = cond.strip()
+        else:
+            opt.default = normalize_value(opt, raw.strip())
+
+    def _help(self, tok) -> None:
+        if self.current_option:
+            self.help_lines = []
+            self.help_indent = tok.indent
+            self.current_option.help = ""
+
+    HANDLERS = {
+        "mainmenu": _mainmenu,
+        "menu": _menu,
+        "endmenu": _endmenu,
+        "choice": _choice,
+        "endchoice": _endchoice,
+        "comment": _comment,
+        "source": _source,
+        "osource": _source,
+        "rsource": _source,
+        "orsource": _source,
+        "config": _config,
+        "bool": _type,
+        "string": _type,
+        "int": _type,
+        "depends": _depends,
+        "prompt": _prompt,
+        "default": _default,
+        "help": _help,
+    }
+
+# ---[ KConfig ]--- #
+class KConfig:
+    # Attributes that make up a parsed & validated tree (see TreeCache)
+    _TREE_STATE = (
+        "mainmenu", "entries", "_options_index", "_sources", "_units", "_root",
+        "_rdeps", "_topo_order", "_topo_rank",
+    )
 
-            # ---- source ----
-            if stripped.startswith("source "):
-                #untested block of code
-                # TODO: Do testing...
-                raw = self._parse_text_after_keyword(stripped, "source")
+    def __init__(self, path: str, cache: Optional["TreeCache"] = None, jobs: int = 1) -> None:
+        self.path = path
+        # >1 parses sourced files in that many worker processes; 0 means one per CPU
+        self.jobs = jobs
+        self.mainmenu: Optional[str] = None
+        self.entries: list[KEntry] = []
+        self._options_index: dict[str, KOption] = {}
+        # every file read for this tree, root first
+        self._sources: list[str] = []
+        # per-file parse results by resolved path, so a changed file can be
+        # re-parsed alone and a file sourced twice is only parsed once
+        self._units: dict[str, KFile] = {}
+        self._root = str(Path(path).resolve())
+        self._expr_cache = ExprCache()
+        # symbol -> names of options whose depends (own or inherited from a
+        # menu/choice) or 'default ... if' condition reference it
+        self._rdeps: dict[str, set[str]] = {}
+        # options ordered so every symbol comes before the options reading it
+        self._topo_order: list[KOption] = []
+        self._topo_rank: dict[str, int] = {}
+        # Every value change takes the next generation number, recorded per
+        # symbol, so views can tell whether anything they read has changed.
+        # Bulk updates raise the floor instead, which makes everything stale.
+        self.generation = 0
+        self._symbol_generation: dict[str, int] = {}
+        self._generation_floor = 0
+        # Unsaved changes: the parsed content of the file last loaded, saved
+        # or compared against, its stat signature then, and the names whose
+        # current value differs from it. Untracked until there is a file.
+        self._baseline: Optional[dict[str, str]] = None
+        self._baseline_path: Optional[str] = None
+        self._baseline_signature: Optional[Tuple[int, int]] = None
+        self._dirty: set[str] = set()
+
+        state = cache.load(path) if cache else None
+        self.loaded_from_cache = state is not None
+
+        if state is not None:
+            for attr, value in zip(self._TREE_STATE, state):
+                setattr(self, attr, value)
+        else:
+            self._build_tree(path)
+            self._validate_tree()
+            self._build_graph()
+            self._apply_defaults()
+
+            if cache:
+                cache.store(path, self._sources, tuple(getattr(self, a) for a in self._TREE_STATE),
+                            missing=self._missing_sources())
+
+        self._fit_expr_cache()
 
-                # no variable expansion yet — keep it simple
-                src_path = base_dir / raw
+    def _normalize_value(self, opt: KOption, raw: str) -> Union[bool, int, str]:
+        return normalize_value(opt, raw)
 
-                if not src_path.is_file():
-                    self._file_not_found_error(lineno, line, src_path)
+    def _build_tree(self, path: str) -> None:
+        self._load_units()
+        self._link_units()
+
+    def _load_units(self) -> None:
+        """Parse every file reachable from the root that is not loaded yet."""
+        jobs = self.jobs or os.cpu_count() or 1
+        parsed = self._load_units_parallel(jobs) if jobs > 1 else {}
+
+        # Serial pass: decides what is really sourced, and parses whatever
+        # the pre-scan could not predict
+        pending = [self._root]
+        seen = set()
+
+        while pending:
+            path = pending.pop(0)
+            if path in seen:
+                continue
+            seen.add(path)
+
+            unit = self._units.get(path)
+            if unit is None:
+                unit = parsed.get(path)
+                if isinstance(unit, Exception):
+                    raise unit
+                if unit is None:
+                    unit = parse_file(path)
+                self._units[path] = unit
+            pending.extend(m.path for m in unit.sources)
+
+    def _load_units_parallel(self, jobs: int) -> dict[str, Union[KFile, Exception]]:
+        """
+        Discover the source graph with a cheap pre-scan, then parse every
+        file not loaded yet in a process pool. Returns each file's KFile or
+        parse error; the pre-scan over-reports, so nothing is stored or
+        raised until _load_units reaches the file.
+        """
+        discovered = []
+        pending = [self._root]
+        seen = set()
 
-                # recursively parse source file
-                sub_kc = KConfig(str(src_path))
+        while pending:
+            path = pending.pop(0)
+            if path in seen or not os.path.isfile(path):
+                continue
+            seen.add(path)
+            discovered.append(path)
 
-                # merge entries
-                stack[-1].extend(sub_kc.entries)
+            unit = self._units.get(path)
+            if unit is not None:
+                pending.extend(m.path for m in unit.sources)
+            else:
+                pending.extend(scan_sources(path))
 
-                # merge option index (detect duplicates)
-                for name, opt in sub_kc._options_index.items():
-                    if name in self._options_index:
-                        raise ValueError(f"Duplicate option from source(): {name}")
-                    self._options_index[name] = opt
+        todo = [path for path in discovered if path not in self._units]
+        if len(todo) < 2:
+            return {}
 
-                continue
+        from concurrent.futures import ProcessPoolExecutor
 
-            # ---- option fields without config ----
-            if stripped.startswith(TYPE_PREFIXES):
-                if current_option is None:
-                    self._syntax_error(lineno, line, "option type without 'config NAME'")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            return dict(zip(todo, pool.map(_parse_unit, todo)))
 
-            # ---- config ----
-            if stripped.startswith("config "):
+    def _expand(self, entries: list[KEntry]) -> list[KEntry]:
+        """
+        Copy of `entries` with every KSource replaced by that file's entries.
+        Only called once _check_source_cycles has passed, so this terminates.
+        """
+        result: list[KEntry] = []
 
-                # nested config is not allowed
-                if context_stack[-1] == ParseContext.OPTION:
-                    self._syntax_error(lineno, line, "nested 'config' is not allowed")
+        for e in entries:
+            if isinstance(e, KSource):
+                result.extend(self._expand(self._units[e.path].entries))
+            else:
+                result.append(e)
 
-                # previous option missing type
-                if current_option and current_option.prompt is None:
-                    self._syntax_error(lineno, line, f"option '{current_option.name}' missing type")
+        return result
 
-                name = stripped.split()[1]
+    def _link_units(self) -> None:
+        """
+        Assemble the tree from the per-file parse results: splice sourced
+        files in, then rebuild parent links and the option index.
+        """
+        root = self._units[self._root]
+        self.mainmenu = root.mainmenu
+
+        # Drop files no longer sourced from anywhere
+        reachable = [self._root]
+        seen = {self._root}
+        for path in reachable:
+            for marker in self._units[path].sources:
+                if marker.path not in seen:
+                    seen.add(marker.path)
+                    reachable.append(marker.path)
+        self._units = {path: self._units[path] for path in reachable}
+        self._sources = reachable
+
+        self._check_source_cycles()
+
+        for unit in self._units.values():
+            for owner, raw in unit.containers:
+                if owner is not None:
+                    owner.entries = self._expand(raw)
+
+        self.entries = self._expand(root.entries)
+
+        # Done after every file is read, because a menu's 'depends on'
+        # may come after some of its children.
+        self._link_tree(self.entries)
+
+        # Option index in declaration order (sourced options where they are sourced).
+        # A file sourced more than once yields the very same objects again.
+        index: dict[str, KOption] = {}
+        for opt in self._walk_options(self.entries):
+            if opt.name in index:
+                if index[opt.name] is opt:
+                    continue
+                if index[opt.name].filename != opt.filename:
+                    raise ValueError(f"Duplicate option from source(): {opt.name}")
+                raise ValueError(f"Duplicate option '{opt.name}'")
+            index[opt.name] = opt
+        self._options_index = index
+
+    def _check_source_cycles(self) -> None:
+        """Raise if a file ends up sourcing itself, naming the chain of sources."""
+        done: set[str] = set()
+        # DFS path: (file, its remaining markers); `chain` holds the marker
+        # followed out of each file on the path
+        stack = [(self._root, iter(self._units[self._root].sources))]
+        chain: list[KSource] = []
+        active = [self._root]
+
+        while stack:
+            path, markers = stack[-1]
+            marker = next(markers, None)
+
+            if marker is None:
+                stack.pop()
+                active.pop()
+                done.add(path)
+                if chain:
+                    chain.pop()
+                continue
 
-                current_option = KOption(
-                    name=name,
-                    opt_type="bool",
-                    filename=Path(path).name,
-                    lineno=lineno
-                )
+            if marker.path in active:
+                self._source_cycle_error(active, chain + [marker], marker.path)
+            if marker.path in done:
+                continue
 
-                stack[-1].append(current_option)
-                self._options_index[name] = current_option
+            chain.append(marker)
+            active.append(marker.path)
+            stack.append((marker.path, iter(self._units[marker.path].sources)))
 
-                context_stack.append(ParseContext.OPTION)
-                continue
+    def _source_cycle_error(self, files: list[str], markers: list[KSource], target: str) -> None:
+        start = files.index(target)
+        root_dir = os.path.dirname(self._root)
 
-            # ---- depends ----
-            if stripped.startswith("depends on "):
-                expr = stripped[11:].strip()
+        def where(path: str, marker: KSource) -> str:
+            return f"{os.path.relpath(path, root_dir)}:{marker.lineno}"
 
-                if current_option:
-                    current_option.depends_on = expr
-                elif current_menu:
-                    current_menu.depends_on = expr
-                elif current_choice:
-                    current_choice.depends_on = expr
-                else:
-                    self._syntax_error(lineno, line, "'depends on' outside valid context")
-                
-                continue
+        hops = [where(f, m) for f, m in zip(files[start:], markers[start:])]
+        hops.append(os.path.relpath(target, root_dir))
+        raise ValueError("Source cycle: " + " -> ".join(hops))
 
-            # ---- choice prompt ----
-            if current_choice and stripped.startswith("prompt "):
-                current_choice.prompt = self._parse_text_after_keyword(stripped, "prompt")
-                continue
+    def _missing_sources(self) -> list[str]:
+        """Optional sources that were skipped because the file did not exist."""
+        return [path for unit in self._units.values() for path in unit.missing]
 
-            # ---- option fields ----
-            if current_option:
-                if stripped.startswith(TYPE_PREFIXES):
-                    typ, rest = stripped.split(" ", 1)
-                    current_option.opt_type = typ
-                    current_option.prompt = rest.strip('"')
-                    continue
-                
-                # after handling type lines
-                if stripped.startswith("config ") and current_option and current_option.prompt is None:
-                    self._syntax_error(lineno, line, f"Config '{current_option.name}' is missing type")
+    def _walk_options(self, entries: list[KEntry]):
+        for e in entries:
+            if isinstance(e, KOption):
+                yield e
+            elif isinstance(e, (KMenu, KChoice)):
+                yield from self._walk_options(e.entries)
 
-                if stripped.startswith("default "):
-                    raw = stripped.split(" ", 1)[1]
+    def reload(self) -> set[str]:
+        """
+        Re-parse only the files that changed on disk since they were read,
+        and splice them back into the tree. Values of options that survive
+        the reload are kept. Returns the paths of the re-parsed files.
+        """
+        changed = {
+            path for path, unit in self._units.items()
+            if not os.path.isfile(path) or _stat_signature(path) != unit.signature
+            or any(os.path.isfile(m) for m in unit.missing)
+        }
+        if not changed:
+            return set()
+
+        old_units = dict(self._units)
+        old_index = self._options_index
+
+        try:
+            for path in changed:
+                del self._units[path]
+            self._load_units()
+            self._link_units()
+
+            new_options = [
+                opt for path in changed if path in self._units
+                for opt in self._units[path].options
+            ]
+            removed = old_index.keys() - self._options_index.keys()
+            added = self._options_index.keys() - old_index.keys()
+
+            # Re-validate what came from the changed files, plus anything
+            # that references a symbol that appeared or disappeared.
+            affected: list[KEntry] = []
+            for path in changed:
+                if path in self._units:
+                    affected.extend(self._walk_entries(self._units[path].entries))
+            for sym in removed | added:
+                for name in self._rdeps.get(sym, ()):
+                    opt = self._options_index.get(name)
+                    while opt is not None:
+                        affected.append(opt)
+                        opt = opt.parent
+            for e in affected:
+                self._validate_entry(e)
+
+            self._build_graph()
+        except Exception:
+            self._units = old_units
+            self._link_units()
+            self._build_graph()
+            raise
+
+        # Carry over values of options that still exist with the same type
+        fresh = set()
+        for opt in new_options:
+            old = old_index.get(opt.name)
+            if old is not None and old.opt_type == opt.opt_type:
+                opt.value = old.value
+            else:
+                fresh.add(opt.name)
+        self._apply_defaults(fresh)
+        self._fit_expr_cache()
 
-                    if " if " in raw:
-                        val, cond = raw.split(" if ", 1)
-                        current_option.default = self._normalize_value(current_option, val.strip())
-                        current_option.default_if = cond.strip()
-                    else:
-                        current_option.default = self._normalize_value(current_option, raw.strip())
+        return changed
 
-                    continue
+    def _walk_entries(self, entries: list[KEntry]):
+        """All entries below `entries` in parse order, without following sources."""
+        for e in entries:
+            if isinstance(e, KSource):
+                continue
+            yield e
+            if isinstance(e, (KMenu, KChoice)):
+                yield from self._walk_entries(e.entries)
 
-                if stripped.startswith("depends on "):
-                    current_option.depends_on = stripped.split("on ", 1)[1].strip()
-                    continue
+    def _link_tree(self, entries: list[KEntry], parent: Optional[KEntry] = None,
+                   parent_depends: tuple[str, ...] = (),
+                   seen: Optional[set[int]] = None) -> None:
+        """
+        Set each entry's parent pointer and the chain of menu/choice
+        `depends_on` expressions it inherits, outermost first.
+        Entries of a file sourced more than once keep the first place
+        they appear as their parent.
+        """
+        if seen is None:
+            seen = set()
 
-                if stripped == "help":
-                    in_help = True
-                    help_indent = indent
-                    current_option.help = ""
-                    continue
+        for e in entries:
+            if id(e) in seen:
+                continue
+            seen.add(id(e))
 
-        # Close open option at EOF
-        if current_option and context_stack[-1] == ParseContext.OPTION:
-            context_stack.pop()
+            e.parent = parent
+            e.parent_depends = parent_depends
 
-        if len(context_stack) != 1:
-            self._syntax_error(lineno, line, "Unclosed block (missing endmenu or endchoice)")
+            if isinstance(e, (KMenu, KChoice)):
+                chain = parent_depends + (e.depends_on,) if e.depends_on else parent_depends
+                self._link_tree(e.entries, e, chain, seen)
 
-    def _apply_defaults(self) -> None:
-        """Apply parsed defaults into option.value so visibility can use them."""
-        for opt in self._options_index.values():
+    def _apply_defaults(self, names: Optional[set[str]] = None) -> None:
+        """
+        Apply parsed defaults into option.value so visibility can use them.
+        Runs in dependency order, so 'default ... if' sees final values.
+        Only the options in `names` are touched, if given.
+        """
+        for opt in self._topo_order:
+            if names is not None and opt.name not in names:
+                continue
 
             if opt.default is None:
                 continue
@@ -355,201 +850,270 @@ class KConfig:
             else:
                 opt.value = opt.default
 
-    def _validate_tree(self) -> None:
-        seen: set[str] = set()
-
-        def walk(entries: list[KEntry]) -> None:
-            for e in entries:
-                if isinstance(e, KOption):
-                    # ---- name uniqueness ----
-                    if e.name in seen:
-                        raise ValueError(f"Duplicate option '{e.name}'")
-                    seen.add(e.name)
-
-                    # ---- required fields ----
-                    if e.prompt is None:
-                        raise ValueError(f"Option '{e.name}' missing prompt")
-                    if e.opt_type not in ("bool", "int", "string"):
-                        raise ValueError(f"Option '{e.name}' has invalid type")
-
-                    # ---- depends_on validation ----
-                    if e.depends_on:
-                        for tok in e.depends_on.replace("&&", " ").replace("||", " ").split():
-                            if tok.isidentifier() and tok not in self._options_index:
-                                raise ValueError(
-                                    f"Option '{e.name}' depends on unknown option '{tok}'"
-                                )
-
-                elif isinstance(e, KChoice):
-                    if not e.entries:
-                        raise ValueError("Choice block must contain at least one entry")
-                    walk(e.entries)
-
-                elif isinstance(e, KMenu):
-                    if e.depends_on:
-                        for tok in e.depends_on.replace("&&", " ").replace("||", " ").split():
-                            if tok.isidentifier() and tok not in self._options_index:
-                                raise ValueError(
-                                    f"Menu '{e.title}' depends on unknown option '{tok}'"
-                                )
-                    walk(e.entries)
-
-        walk(self.entries)
-
-    def _eval_depends(self, expr: str) -> bool:
-
-        # Meant to speed up results but destroys dependency visibility
-        #if expr in self._depends_cache:
-        #    return self._depends_cache[expr]
-        # --- Tokenize ---
-        import re
-        token_pattern = re.compile(r'(!|\(|\)|\w+|&&|\|\|)')
-        tokens = token_pattern.findall(expr)
-        tokens = ['and' if t=='&&' else 'or' if t=='||' else t for t in tokens]
-
-        pos = 0
+        self._touch_all()
 
-        def resolve(name: str) -> bool:
-            opt = self._options_index.get(name)
-            if opt is None or opt.value is None:
-                return False
-            return bool(opt.value)
-
-        def parse_expr():
-            return parse_or()
-
-        def parse_or():
-            nonlocal pos
-            val = parse_and()
-            while pos < len(tokens) and tokens[pos] == "or":
-                pos += 1
-                val = val or parse_and()
-            return val
-
-        def parse_and():
-            nonlocal pos
-            val = parse_not()
-            while pos < len(tokens) and tokens[pos] == "and":
-                pos += 1
-                val = val and parse_not()
-            return val
-
-        def parse_not():
-            nonlocal pos
-            if tokens[pos] == "!":
-                pos += 1
-                return not parse_not()
-            return parse_atom()
-
-        def parse_atom():
-            nonlocal pos
-            tok = tokens[pos]
-            if tok == "(":
-                pos += 1
-                val = parse_expr()
-                if pos >= len(tokens) or tokens[pos] != ")":
-                    raise ValueError("Unmatched '(' in depends_on")
-                pos += 1
-                return val
-            elif tok in ("and", "or", ")"):
-                raise ValueError(f"Unexpected token '{tok}' in atom")
-            pos += 1
-            return resolve(tok)
-
-        result = parse_expr()
-
-        if pos != len(tokens):
-            raise ValueError(f"Unexpected token remaining: {tokens[pos:]}")
-
-        self._depends_cache[expr] = result
-        return result
-
-    def _is_visible_local(self, opt: KOption, parent_depends: Optional[str] = None) -> bool:
-        exprs = []
-
-        if parent_depends:
-            exprs.append(parent_depends)
-
-        if opt.depends_on:
-            exprs.append(opt.depends_on)
-
-        if not exprs:
-            return True
-
-        return self._eval_depends(" and ".join(exprs))
-    
-    def _parse_text_after_keyword(self, line: str, keyword: str) -> str:
-        # We strip quotes on text after keyword, if they exist.
-        text = line[len(keyword):].strip()
+    def _fit_expr_cache(self) -> None:
+        """
+        Grow the expression cache to hold every expression of the tree: an
+        enforcement pass reads each one once, and an LRU smaller than that
+        evicts every entry just before it is needed again.
+        """
+        exprs: set[str] = set()
+        for opt in self._options_index.values():
+            exprs.update(opt.parent_depends)
+            exprs.add(opt.depends_on)
+            exprs.add(opt.default_if)
+        exprs.discard(None)
+        exprs.discard("")
+        self._expr_cache.maxsize = max(self._expr_cache.maxsize, len(exprs))
+
+    def _option_refs(self, opt: KOption) -> set[str]:
+        """Symbols read by the option's depends chain and default condition."""
+        refs: set[str] = set()
+        for expr in opt.parent_depends + (opt.depends_on, opt.default_if):
+            if expr:
+                refs.update(self._expr_cache.get(expr).symbols)
+        return refs
+
+    def _build_graph(self) -> None:
+        """
+        Build the symbol dependency graph, reject cycles and compute a
+        topological order (Tarjan's SCC algorithm, iterative).
+        """
+        index = self._options_index
+
+        deps: dict[str, list[str]] = {}
+        rdeps: dict[str, set[str]] = {}
+        for name, opt in index.items():
+            refs = self._option_refs(opt)
+            deps[name] = sorted(r for r in refs if r in index)
+            for sym in refs:
+                rdeps.setdefault(sym, set()).add(name)
+
+        order: list[KOption] = []
+        low: dict[str, int] = {}
+        num: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+
+        for root in index:
+            if root in num:
+                continue
 
-        # remove trailing comments
-        if "#" in text:
-            text = text.split("#",1)[0].strip()
+            num[root] = low[root] = len(num)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(deps[root]))]
+
+            while work:
+                node, children = work[-1]
+
+                for child in children:
+                    if child not in num:
+                        num[child] = low[child] = len(num)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(deps[child])))
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], num[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
 
-        if text.startswith('"') and text.endswith('"'):
-            text = text[1:-1]
+                    if low[node] != num[node]:
+                        continue
 
-        return text
+                    # node is the root of a strongly connected component
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+
+                    if len(component) > 1 or node in deps[node]:
+                        self._cycle_error(component, deps)
+
+                    # Components come out dependencies-first
+                    order.append(index[node])
+
+        self._rdeps = rdeps
+        self._topo_order = order
+        self._topo_rank = {opt.name: i for i, opt in enumerate(order)}
+
+    def _cycle_error(self, component: list[str], deps: dict[str, list[str]]) -> None:
+        members = set(component)
+
+        # Follow edges inside the component until a symbol repeats
+        path = [min(component)]
+        while True:
+            nxt = next(d for d in deps[path[-1]] if d in members)
+            if nxt in path:
+                path = path[path.index(nxt):] + [nxt]
+                break
+            path.append(nxt)
+
+        def where(name: str) -> str:
+            opt = self._options_index[name]
+            return f"{name} ({opt.filename}:{opt.lineno})"
+
+        raise ValueError("Dependency cycle: " + " -> ".join(where(n) for n in path))
+
+    def _validate_entry(self, e: KEntry) -> None:
+        if isinstance(e, KOption):
+            # ---- required fields ----
+            if e.prompt is None:
+                raise ValueError(f"Option '{e.name}' missing prompt")
+            if e.opt_type not in ("bool", "int", "string"):
+                raise ValueError(f"Option '{e.name}' has invalid type")
+
+            # ---- depends_on validation ----
+            if e.depends_on:
+                for tok in self._unknown_symbols(e.depends_on):
+                    raise ValueError(
+                        f"Option '{e.name}' depends on unknown option '{tok}'"
+                    )
+
+        elif isinstance(e, KChoice):
+            if not e.entries:
+                raise ValueError("Choice block must contain at least one entry")
+
+        elif isinstance(e, KMenu):
+            if e.depends_on:
+                for tok in self._unknown_symbols(e.depends_on):
+                    raise ValueError(
+                        f"Menu '{e.title}' depends on unknown option '{tok}'"
+                    )
 
-    def _depends_satisfied(self, opt: KOption) -> bool:
-        exprs = []
+    def _validate_tree(self) -> None:
+        # Name uniqueness is checked while linking
+        for e in self._walk_entries(self.entries):
+            self._validate_entry(e)
+
+    def _unknown_symbols(self, expr: str) -> list[str]:
+        symbols = self._expr_cache.get(expr).symbols
+        return sorted(
+            tok for tok in symbols
+            if tok.isidentifier() and tok not in self._options_index
+        )
 
-        parent = self.get_option_parents(opt.name)
-        if parent:
-            exprs.append(parent)
+    def _resolve_symbol(self, name: str) -> bool:
+        opt = self._options_index.get(name)
+        if opt is None or opt.value is None:
+            return False
+        return bool(opt.value)
+
+    def _eval_depends(self, expr: str, resolve=None) -> bool:
+        return self._expr_cache.get(expr).evaluate(resolve or self._resolve_symbol)
+
+    def _eval_all(self, exprs, resolve=None) -> bool:
+        # Each expression is evaluated on its own, so "A || B" combined with
+        # "C" means (A || B) && C, and the cache only ever sees source text.
+        for expr in exprs:
+            if expr and not self._eval_depends(expr, resolve):
+                return False
+        return True
+
+    def expr_symbols(self, expr: Optional[str]) -> frozenset[str]:
+        """Symbols an expression reads."""
+        return self._expr_cache.get(expr).symbols if expr else frozenset()
+
+    # ---- value generations ----
+    def _assign(self, opt: KOption, value) -> None:
+        if opt.value == value and type(opt.value) is type(value):
+            return
+        opt.value = value
+        self.generation += 1
+        self._symbol_generation[opt.name] = self.generation
+
+        if self._baseline is not None:
+            if self._serialize_value(opt) != self._baseline.get(opt.name):
+                self._dirty.add(opt.name)
+            else:
+                self._dirty.discard(opt.name)
 
-        if opt.depends_on:
-            exprs.append(opt.depends_on)
+    def _touch_all(self) -> None:
+        """Mark every value as changed, after a bulk update or a reload."""
+        self.generation += 1
+        self._generation_floor = self.generation
+        self._refresh_dirty()
 
-        if not exprs:
+    def changed_since(self, generation: int, symbols) -> bool:
+        """True if any of `symbols` changed after `generation` was read."""
+        if generation < self._generation_floor:
             return True
+        sym_gen = self._symbol_generation
+        return any(sym_gen.get(s, 0) > generation for s in symbols)
 
-        return self._eval_depends(" and ".join(exprs))
+    def _is_visible_local(self, opt: KOption, parent_depends: tuple[str, ...] = ()) -> bool:
+        return self._eval_all(parent_depends) and self._eval_all((opt.depends_on,))
+    
+    def _depends_satisfied(self, opt: KOption) -> bool:
+        return self._is_visible_local(opt, self._get_parent_depends(opt.name))
 
     def _load_config_dict(self, path: str) -> dict[str, str]:
-        result = {}
-
-        p = Path(path)
-        if not p.exists():
-            return result  # empty baseline
+        if not Path(path).exists():
+            return {}  # empty baseline
 
-        with open(p, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
+        return {a.name: a.raw.strip("'\"") for a in read_assignments(path)}
 
-                if not line or line.startswith("#"):
-                    continue
+    def _serialize_value(self, opt: KOption) -> Optional[str]:
+        # The value as _load_config_dict reads it back from a saved file
+        if opt.value is None:
+            return None
 
-                if "=" not in line:
-                    continue
+        if opt.opt_type == "bool":
+            return "true" if opt.value else "false"
+        return str(opt.value)
 
-                name, raw = line.split("=", 1)
-                name = name.strip()
-                raw = raw.strip().strip("'\"")
+    def _serialize_config_dict(self) -> dict[str, str]:
+        result = {}
 
-                result[name] = raw
+        for name, opt in self._options_index.items():
+            val = self._serialize_value(opt)
+            if val is not None:
+                result[name] = val
 
         return result
 
-    def _serialize_config_dict(self) -> dict[str, str]:
-        result = {}
+    # ---- unsaved changes ----
+    def _set_baseline(self, path: str, values: dict[str, str],
+                      signature: Optional[Tuple[int, int]]) -> None:
+        """Track changes against `values`, the content of `path` when it had `signature`."""
+        self._baseline = values
+        self._baseline_path = str(Path(path).resolve())
+        self._baseline_signature = signature
+        self._refresh_dirty()
 
-        for name, opt in self._options_index.items():
-            if opt.value is None:
-                continue
+    def _refresh_dirty(self) -> None:
+        if self._baseline is None:
+            return
 
-            if opt.opt_type == "bool":
-                val = "true" if opt.value else "false"
-            elif opt.opt_type == "string":
-                val = str(opt.value)
-            else:
-                val = str(opt.value)
+        current = self._serialize_config_dict()
+        baseline = self._baseline
+        self._dirty = {
+            name for name in current.keys() | baseline.keys()
+            if current.get(name) != baseline.get(name)
+        }
 
-            result[name] = val
+    @property
+    def unsaved_changes(self) -> int:
+        """
+        Number of symbols that differ from the file last loaded, saved or
+        passed to has_changes. Cheap; does not look at the disk.
+        """
+        return len(self._dirty)
 
-        return result
+    def _write_entries(self, f, entries, depth=0, written=None):
+        # A file sourced from two places puts the same options in both;
+        # each may only be written once, or the file is not valid INI
+        if written is None:
+            written = set()
 
-    def _write_entries(self, f, entries, depth=0):
         for e in entries:
             if isinstance(e, KMenu):
                 title = e.title.strip()
@@ -558,13 +1122,14 @@ class KConfig:
                 f.write(f"# {title}\n")
                 f.write("#\n")
 
-                self._write_entries(f, e.entries, depth + 1)
+                self._write_entries(f, e.entries, depth + 1, written)
 
                 f.write(f"# end of {title}\n")
 
             elif isinstance(e, KOption):
-                if e.value is None:
+                if e.value is None or e.name in written or self._options_index.get(e.name) is not e:
                     continue
+                written.add(e.name)
 
                 # TODO
                 #name = f"CONFIG_{e.name}"
@@ -590,85 +1155,47 @@ class KConfig:
 
             elif isinstance(e, KChoice):
                 # choices behave like flat groups
-                self._write_entries(f, e.entries, depth + 1)
-
-    def _syntax_error(self, lineno, line, msg):
-        raise SyntaxError(
-            f"Line {lineno}: {msg}\n"
-            f"  >> {line}"
-        )
-
-    def _file_not_found_error(self, lineno, line, path):
-        raise FileNotFoundError(
-            f"Line {lineno}: {path}\n"
-            f"  >> {line}"
-        )
+                self._write_entries(f, e.entries, depth + 1, written)
 
     def find_option(self, name: str) -> Optional[KOption]:
         return self._options_index.get(name)
     
-    def is_visible(self, opt: KOption) -> bool:
-        """
-        Return True if the option would actually appear in the UI.
-        """
-        def walk(entries, parent_depends=None):
-            for e in entries:
-                if e is opt:
-                    return self._is_visible_local(opt, parent_depends)
-
-                if isinstance(e, KMenu):
-                    combined = e.depends_on
-                    if parent_depends and combined:
-                        combined = f"{parent_depends} and {combined}"
-                    elif parent_depends:
-                        combined = parent_depends
-
-                    if combined is None or self._eval_depends(combined):
-                        res = walk(e.entries, combined)
-                        if res is not None:
-                            return res
-                        
-                elif isinstance(e, KChoice):
-                    combined = e.depends_on
-                    if parent_depends and combined:
-                        combined = f"{parent_depends} and {combined}"
-                    elif parent_depends:
-                        combined = parent_depends
-
-                    if combined is None or self._eval_depends(combined):
-                        res = walk(e.entries, combined)
-                        if res is not None:
-                            return res
-            return None
+    def is_visible(self, opt: KEntry) -> bool:
+        """
+        Return True if the entry would actually appear in the UI.
+        """
+        if isinstance(opt, KOption) and self._options_index.get(opt.name) is not opt:
+            return False
+        return self._eval_all(opt.parent_depends) and \
+            self._eval_all((getattr(opt, "depends_on", None),))
+
+    def _get_parent_depends(self, opt_name: str) -> tuple[str, ...]:
+        """
+        Return the parent/menu `depends_on` expressions that apply to the
+        option, outermost first.
+        """
+        opt = self._options_index.get(opt_name)
+        return opt.parent_depends if opt else ()
 
-        return bool(walk(self.entries))
-        
     def get_option_parents(self, opt_name: str) -> Optional[str]:
         """
-        Walk the tree and return the combined parent/menu `depends_on` expression
-        that applies to the option. Returns None if no parent depends exist.
-        """
-        def walk(entries: list[KEntry], acc: Optional[str]) -> Optional[str]:
-            for e in entries:
-                if isinstance(e, KOption):
-                    if e.name == opt_name:
-                        return acc
-                elif isinstance(e, KMenu) or isinstance(e, KChoice):
-                    # accumulate depends: parent AND this entry's depends
-                    new_acc = acc
-                    if e.depends_on:
-                        new_acc = e.depends_on if new_acc is None else f"{new_acc} and {e.depends_on}"
-                    res = walk(e.entries, new_acc)
-                    if res is not None:
-                        return res
+        Return the combined parent/menu `depends_on` expression that applies
+        to the option. Returns None if no parent depends exist.
+        """
+        exprs = self._get_parent_depends(opt_name)
+        if not exprs:
             return None
+        return " && ".join(f"({e})" for e in exprs)
 
-        return walk(self.entries, None)
-    
-    def get_visible_entries(self, entries=None, parent_depends=None):
+    def get_visible_entries(self, entries=None, parent_depends=()):
         if entries is None:
             entries = self.entries
 
+        if isinstance(parent_depends, str):
+            parent_depends = (parent_depends,)
+        elif parent_depends is None:
+            parent_depends = ()
+
         visible = []
 
         for e in entries:
@@ -676,160 +1203,310 @@ class KConfig:
                 if self._is_visible_local(e, parent_depends):
                     visible.append(e)
 
-            elif isinstance(e, KMenu):
+            elif isinstance(e, (KMenu, KChoice)):
                 # compute combined depends
-                combined = e.depends_on
-                if parent_depends and combined:
-                    combined = f"{parent_depends} and {combined}"
-                elif parent_depends:
-                    combined = parent_depends
+                combined = parent_depends
+                if e.depends_on:
+                    combined = parent_depends + (e.depends_on,)
 
-                if combined is None or self._eval_depends(combined):
+                if self._eval_all(combined):
                     # include the menu itself
                     visible.append(e)
                     # **recurse into children**
                     e.visible_entries = self.get_visible_entries(e.entries, combined)
 
-            elif isinstance(e, KChoice):
-                combined = e.depends_on
-                if parent_depends and combined:
-                    combined = f"{parent_depends} and {combined}"
-                elif parent_depends:
-                    combined = parent_depends
-
-                if combined is None or self._eval_depends(combined):
-                    visible.append(e)
-                    # propagate visibility to children
-                    e.visible_entries = self.get_visible_entries(e.entries, combined)
-
             elif isinstance(e, KComment):
                 visible.append(e)
 
         return visible
+
+    def expr_cache_info(self) -> CacheInfo:
+        """Hit/miss counters of the compiled expression cache."""
+        return self._expr_cache.info()
     
-    def enforce_dependencies(self) -> None:
+    def _zero_value(self, opt: KOption) -> Optional[Union[bool, int, str]]:
+        """Value an option is forced to when its dependencies are unmet."""
+        return {"bool": False, "string": "", "int": 0}.get(opt.opt_type)
+
+    def _enforce_option(self, opt: KOption) -> bool:
+        """Reset one option if its dependencies are unmet. Returns True if it changed."""
+        if self._depends_satisfied(opt):
+            return False
+
+        new_val = self._zero_value(opt)
+        if new_val is None or opt.value == new_val:
+            return False
+
+        self._assign(opt, new_val)
+        return True
+
+    def _propagate(self, names) -> set[str]:
+        """
+        Re-check only the transitive dependents of the given symbols.
+        Returns the names of options that were reset.
+        """
+        return self._walk_dependents(names, self._enforce_option)
+
+    def plan_propagation(self, names) -> dict[str, Union[bool, int, str]]:
         """
-        Iteratively enforce dependency constraints until stable.
-        This avoids order-dependent inconsistencies.
+        The values _propagate would reset, without changing anything, so it
+        can run off the main thread. Apply the result with apply_values, and
+        only if `generation` has not moved since this started.
         """
-        changed = True
+        planned: dict[str, Union[bool, int, str]] = {}
 
-        while changed:
-            changed = False
+        def resolve(name: str) -> bool:
+            if name in planned:
+                return bool(planned[name])
+            return self._resolve_symbol(name)
 
-            for opt in self._options_index.values():
-                if not self._depends_satisfied(opt):
-                    if opt.opt_type == "bool":
-                        new_val = False
-                    elif opt.opt_type == "string":
-                        new_val = ""
-                    elif opt.opt_type == "int":
-                        new_val = 0
-                    else:
-                        continue
+        def plan(opt: KOption) -> bool:
+            if self._eval_all(opt.parent_depends + (opt.depends_on,), resolve):
+                return False
 
-                    if opt.value != new_val:
-                        opt.value = new_val
-                        changed = True
+            new_val = self._zero_value(opt)
+            if new_val is None or planned.get(opt.name, opt.value) == new_val:
+                return False
+
+            planned[opt.name] = new_val
+            return True
+
+        self._walk_dependents(names, plan)
+        return planned
+
+    def apply_values(self, values: dict[str, Union[bool, int, str]]) -> None:
+        """Assign already normalized values, e.g. from plan_propagation."""
+        for name, value in values.items():
+            self._assign(self._options_index[name], value)
+
+    def _walk_dependents(self, names, reset) -> set[str]:
+        """
+        Visit the transitive dependents of `names` in topological order,
+        so each option is checked once. `reset(opt)` returns True if it
+        changed the option, which then has its own dependents visited.
+        """
+        changed: set[str] = set()
+        rank = self._topo_rank
+        queued: set[str] = set()
+        work: list[tuple[int, str]] = []
+
+        def push_dependents(sym: str) -> None:
+            for dep in self._rdeps.get(sym, ()):
+                if dep not in queued:
+                    queued.add(dep)
+                    heapq.heappush(work, (rank[dep], dep))
+
+        for name in names:
+            push_dependents(name)
+
+        while work:
+            _, dep = heapq.heappop(work)
+            if reset(self._options_index[dep]):
+                changed.add(dep)
+                push_dependents(dep)
+
+        return changed
+
+    def get_dependents(self, name: str) -> set[str]:
+        """Names of options that directly reference the given symbol."""
+        return set(self._rdeps.get(name, ()))
+
+    def enforce_dependencies(self) -> None:
+        """
+        Enforce dependency constraints in a single pass. Options are visited
+        in topological order, so every symbol an option reads is already final.
+        """
+        for opt in self._topo_order:
+            self._enforce_option(opt)
 
     def load_config(self, path: str) -> None:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                # Strip whitespace
-                line = line.strip()
+        # Taken first, so a write during the read is noticed by has_changes
+        signature = _file_signature(path)
+        # What _load_config_dict would read, to compare against later
+        baseline = {}
 
-                # Ignore empty or commented lines.
-                if not line or line.startswith("#"):
-                    continue
+        for a in read_assignments(path):
+            self.set_option(a.name, a.raw)
+            baseline[a.name] = a.raw.strip("'\"")
 
-                # No equals means it is not a valid option assignment, skip it.
-                if "=" not in line:
+        self._set_baseline(path, baseline, signature)
+
+    def merge_configs(self, paths: list[str]) -> MergeReport:
+        """
+        Start from the KConfig defaults and apply the config files in
+        `paths` in order, later files winning. Each file is read once and
+        dependencies are enforced once, at the end. Unknown symbols and
+        invalid values are skipped and reported instead of raising. The
+        provenance covers every symbol, including defaults and the values
+        that enforcement changed.
+        """
+        report = MergeReport()
+        provenance = report.provenance
+        index = self._options_index
+
+        self.reset_to_defaults()
+
+        for path in paths:
+            for a in read_assignments(path):
+                opt = index.get(a.name)
+                if opt is None:
+                    report.ignored.append((a, "unknown symbol"))
                     continue
 
-                # Split into name and value and get rid of whitespace yet again
-                name, raw = line.split("=", 1)
-                name = name.strip()
-                raw = raw.strip()
+                try:
+                    self._assign(opt, self._normalize_value(opt, a.raw))
+                except ValueError:
+                    report.ignored.append((a, f"invalid {opt.opt_type} value"))
+                    continue
 
-                # Now set the option.
-                self.set_option(name, raw)
+                previous = provenance.get(a.name)
+                if previous is not None:
+                    report.overridden.append((previous, a))
+                provenance[a.name] = a
 
-        # update baseline snapshot
-        self._initial_values = {
-            name: opt.value for name, opt in self._options_index.items()
-        }
+        assigned = {name: opt.value for name, opt in index.items()}
+        self.enforce_dependencies()
 
-    def save_config(self, path: str, tool_name: str = "Diana", tool_version: str = "Burnwood") -> None:
+        for name, opt in index.items():
+            a = provenance.get(name)
+            if opt.value == assigned[name] and a is not None:
+                continue
+            # What enforcement undid did not come from the file after all
+            if a is not None:
+                report.ignored.append((a, "dependencies not met"))
+            origin = "default" if opt.value == assigned[name] else "enforced"
+            provenance[name] = ConfigAssignment(name, self._serialize_value(opt) or "",
+                                                opt.filename or self.path, opt.lineno or 0, origin)
+
+        # In tree order, like the saved file
+        report.provenance = {name: provenance[name] for name in index}
+        return report
+
+    def save_config(self, path: str, tool_name: str = "Diana", tool_version: str = "Burnwood",
+                    timestamp: bool = False, backup: bool = True) -> bool:
+        """
+        Write the configuration to `path`, keeping the previous file as
+        `path`.old unless `backup` is False. Nothing is written if the file
+        already has this exact content, so it keeps its mtime; the header
+        only carries the time if `timestamp` is set. Returns True if the
+        file was written.
+        """
         from datetime import datetime
-        from textwrap import dedent
+        from io import StringIO
 
         # Handle dependencies
         self.enforce_dependencies()
 
         target = Path(path)
-        old_file = target.with_suffix(target.suffix + ".old")  # filename.old
-
-        # If target exists, handle old file
-        if target.exists():
-            if old_file.exists():
-                old_file.unlink()  # delete existing .old
-            target.rename(old_file)  # move current file to .old
-
-        # Write new config
-        with open(target, "w", encoding="utf-8") as f:
-            f.write(dedent(f"""\
-                #
-                # Automatically generated by {tool_name} {tool_version}
-                # From {self.path}
-                # Time: {datetime.now().isoformat()}
-                #\n
-                """))
-
-            f.write("[project options]\n")
-            self._write_entries(f, self.entries)
+        old_file = target.with_suffix(target.suffix + ".old") if backup else None  # filename.old
+
+        # Render the new config in memory
+        out = StringIO()
+        out.write("#\n")
+        out.write(f"# Automatically generated by {tool_name} {tool_version}\n")
+        out.write(f"# From {self.path}\n")
+        if timestamp:
+            out.write(f"# Time: {datetime.now().isoformat()}\n")
+        out.write("#\n\n")
+
+        out.write("[project options]\n")
+        self._write_entries(out, self.entries)
+
+        written = write_if_changed(target, out.getvalue(), backup=old_file)
+
+        # The file now holds exactly the current values
+        self._set_baseline(path, self._serialize_config_dict(), _file_signature(path))
+        return written
 
     def set_option(self, name: str, value) -> None:
         opt = self._options_index.get(name)
         if not opt:
             raise KeyError(name)
 
-        opt.value = self._normalize_value(opt, str(value))
+        self._assign(opt, self._normalize_value(opt, str(value)))
 
-    def get_option_location(self, opt_name: str) -> list[str]:
-        path = []
-
-        def walk(entries, stack):
-            for e in entries:
-                if isinstance(e, KOption):
-                    if e.name == opt_name:
-                        if e.opt_type == "bool":
-                            val = "y" if e.value else "n"
-                        elif e.opt_type == "string":
-                            val = f'"{e.value}"' if e.value is not None else '""'
-                        elif e.opt_type == "int":
-                            val = str(e.value) if e.value is not None else "0"
-                        else:
-                            val = str(e.value)
-
-                        return stack + [f"{e.prompt} ({e.name} [={val}])"]
-                elif isinstance(e, KMenu):
-                    res = walk(e.entries, stack + [e.title])
-                    if res:
-                        return res
-                elif isinstance(e, KChoice):
-                    res = walk(e.entries, stack)
-                    if res:
-                        return res
-            return None
+    def enforce_option(self, name: str) -> bool:
+        """
+        Reset `name` if its own dependencies are unmet, leaving its
+        dependents alone (see propagate). Returns True if it changed.
+        """
+        opt = self._options_index.get(name)
+        if not opt:
+            raise KeyError(name)
 
-        result = walk(self.entries, [])
-        return result or []
+        return self._enforce_option(opt)
+
+    def propagate(self, names) -> set[str]:
+        """
+        Enforce dependencies on everything downstream of `names`, e.g. after
+        a batch of set_option calls. Returns the names of options reset.
+        """
+        return self._propagate(names)
+
+    def set_value(self, name: str, value) -> set[str]:
+        """
+        Set an option and enforce dependencies on everything downstream of it.
+        Returns the names of all options whose value changed.
+        """
+        opt = self._options_index.get(name)
+        if not opt:
+            raise KeyError(name)
+
+        old_val = opt.value
+        new_val = self._normalize_value(opt, str(value))
+        if old_val == new_val:
+            return set()
+
+        self._assign(opt, new_val)
+        # The option itself may not be allowed to take that value
+        self._enforce_option(opt)
+
+        changed = {name} if opt.value != old_val else set()
+        if changed:
+            changed |= self._propagate([name])
+
+        return changed
+
+    def get_option_location(self, opt_name: str) -> list[str]:
+        e = self._options_index.get(opt_name)
+        if e is None:
+            return []
+
+        if e.opt_type == "bool":
+            val = "y" if e.value else "n"
+        elif e.opt_type == "string":
+            val = f'"{e.value}"' if e.value is not None else '""'
+        elif e.opt_type == "int":
+            val = str(e.value) if e.value is not None else "0"
+        else:
+            val = str(e.value)
+
+        path = [f"{e.prompt} ({e.name} [={val}])"]
+
+        # Climb parent pointers; choices do not add a level
+        parent = e.parent
+        while parent is not None:
+            if isinstance(parent, KMenu):
+                path.append(parent.title)
+            parent = parent.parent
+
+        path.reverse()
+        return path
 
     def has_changes(self, output_path: str) -> bool:
-        current = self._serialize_config_dict()
-        existing = self._load_config_dict(output_path)
+        """
+        True if the current values differ from what `output_path` holds.
+        Answered from the dirty set while `output_path` is the file last
+        loaded, saved or compared against and its stat signature is the
+        same; otherwise the file is read and becomes the new baseline.
+        """
+        signature = _file_signature(output_path)
 
-        return current != existing
+        if self._baseline is None or signature != self._baseline_signature or \
+                str(Path(output_path).resolve()) != self._baseline_path:
+            self._set_baseline(output_path, self._load_config_dict(output_path), signature)
+
+        return bool(self._dirty)
 
     def reset_to_defaults(self) -> None:
         """
@@ -839,14 +1516,9 @@ class KConfig:
         for opt in self._options_index.values():
             opt.value = None
 
-        # Reapply defaults
+        # Reapply defaults; unsaved changes are recounted against the same file
         self._apply_defaults()
 
-        # Reset baseline snapshot
-        self._initial_values = {
-            name: opt.value for name, opt in self._options_index.items()
-        }
-
     # ---[ Test ]--- #
     def dump(self, entries=None, depth=0) -> None:
         if entries is None:
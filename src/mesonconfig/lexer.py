@@ -0,0 +1,70 @@
+#
+# KConfig line lexer for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+KConfig is line oriented, so the lexer classifies each non-blank line once,
+by its first word, and yields one Token per line:
+
+    config FOO          -> Token(kind="config", arg="FOO", ...)
+    depends on A && B   -> Token(kind="depends", arg="on A && B", ...)
+    Some help text      -> Token(kind=TEXT, arg="", ...)
+
+Whether a line is really a keyword or part of a help block depends on
+indentation, which only the parser knows; `text` and `indent` are kept on
+every token for that.
+"""
+
+# ---[ Libraries ]--- #
+from typing import IO, Iterator, NamedTuple
+
+# ---[ Variables ]--- #
+TEXT = "text"
+
+# Keywords that take an argument, and keywords that stand alone.
+# A keyword used the wrong way is lexed as TEXT.
+ARG_KEYWORDS = frozenset((
+    "mainmenu", "menu", "comment",
+    "source", "osource", "rsource", "orsource",
+    "config", "bool", "string", "int",
+    "default", "depends", "prompt",
+))
+BARE_KEYWORDS = frozenset(("endmenu", "choice", "endchoice", "help"))
+
+# ---[ Classes ]--- #
+class Token(NamedTuple):
+    kind: str       # keyword, or TEXT
+    arg: str        # rest of the line after the keyword, stripped
+    text: str       # whole line, stripped
+    indent: int
+    lineno: int
+    line: str       # raw line without newline, for error messages
+
+# ---[ Functions ]--- #
+def tokenize(stream: IO[str]) -> Iterator[Token]:
+    """Lex a text stream line by line, without reading it all into memory."""
+    arg_keywords = ARG_KEYWORDS
+    bare_keywords = BARE_KEYWORDS
+
+    make = Token._make
+
+    for lineno, raw in enumerate(stream, 1):
+        text = raw.strip()
+        if not text:
+            continue
+
+        # Only leading whitespace is lost, as the line is not blank
+        indent = len(raw) - len(raw.lstrip())
+
+        parts = text.split(None, 1)
+        word = parts[0]
+
+        if len(parts) == 2:
+            kind = word if word in arg_keywords else TEXT
+            arg = parts[1]
+        else:
+            kind = word if word in bare_keywords else TEXT
+            arg = ""
+
+        yield make((kind, arg, text, indent, lineno, raw.rstrip("\n")))
@@ -0,0 +1,333 @@
+#
+# Configuration matrix runner for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+Runs one local command per configuration, e.g. `meson setup` + `ninja`,
+each in its own build directory, a bounded number at a time.
+
+In every argument of the command, {config}, {builddir} and {name} are
+replaced with the absolute config path, the absolute build directory and
+the job name; they are also in the environment as MESONCONFIG_CONFIG,
+MESONCONFIG_BUILDDIR and MESONCONFIG_NAME. The command runs from the
+current directory, in its own process group, so a timeout kills
+everything it started. The same group is why Ctrl-C does not reach the
+command: JobPool kills the running jobs itself before passing it on.
+
+How long each job took is kept in HISTORY under the build root. The next
+run starts the slowest jobs first, and jobs never seen before ahead of
+those, so a long build does not end up alone at the tail.
+"""
+
+# ---[ Libraries ]--- #
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+from mesonconfig import core
+
+# ---[ Variables ]--- #
+HISTORY = "matrix-history.json"
+LOG_NAME = "matrix.log"
+TAIL_LINES = 20
+
+# Seconds between SIGTERM and SIGKILL for a job that is killed
+KILL_GRACE = 5.0
+
+# ---[ Classes ]--- #
+@dataclass
+class MatrixJob:
+    name: str
+    config: Path
+    builddir: Path
+
+
+@dataclass
+class JobResult:
+    name: str
+    config: str
+    builddir: str
+    status: str                 # passed, failed, timeout or error
+    returncode: Optional[int]
+    duration: float
+    log: str
+    tail: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "passed"
+
+
+@dataclass
+class MatrixReport:
+    command: List[str]
+    workers: int
+    results: List[JobResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def failed(self) -> List[JobResult]:
+        return [r for r in self.results if not r.passed]
+
+
+class JobPool:
+    """
+    Runs jobs on up to `workers` threads. Leaving the `with` block on an
+    exception, e.g. KeyboardInterrupt, drops the queued jobs and kills the
+    running ones before the exception goes on.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._lock = threading.Lock()
+        self._procs: set[subprocess.Popen] = set()
+        self._closed = False
+
+    def __enter__(self) -> "JobPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self.kill_all()
+        self._pool.shutdown(wait=True)
+
+    def submit(self, job: MatrixJob, command: list[str], timeout: Optional[float] = None,
+               tail_lines: int = TAIL_LINES) -> "Future[JobResult]":
+        return self._pool.submit(run_job, job, command, timeout, tail_lines, self)
+
+    def kill_all(self) -> None:
+        """Kill every running job; jobs that have not started yet never will."""
+        with self._lock:
+            self._closed = True
+            procs = list(self._procs)
+        _kill(*procs)
+
+    def _start(self, argv: list[str], **kwargs) -> Optional[subprocess.Popen]:
+        # Under the lock, so kill_all() cannot miss a job starting meanwhile
+        with self._lock:
+            if self._closed:
+                return None
+            proc = subprocess.Popen(argv, **kwargs)
+            self._procs.add(proc)
+            return proc
+
+    def _finished(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._procs.discard(proc)
+
+# ---[ Functions ]--- #
+def plan_jobs(configs: Iterable[str], root: str) -> list[MatrixJob]:
+    """One job per config, named after the file; names are made unique."""
+    root_path = Path(root).resolve()
+    jobs = []
+    seen: dict[str, int] = {}
+
+    for config in configs:
+        name = Path(config).stem
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        if count:
+            name = f"{name}-{count}"
+        jobs.append(MatrixJob(name, Path(config).resolve(), root_path / name))
+    return jobs
+
+def load_history(root: str) -> dict[str, float]:
+    try:
+        data = json.loads((Path(root) / HISTORY).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {k: float(v) for k, v in data.items() if isinstance(v, (int, float))}
+
+def save_history(root: str, history: dict[str, float], results: Iterable[JobResult]) -> None:
+    history = dict(history)
+    for r in results:
+        if r.status != "error":
+            history[r.name] = round(r.duration, 3)
+    core.write_if_changed(Path(root) / HISTORY, json.dumps(history, indent=2, sort_keys=True) + "\n")
+
+def schedule(jobs: list[MatrixJob], history: dict[str, float]) -> list[MatrixJob]:
+    """Unknown jobs first, then the slowest known ones; ties keep their order."""
+    return sorted(jobs, key=lambda j: -history.get(j.name, float("inf")))
+
+def _expand(command: list[str], job: MatrixJob) -> list[str]:
+    fields = {"{config}": str(job.config), "{builddir}": str(job.builddir), "{name}": job.name}
+    expanded = []
+    for arg in command:
+        for key, value in fields.items():
+            arg = arg.replace(key, value)
+        expanded.append(arg)
+    return expanded
+
+def _signal(proc: subprocess.Popen, force: bool) -> None:
+    # The whole process group: a shell's children would outlive the shell
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+        elif force:
+            proc.kill()
+        else:
+            proc.terminate()
+    except ProcessLookupError:
+        pass
+
+def _kill(*procs: subprocess.Popen) -> None:
+    """SIGTERM, then SIGKILL whatever is left after KILL_GRACE; all share the grace period."""
+    for proc in procs:
+        _signal(proc, force=False)
+    deadline = time.monotonic() + KILL_GRACE
+    for proc in procs:
+        try:
+            proc.wait(max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            _signal(proc, force=True)
+            proc.wait()
+
+def _tail(path: Path, lines: int) -> list[str]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return [line.rstrip("\n") for line in deque(f, maxlen=lines)]
+    except OSError:
+        return []
+
+def run_job(job: MatrixJob, command: list[str], timeout: Optional[float] = None,
+            tail_lines: int = TAIL_LINES, pool: Optional[JobPool] = None) -> JobResult:
+    """
+    Run `command` for one job; its output goes to LOG_NAME in the build
+    directory. Jobs of a `pool` are killed with it.
+    """
+    log = job.builddir / LOG_NAME
+    env = dict(os.environ,
+               MESONCONFIG_CONFIG=str(job.config),
+               MESONCONFIG_BUILDDIR=str(job.builddir),
+               MESONCONFIG_NAME=job.name)
+
+    start = time.perf_counter()
+    returncode: Optional[int] = None
+    try:
+        job.builddir.mkdir(parents=True, exist_ok=True)
+        with open(log, "wb") as out:
+            start_proc = pool._start if pool is not None else subprocess.Popen
+            proc = start_proc(
+                _expand(command, job), stdin=subprocess.DEVNULL, stdout=out,
+                stderr=subprocess.STDOUT, env=env, start_new_session=True
+            )
+            if proc is None:
+                raise InterruptedError("interrupted before the job started")
+            try:
+                returncode = proc.wait(timeout)
+                status = "passed" if returncode == 0 else "failed"
+            except subprocess.TimeoutExpired:
+                _kill(proc)
+                status = "timeout"
+                out.write(f"\nmesonconfig: killed after {timeout}s\n".encode())
+            except BaseException:
+                # Ctrl-C while waiting in this thread
+                _kill(proc)
+                raise
+            finally:
+                if pool is not None:
+                    pool._finished(proc)
+    except OSError as e:
+        status = "error"
+        try:
+            log.write_text(f"mesonconfig: {e}\n", encoding="utf-8")
+        except OSError:
+            pass
+
+    return JobResult(
+        name=job.name,
+        config=str(job.config),
+        builddir=str(job.builddir),
+        status=status,
+        returncode=returncode,
+        duration=time.perf_counter() - start,
+        log=str(log),
+        tail=_tail(log, tail_lines)
+    )
+
+def run_matrix(jobs: list[MatrixJob], command: list[str], root: str, workers: int = 0,
+               timeout: Optional[float] = None, tail_lines: int = TAIL_LINES,
+               on_result: Optional[Callable[[JobResult], None]] = None) -> MatrixReport:
+    """
+    Run every job, at most `workers` at once (0 = one per CPU), slowest
+    first by the history under `root`, which is then updated. Results keep
+    the order of `jobs`; `on_result` sees each one as it finishes.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    report = MatrixReport(list(command), workers)
+    history = load_history(root)
+    order = {id(job): i for i, job in enumerate(jobs)}
+    results: list[Optional[JobResult]] = [None] * len(jobs)
+
+    start = time.perf_counter()
+    # Threads only wait on the child processes, so they are enough here
+    with JobPool(workers) as pool:
+        futures = {
+            pool.submit(job, command, timeout, tail_lines): job
+            for job in schedule(jobs, history)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[order[id(futures[future])]] = result
+            if on_result:
+                on_result(result)
+    report.elapsed = time.perf_counter() - start
+
+    report.results = [r for r in results if r is not None]
+    save_history(root, history, report.results)
+    return report
+
+#  -- Summaries --  #
+def write_json(report: MatrixReport, path: str) -> None:
+    data = {
+        "command": report.command,
+        "workers": report.workers,
+        "elapsed": round(report.elapsed, 3),
+        "passed": len(report.results) - len(report.failed),
+        "failed": len(report.failed),
+        "results": [dict(asdict(r), duration=round(r.duration, 3)) for r in report.results],
+    }
+    core.write_if_changed(path, json.dumps(data, indent=2) + "\n")
+
+def write_junit(report: MatrixReport, path: str) -> None:
+    import xml.etree.ElementTree as ET
+
+    failures = sum(r.status in ("failed", "timeout") for r in report.results)
+    errors = sum(r.status == "error" for r in report.results)
+    suite = ET.Element("testsuite", {
+        "name": "mesonconfig.matrix",
+        "tests": str(len(report.results)),
+        "failures": str(failures),
+        "errors": str(errors),
+        "time": f"{report.elapsed:.3f}",
+    })
+
+    for r in report.results:
+        case = ET.SubElement(suite, "testcase", {
+            "classname": "mesonconfig.matrix",
+            "name": r.name,
+            "time": f"{r.duration:.3f}",
+        })
+        tail = "\n".join(r.tail)
+        if r.status == "failed":
+            ET.SubElement(case, "failure", {"message": f"exit status {r.returncode}"}).text = tail
+        elif r.status == "timeout":
+            ET.SubElement(case, "failure", {"message": "timed out"}).text = tail
+        elif r.status == "error":
+            ET.SubElement(case, "error", {"message": "could not run"}).text = tail
+        ET.SubElement(case, "system-out").text = tail
+
+    ET.indent(suite)
+    core.write_if_changed(path, ET.tostring(suite, encoding="unicode", xml_declaration=True) + "\n")
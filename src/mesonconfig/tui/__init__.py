@@ -1,3 +1,8 @@
-from .app import MCfgApp
+# The app pulls in Textual and Rich, so it is only imported when asked for
+__all__ = ["MCfgApp"]
 
-__all__ = ["MCfgApp"]
\ No newline at end of file
+def __getattr__(name):
+    if name == "MCfgApp":
+        from .app import MCfgApp
+        return MCfgApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
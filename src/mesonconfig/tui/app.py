@@ -11,13 +11,10 @@ from mesonconfig.tui.chrome.window_mixin import WindowChromeMixin
 from mesonconfig.tui.lifecycle.handlers import LifecycleHandlers
 from mesonconfig.tui.config import AppConfig, UIState
 from mesonconfig.tui.widgets.menu import MenuDisplay
-from mesonconfig.tui.widgets.string import StringEditScreen
-from mesonconfig.tui.widgets.integer import IntegerEditScreen
-from mesonconfig.tui.widgets.help import HelpScreen
-from mesonconfig.tui.widgets.exit import ConfirmExitScreen
-from mesonconfig.tui.widgets.save import SaveScreen
-from mesonconfig.tui.widgets.load import LoadScreen
+# Dialog widgets are imported where they are first opened
 from mesonconfig.kconfig import KConfig, KMenu, KOption, KComment, KChoice
+from mesonconfig.cache import TreeCache
+from mesonconfig.visibility import VisibilityView
 # textual tui libs
 from textual.app import App
 from textual.widgets import Label
@@ -32,6 +29,11 @@ class MCfgApp(
     WindowChromeMixin,
     LifecycleHandlers
 ):
+    # Seconds to wait for more edits before enforcing, and before
+    # showing that a recompute is still running
+    RECOMPUTE_DELAY = 0.05
+    RECALC_NOTICE_DELAY = 0.15
+
     #  --[ Key bindings ]--  #
     BINDINGS = [
         ("up", "cursor_up", ""),
@@ -40,6 +42,8 @@ class MCfgApp(
         ("right", "control_right", ""),
         ("space", "activate", ""),
         ("escape", "escape_key", ""),
+        ("ctrl+r", "reload", ""),
+        ("ctrl+d", "debug_log", ""),
     ]
 
     #  --[ On class create ]--  #
@@ -54,7 +58,11 @@ class MCfgApp(
                 f"config must be an AppConfig, got {type(config).__name__}"
             )
         self.config: AppConfig = config
-        self.kconfig = KConfig(self.config.kconfig_file)
+        # Parsed in a worker after the first paint; None until then
+        self.kconfig: KConfig = None
+        # memoized visible children of each menu
+        self.view: VisibilityView = None
+        self.current_entries = []
         
         # navigation stack
         self.menu_stack = []  # holds KMenu objects
@@ -64,6 +72,15 @@ class MCfgApp(
         self._focus_mode = "list"
         self._control_index = 0
         self._last_escape_time = 0.0  # for double escape detection in Exit window
+        self._init_debug_channel()
+
+        # Edits waiting for enforcement, and those being planned in a worker
+        self._pending_names: set[str] = set()
+        self._inflight_names: set[str] = set()
+        self._recompute_timer = None
+        self._recompute_seq = 0     # results from an older pass are dropped
+        self._recalc_timer = None
+        self._recalc_shown = False
     
     #  --[ Style ]--  #
     @property
@@ -83,21 +100,43 @@ class MCfgApp(
         if not self.config.output_file:
             raise ValueError("No output file provided.")
 
+        # The chrome is up; parse and autoload without blocking it.
+        # A parse error ends the app like it did when parsing was up front.
+        self.run_worker(self._load_kconfig, thread=True, group="load")
+        self.set_timer(0.3, lambda: self.dbg("Debug text will show in this color scheme, right down here."))
+
+    def _load_kconfig(self) -> None:
+        # Worker thread: nothing here may touch widgets
+        kconfig = KConfig(
+            self.config.kconfig_file,
+            cache=None if self.config.no_cache else TreeCache(),
+            jobs=self.config.jobs
+        )
+        messages = []
+
         # auto-load existing output file unless disabled
         if self.config.disable_autoconfig:
-            self.dbg("Autoload config is disabled, skipping loading existing config.")
+            messages.append("Autoload config is disabled, skipping loading existing config.")
         else:
             try:
-                self.kconfig.load_config(path = self.config.output_file)
-                self.dbg(f"Loaded existing config: {self.config.output_file}")
+                kconfig.load_config(path = self.config.output_file)
+                messages.append(f"Loaded existing config: {self.config.output_file}")
             except FileNotFoundError:
-                self.dbg(f"No existing config found at: {self.config.output_file}")
+                messages.append(f"No existing config found at: {self.config.output_file}")
             except Exception as e:
-                self.dbg(f"Error loading existing config {self.config.output_file}: {e}")            
+                messages.append(f"Error loading existing config {self.config.output_file}: {e}")
 
-        # Schedule render_entries to happen after current event loop
-        self.call_later(self.render_entries)
-        self.set_timer(0.3, lambda: self.dbg("Debug text will show in this color scheme, right down here."))
+        # Count unsaved changes against the output file from the start
+        kconfig.has_changes(self.config.output_file)
+
+        self.call_from_thread(self._finish_load, kconfig, messages)
+
+    def _finish_load(self, kconfig: KConfig, messages: list[str]) -> None:
+        self.kconfig = kconfig
+        self.view = VisibilityView(kconfig)
+        self.render_entries()
+        for text in messages:
+            self.dbg(text)
 
     #  --[ Commit widgets ]--  #
     def compose(self):
@@ -117,7 +156,9 @@ class MCfgApp(
                     "  Highlighted letters are hotkeys.  Pressing <Y> includes, <N> excludes, <M> modularizes features."
                     "  Press <Esc><Esc> to exit, <?> for Help, </> for Search."
                     "  Legend: [*] built-in  [ ] excluded  <M> module  < > module capable"),
-            items=["Hello", "If you", "see this,", "that means", "something has", "gone wrong..."]
+            # Filled by render_entries once the tree has loaded
+            items=[],
+            virtual=self.config.virtual_list
         )
         
         # This wrapper owns the flexible height
@@ -175,16 +216,12 @@ class MCfgApp(
             self.main_list.control_bar.children[self._control_index].press()
 
     def action_space(self):
-        if self._focus_mode == "list":
+        if self._focus_mode == "list" and self.current_entries:
             index = self.main_list.list_view.index
             entry = self.current_entries[index]
             if isinstance(entry, KOption):
                 if entry.opt_type == "bool":
-                    entry.value = not entry.value
-                    self.kconfig.enforce_dependencies()
-                    self.render_entries()
-                    # Keep focus on current item
-                    self.main_list.list_view.index = index
+                    self._edit(entry.name, not entry.value)
 
     def action_escape_key(self):
         if self._return_to_parent_menu():
@@ -200,17 +237,66 @@ class MCfgApp(
                 self._reset_esc()
 
                 # Only show dialog if config changed
-                if self.kconfig.has_changes(self.config.output_file):
+                self._settle()
+                if self.kconfig is not None and self.kconfig.has_changes(self.config.output_file):
                     self._show_exit_dialog()
                 else:
                     self.exit()
 
+    def action_reload(self):
+        # Re-parse KConfig files edited on disk since they were loaded
+        if self.kconfig is None:
+            return
+        self._settle()
+        try:
+            changed = self.kconfig.reload()
+        except Exception as e:
+            self.set_secondary_status(f"Reload failed: {e}")
+            return
+
+        if not changed:
+            self.set_secondary_status("No KConfig files changed")
+            return
+
+        # Menus from re-parsed files are new objects; leave any that are gone
+        for depth, menu in enumerate(self.menu_stack):
+            if not self._entry_in_tree(menu):
+                del self.menu_stack[depth:]
+                break
+
+        self.render_entries()
+        self.set_secondary_status(f"Reloaded {len(changed)} file(s)")
+
+    def action_debug_log(self):
+        # Backlog of dbg messages; only recorded in verbose mode
+        if not self.config.verbose or len(self.screen_stack) > 1:
+            return
+        from mesonconfig.tui.widgets.debug_log import DebugLogScreen
+        self.open_modal(DebugLogScreen(self))
+
     #  --[ Functions ]--  #
+    def _entry_in_tree(self, entry) -> bool:
+        while entry.parent is not None:
+            if not any(e is entry for e in entry.parent.entries):
+                return False
+            entry = entry.parent
+        return any(e is entry for e in self.kconfig.entries)
+
     def _get_status_path(self):
         if not self.menu_stack:
-            return self.kconfig.mainmenu
-        path = " > ".join([m.title for m in self.menu_stack])
-        return f"> {path}"
+            path = self.kconfig.mainmenu or ""
+        else:
+            path = "> " + " > ".join([m.title for m in self.menu_stack])
+
+        unsaved = self.kconfig.unsaved_changes
+        if unsaved:
+            path += f"  ({unsaved} unsaved change{'s' if unsaved != 1 else ''})"
+        return path
+
+    def _refresh_status_path(self):
+        # Update the primary status text without switching away from the secondary one
+        self.state.last_status_text = self._get_status_path()
+        self.primary_status.update(self.state.last_status_text)
 
     def _reset_esc(self):
         self._esc_timer = None
@@ -238,9 +324,11 @@ class MCfgApp(
     def _show_exit_dialog(self):
         def callback(result):
             if result == "yes":
+                self._settle()
                 self.kconfig.save_config(path=self.config.output_file,
                                         tool_name="Mesonconfig",
-                                        tool_version=core.get_version())
+                                        tool_version=core.get_version(),
+                                        timestamp=self.config.timestamp)
                 self.exit()
             elif result == "no":
                 self.exit()
@@ -248,67 +336,165 @@ class MCfgApp(
                 self.state.other_windows_are_open = True
                 self.state.other_windows_are_open = self.set_timer(0.2, self._reset_other_windows_are_open)
 
+        from mesonconfig.tui.widgets.exit import ConfirmExitScreen
         self.open_modal(ConfirmExitScreen(), callback)
 
     def get_current_entries(self):
-        if not self.menu_stack:
-            return self.kconfig.get_visible_entries()
-
-        current_menu = self.menu_stack[-1]
-        entries = self.kconfig.get_visible_entries(current_menu.entries)
-        # fallback to parent if empty (prevents hang)
-        #if not entries and len(self.menu_stack) > 1:
-        #    current_menu = self.menu_stack[-2]
-        #    entries = self.kconfig.get_visible_entries(current_menu.entries)
-        if not entries:
-            return []
-        return entries
+        # Only the current menu's direct children are evaluated
+        current_menu = self.menu_stack[-1] if self.menu_stack else None
+        return list(self.view.children(current_menu))
 
     def render_entries(self):
-        self.current_entries = [
-            e for e in self.get_current_entries()
-            if not isinstance(e, KOption) or self.kconfig.is_visible(e)
-        ]
-        display_items = []
-        for e in self.current_entries:
-            if isinstance(e, KMenu):
-                display_items.append(f"    {e.title}  --->")
-
-            elif isinstance(e, KOption):
-                if e.opt_type == "bool":
-                    val = "[*]" if e.value else "[ ]"
-                    display_items.append(f"{val} {e.prompt}")
-
-                elif e.opt_type == "string":
-                    display_items.append(f"({e.value or ''}) {e.prompt}")
-
-                elif e.opt_type == "int":
-                    display_items.append(f"({e.value or 0}) {e.prompt}")
-
-            elif isinstance(e, KComment):
-                display_items.append(f"# {e.text}")
-            
-            elif isinstance(e, KChoice):
-                selected = ""
-                for opt in e.entries:
-                    if opt.value:
-                        selected = opt.prompt
-                        break
-
-                display_items.append(
-                    f"    {e.prompt} ({selected})  --->"
-                )
-
-        prev_index = getattr(self.main_list.list_view, "index", 0)
-        self.main_list.update_items(display_items)
-        if display_items:
-            self.main_list.list_view.index = min(prev_index, len(display_items)-1)
+        self.current_entries = self.get_current_entries()
+        display_items = [self._entry_label(e) for e in self.current_entries]
+        # Rows are keyed so only what changed gets redrawn; options by name,
+        # so they survive a reload
+        keys = [e.name if isinstance(e, KOption) else id(e) for e in self.current_entries]
+
+        # The cursor stays on the same entry
+        touched = self.main_list.update_items(display_items, keys)
             
         # Update title
         title = self.menu_stack[-1].title if self.menu_stack else self.kconfig.mainmenu
         self.main_list.border_title = f"[bold]{title}[/bold]"
         # Update status bar
         self.set_status(self._get_status_path())
+        return touched
+
+    def _entry_label(self, e) -> str:
+        if isinstance(e, KMenu):
+            return f"    {e.title}  --->"
+
+        if isinstance(e, KOption):
+            if e.opt_type == "bool":
+                val = "[*]" if e.value else "[ ]"
+                return f"{val} {e.prompt}"
+
+            if e.opt_type == "string":
+                return f"({e.value or ''}) {e.prompt}"
+
+            if e.opt_type == "int":
+                return f"({e.value or 0}) {e.prompt}"
+
+            return f"{e.prompt}"
+
+        if isinstance(e, KComment):
+            return f"# {e.text}"
+
+        if isinstance(e, KChoice):
+            selected = ""
+            for opt in e.entries:
+                if isinstance(opt, KOption) and opt.value:
+                    selected = opt.prompt
+                    break
+
+            return f"    {e.prompt} ({selected})  --->"
+
+        return ""
+
+    #  --[ Background recompute ]--  #
+    def _edit(self, name: str, value) -> None:
+        """
+        Apply an edit to the model right away and redraw its row; enforcing
+        dependencies and re-rendering the menu follow in the background.
+        Raises ValueError for a value the option cannot take.
+        """
+        self.kconfig.set_option(name, value)
+        opt = self.kconfig.find_option(name)
+        # The option itself may not be allowed to take that value
+        self.kconfig.enforce_option(name)
+
+        for index, e in enumerate(self.current_entries):
+            if e is opt:
+                self.main_list.set_item(index, self._entry_label(e))
+                break
+
+        self._pending_names.add(name)
+        self._schedule_recompute()
+
+    def _schedule_recompute(self) -> None:
+        # Rapid edits restart the delay, so they are handled as one batch
+        if self._recompute_timer is not None:
+            self._recompute_timer.stop()
+        self._recompute_timer = self.set_timer(self.RECOMPUTE_DELAY, self._start_recompute)
+
+    def _start_recompute(self) -> None:
+        self._recompute_timer = None
+
+        # A pass still running is superseded, so its edits are redone here
+        names = self._pending_names | self._inflight_names
+        self._pending_names = set()
+        self._inflight_names = names
+        if not names:
+            return
+
+        self._recompute_seq += 1
+        seq, generation = self._recompute_seq, self.kconfig.generation
+
+        if self._recalc_timer is None:
+            self._recalc_timer = self.set_timer(self.RECALC_NOTICE_DELAY, self._show_recalculating)
+
+        self.run_worker(
+            lambda: self._plan_recompute(names, seq, generation),
+            thread=True, group="recompute", exit_on_error=False
+        )
+
+    def _plan_recompute(self, names: set, seq: int, generation: int) -> None:
+        # Worker thread: only reads the model
+        try:
+            planned = self.kconfig.plan_propagation(names)
+        except Exception:
+            # The tree changed underneath (e.g. a reload); try again
+            planned = None
+        self.call_from_thread(self._finish_recompute, planned, seq, generation)
+
+    def _finish_recompute(self, planned, seq: int, generation: int) -> None:
+        if seq != self._recompute_seq:
+            return  # superseded, or settled on the spot
+
+        if planned is None or self.kconfig.generation != generation:
+            # The model changed while planning; plan again with everything
+            self._schedule_recompute()
+            return
+
+        names = self._inflight_names
+        self._inflight_names = set()
+        self.kconfig.apply_values(planned)
+        self._hide_recalculating()
+
+        touched = self.render_entries()
+        self.dbg(f"Recalculated {len(names)} edit(s): {len(planned)} option(s) reset, {touched} row(s) redrawn")
+
+    def _settle(self) -> None:
+        """Finish pending enforcement on the spot, before the model is read or saved."""
+        if self._recompute_timer is not None:
+            self._recompute_timer.stop()
+            self._recompute_timer = None
+
+        names = self._pending_names | self._inflight_names
+        self._pending_names = set()
+        self._inflight_names = set()
+        # Drop any result still on its way
+        self._recompute_seq += 1
+        self._hide_recalculating()
+
+        if names:
+            self.kconfig.propagate(names)
+            self.render_entries()
+
+    def _show_recalculating(self) -> None:
+        self._recalc_timer = None
+        if self._pending_names or self._inflight_names:
+            self._recalc_shown = True
+            self.set_secondary_status("Recalculating...")
+
+    def _hide_recalculating(self) -> None:
+        if self._recalc_timer is not None:
+            self._recalc_timer.stop()
+            self._recalc_timer = None
+        if self._recalc_shown:
+            self._recalc_shown = False
+            self._show_primary_status()
 
     def handle_menu_selection(self, index: int):
         if not self.current_entries:
@@ -333,30 +519,21 @@ class MCfgApp(
         elif isinstance(entry, KOption):
 
             if entry.opt_type == "bool":
-                entry.value = not bool(entry.value)
-                self.kconfig.enforce_dependencies()
-                self.render_entries()
+                self._edit(entry.name, not bool(entry.value))
 
             elif entry.opt_type in ("string", "int"):
                 def callback(result):
                     if result is not None:
-                        index = self.main_list.list_view.index  # preserve focus
-
-                        if entry.opt_type == "int":
-                            try:
-                                entry.value = int(result)
-                            except ValueError:
-                                return  # or show error dialog
-                        else:
-                            entry.value = result
-
-                        self.kconfig.enforce_dependencies()
-                        self.render_entries()
-                        self.main_list.list_view.index = index
+                        try:
+                            self._edit(entry.name, result)
+                        except ValueError:
+                            return  # or show error dialog
 
                 if entry.opt_type == "int":
+                    from mesonconfig.tui.widgets.integer import IntegerEditScreen
                     self.open_modal(IntegerEditScreen(entry), callback)
                 else:
+                    from mesonconfig.tui.widgets.string import StringEditScreen
                     self.open_modal(StringEditScreen(entry), callback)
 
         elif isinstance(entry, KChoice):
@@ -364,10 +541,7 @@ class MCfgApp(
                 if result is None:
                     return
 
-                index = self.main_list.list_view.index
-                self.kconfig.enforce_dependencies()
                 self.render_entries()
-                self.main_list.list_view.index = index
 
             from mesonconfig.tui.widgets.choice import ChoiceScreen
             self.open_modal(ChoiceScreen(entry), callback)
@@ -377,6 +551,7 @@ class MCfgApp(
             return
 
         entry = self.current_entries[index]
+        from mesonconfig.tui.widgets.help import HelpScreen
 
         if isinstance(entry, KOption):
 
@@ -494,16 +669,22 @@ class MCfgApp(
 
             try:
                 from dataclasses import replace
+                self._settle()
                 # Save the configuration
-                self.kconfig.save_config(
+                written = self.kconfig.save_config(
                     path=path,
                     tool_name="Mesonconfig",
-                    tool_version=core.get_version()
+                    tool_version=core.get_version(),
+                    timestamp=self.config.timestamp
                 )
 
                 # Set output file path to saved filename
                 self.config = replace(self.config, output_file=str(path))
-                self.set_secondary_status(f"Updated immutable config; Configuration written to: {path}")
+                self._refresh_status_path()
+                if written:
+                    self.set_secondary_status(f"Updated immutable config; Configuration written to: {path}")
+                else:
+                    self.set_secondary_status(f"Updated immutable config; Configuration unchanged: {path}")
 
                 # Update application title
                 self.header(f"{self.config.output_file} - Mesonconfig {core.get_version()}")
@@ -511,6 +692,9 @@ class MCfgApp(
             except Exception as e:
                 self.set_secondary_status(f"Save failed: {e}")
 
+        if self.kconfig is None:
+            return
+        from mesonconfig.tui.widgets.save import SaveScreen
         self.open_modal(SaveScreen(default_value=self.config.output_file), callback)
 
     def handle_load_dialog(self):
@@ -535,6 +719,7 @@ class MCfgApp(
 
             try:
                 from dataclasses import replace
+                self._settle()
                 # Reset to defaults
                 self.kconfig.reset_to_defaults()
 
@@ -555,6 +740,9 @@ class MCfgApp(
             except Exception as e:
                 self.set_secondary_status(f"Load failed: {e}")
 
+        if self.kconfig is None:
+            return
+        from mesonconfig.tui.widgets.load import LoadScreen
         self.open_modal(LoadScreen(default_value=self.config.output_file), callback)
 
     def open_modal(self, screen, callback=None):
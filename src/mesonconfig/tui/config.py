@@ -10,6 +10,7 @@ class AppConfig:
     # Stuff in here should not be changed (unless user tells to)
     kconfig_file: str = "KConfig"                   # Path to KConfig file to load
     output_file: str = "local.conf"                 # File to write config to on save (and load from on start)
+    timestamp: bool = False                         # If true, saved files carry the time they were written (so they always change)
 
     background: str = "blue"                        # Background of the whole application
     window_border: str = "solid"                    # Border style of Windows
@@ -18,6 +19,9 @@ class AppConfig:
     
     disable_autoconfig: bool = False                # If true, the app will not load settings set in the output_file, using only defaults from KConfig file.
     disable_minimum_size_check: bool = False        # If true, the app will not check for minimum terminal size and will not hide content if the terminal is too small.
+    no_cache: bool = False                          # If true, the KConfig file is always parsed instead of loaded from the parse cache.
+    jobs: int = 1                                   # Worker processes used to parse sourced KConfig files (0 = one per CPU).
+    virtual_list: bool = False                      # If true, the menu draws only the rows on screen instead of one widget per row.
     
     verbose: bool = False                           # Enable/disable verbose mode
     logging: bool = False                           # Enable/disable logging
@@ -111,6 +111,11 @@ def _menu_display_css(highlight: str, window_border: str, window_bg: str, window
                     color: white;
                 }}
             }}
+
+            & > .virtual-list--cursor {{
+                background: {highlight};
+                color: white;
+            }}
         }}
     }}
     """
@@ -248,6 +253,23 @@ def _modal_windows_css(highlight: str, window_border: str, window_bg: str, windo
         }}
     }}
 
+    #debug_dialog {{
+        height: 1fr;
+        width: 100%;
+        border-title-align: center;
+        margin: 2 3 2 2;
+
+        Vertical {{
+            height: 100%;
+        }}
+    }}
+
+    #debug_log {{
+        height: 1fr;
+        background: transparent;
+        color: {window_fg};
+    }}
+
     #help_scroll {{
         height: 1fr;
         overflow-y: auto;
@@ -37,4 +37,5 @@ class LifecycleHandlers:
     def on_mount(self):
         # Program logic here...
         self.header(f"{self.config.output_file} - Mesonconfig {core.get_version()}")
-        self.set_status("Initializing...")
+        # Replaced by the menu path once the KConfig tree is loaded
+        self.set_status("Loading...")
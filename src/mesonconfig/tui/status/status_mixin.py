@@ -5,10 +5,20 @@
 
 # ----[ Libraries ]--- #
 from mesonconfig.core import log_debug
+from collections import deque
 import time
 
+# ---[ Variables ]--- #
+DEBUG_BACKLOG = 1000    # debug messages kept for the debug log panel
+
 # ---[ Status Mixin ]--- #
 class StatusMixin:
+    def _init_debug_channel(self):
+        # Ring buffer of (time, text), and how many messages were ever added
+        self.debug_backlog = deque(maxlen=DEBUG_BACKLOG)
+        self.debug_count = 0
+        self._dbg_timer = None
+
     def _show_primary_status(self):
         # Show primary, hide secondary
         self.secondary_status.add_class("hidden")
@@ -28,20 +38,38 @@ class StatusMixin:
         self.primary_status.update(text)
 
     def set_secondary_status(self, text: str):
-        # Updates the secondary status bar
+        # Updates the secondary status bar; a newer message outlives any dbg timeout
+        self._stop_dbg_timer()
         self._show_secondary_status()
         self.secondary_status.update(text)
 
     def dbg(self, text: str):
         """
-        Show debug text in the secondary status bar and wait some seconds
-        so it's visible before resuming execution.
+        Record debug text and show it in the secondary status bar for
+        `debug_timer` seconds. Never blocks; older messages stay in
+        `debug_backlog` for the debug log panel.
 
         Only shows if verbose mode is enabled.
         """
-        if self.config.verbose:
-            if self.config.logging:
-                log_debug(msg=text, log_file=self.config.log_file)
-            self.set_secondary_status(text)
-            # Halts the program for specified seconds
-            time.sleep(self.config.debug_timer)
\ No newline at end of file
+        if not self.config.verbose:
+            return
+
+        self.debug_backlog.append((time.time(), text))
+        self.debug_count += 1
+
+        if self.config.logging:
+            log_debug(msg=text, log_file=self.config.log_file)
+
+        self.set_secondary_status(text)
+        self._dbg_timer = self.set_timer(self.config.debug_timer, self._dbg_expired)
+
+    def _dbg_expired(self):
+        self._dbg_timer = None
+        # Leave the "window too small" notice alone
+        if not self.state.content_hidden:
+            self._show_primary_status()
+
+    def _stop_dbg_timer(self):
+        if self._dbg_timer is not None:
+            self._dbg_timer.stop()
+            self._dbg_timer = None
@@ -7,6 +7,8 @@ from textual.widgets import Label, Button, ListView, ListItem
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen
 
+from mesonconfig.kconfig import KOption
+
 
 class ChoiceScreen(ModalScreen):
 
@@ -20,7 +22,8 @@ class ChoiceScreen(ModalScreen):
     def __init__(self, choice):
         super().__init__()
         self.choice = choice
-        self.options = choice.entries
+        # Members only; a choice may also hold comments
+        self.options = [e for e in choice.entries if isinstance(e, KOption)]
 
         # determine default selected index
         self._selected_index = self._get_initial_index()
@@ -117,9 +120,12 @@ class ChoiceScreen(ModalScreen):
 
     # --- Logic --- #
     def _commit_and_close(self):
-        # apply selection
+        # apply selection (deselect first, so dependents see a single switch)
+        kconfig = self.app.kconfig
         for i, opt in enumerate(self.options):
-            opt.value = (i == self._selected_index)
+            if i != self._selected_index:
+                kconfig.set_value(opt.name, False)
+        kconfig.set_value(self.options[self._selected_index].name, True)
 
         self.dismiss(self._selected_index)
 
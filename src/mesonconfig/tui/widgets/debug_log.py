@@ -0,0 +1,90 @@
+#
+# Debug log screen widget for Mesonconfig
+# 2026, Remeny
+#
+
+# ---[ Libraries ]--- #
+import time
+from textual.screen import ModalScreen
+from textual.widgets import Button, Log
+from textual.containers import Container, Vertical, Horizontal
+
+# ---[ DebugLogScreen ]--- #
+class DebugLogScreen(ModalScreen):
+    """
+    Scrollable view of the app's dbg backlog. New messages are appended
+    while the screen is open.
+    """
+
+    # Seconds between checks for new messages
+    POLL_INTERVAL = 0.2
+
+    BINDINGS = [
+        ("up", "scroll_up", ""),
+        ("down", "scroll_down", ""),
+        ("pageup", "page_up", ""),
+        ("pagedown", "page_down", ""),
+    ]
+
+    def __init__(self, source):
+        super().__init__()
+        # Anything with `debug_backlog` and `debug_count`, i.e. the app
+        self.source = source
+        self._seen = 0
+
+    def compose(self):
+        yield Container(
+            Vertical(
+                Log(id="debug_log", auto_scroll=True),
+                Horizontal(
+                    Button("< Exit >", id="exit"),
+                    classes="dialog-buttons"
+                ),
+            ),
+            id="debug_dialog",
+            classes="dialog-window"
+        )
+
+    def on_mount(self):
+        dialog = self.query_one("#debug_dialog")
+        dialog.border_title = "[bold]Debug log[/bold]"
+        dialog.border_title_align = "center"
+
+        self._append_new()
+        self.set_interval(self.POLL_INTERVAL, self._append_new)
+        self.query_one("#debug_log").focus()
+
+    def _append_new(self):
+        backlog = self.source.debug_backlog
+        # Messages past the ring buffer's size are gone already
+        new = min(self.source.debug_count - self._seen, len(backlog))
+        self._seen = self.source.debug_count
+        if new <= 0:
+            return
+
+        lines = []
+        for stamp, text in list(backlog)[-new:]:
+            clock = time.strftime("%H:%M:%S", time.localtime(stamp))
+            lines.append(f"[{clock}] {text}")
+        self.query_one("#debug_log", Log).write_lines(lines)
+
+    # --- Scrolling ---
+    def action_scroll_up(self):
+        self.query_one("#debug_log").scroll_up()
+
+    def action_scroll_down(self):
+        self.query_one("#debug_log").scroll_down()
+
+    def action_page_up(self):
+        self.query_one("#debug_log").scroll_page_up()
+
+    def action_page_down(self):
+        self.query_one("#debug_log").scroll_page_down()
+
+    # --- Button press ---
+    def on_button_pressed(self, event: Button.Pressed):
+        if event.button.id == "exit":
+            self.dismiss()
+
+    def key_escape(self):
+        self.dismiss()
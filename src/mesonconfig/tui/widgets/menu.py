@@ -4,9 +4,22 @@
 #
 
 # ---[ Libraries ]--- #
+from difflib import SequenceMatcher
+from typing import Hashable, Optional
 # textual tui libs
 from textual.widgets import Label, ListView, ListItem, Static, Button
 from textual.containers import Container, Horizontal
+# Mesonconfig widgets
+from mesonconfig.tui.widgets.virtual_list import VirtualList
+
+# ---[ Row ]--- #
+class MenuRow(ListItem):
+    """A ListItem that remembers its key and label, so it can be updated in place."""
+
+    def __init__(self, key: Hashable, text: str) -> None:
+        self.key = key
+        self.label = Label(text)
+        super().__init__(self.label)
 
 # ---[ MenuDisplay ]--- #
 class MenuDisplay(Static):
@@ -17,25 +30,40 @@ class MenuDisplay(Static):
         title: str,
         description: str,
         items: list[str],
-        show_controls: bool = True
+        show_controls: bool = True,
+        virtual: bool = False
     ):
         super().__init__()
         self.title: str = title
         self.description: str = description
         self.items: list[str] = items
+        # Row identity for update_items; by position unless given
+        self.keys: list[Hashable] = list(range(len(items)))
         self.show_controls: bool = show_controls
+        # One line-rendered widget instead of a ListItem per row
+        self.virtual: bool = virtual
+        # Rows in display order, ahead of the DOM while an update is pending
+        self.rows: list[MenuRow] = []
+        # Row updates waiting for the DOM, and the cursor they should end on
+        self._pending = 0
+        self._cursor_target: tuple[Optional[Hashable], Optional[int]] = (None, None)
 
     def compose(self):
         yield Static(self.description, classes="menu-description")
         
-        self.list_view = ListView(
-            *[
-                ListItem(Label(item), id=f"item_{i}")
-                for i, item in enumerate(self.items)
-            ],
-            id="menu_list",
-            classes="menu-list",
-        )
+        if self.virtual:
+            self.list_view = VirtualList(
+                list(self.items),
+                id="menu_list",
+                classes="menu-list",
+            )
+        else:
+            self.rows = [MenuRow(key, item) for key, item in zip(self.keys, self.items)]
+            self.list_view = ListView(
+                *self.rows,
+                id="menu_list",
+                classes="menu-list",
+            )
         
         yield Container(
             Horizontal(
@@ -71,8 +99,14 @@ class MenuDisplay(Static):
         self.app.dbg(f"Selected: {value} Index: {index}")
         self.app.handle_menu_selection(index)
 
+    def on_virtual_list_selected(self, event: VirtualList.Selected) -> None:
+        self.on_list_view_selected(event)
+
+    def on_virtual_list_highlighted(self, event: VirtualList.Highlighted) -> None:
+        self.on_list_view_highlighted(event)
+
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
-        if not self.items:
+        if not self.items or self.list_view.index is None:
             return
 
         index = self.list_view.index
@@ -81,7 +115,6 @@ class MenuDisplay(Static):
 
     def on_mount(self):
         self.border_title = f"[bold]{self.title}[/bold]"
-        self.update_items(self.items)
         self.list_view.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -91,7 +124,9 @@ class MenuDisplay(Static):
             if self.app._return_to_parent_menu():
                 return
             # only show exit dialog if changes exist
-            if self.app.kconfig.has_changes(self.app.config.output_file):
+            self.app._settle()
+            kconfig = self.app.kconfig
+            if kconfig is not None and kconfig.has_changes(self.app.config.output_file):
                 self.app._show_exit_dialog()
             else:
                 self.app.exit()
@@ -109,14 +144,14 @@ class MenuDisplay(Static):
             self.handle_load()
 
     def handle_select(self):
-        if not self.list_view.children:
+        if not self.items:
             return
 
         index = self.list_view.index
         self.app.handle_menu_selection(index)
 
     def handle_help(self):
-        if not self.list_view.children:
+        if not self.items:
             return
 
         index = self.list_view.index
@@ -128,21 +163,155 @@ class MenuDisplay(Static):
     def handle_load(self):
         self.app.handle_load_dialog()
 
-    def update_items(self, items: list[str]) -> None:
-        self.items = items
+    def set_item(self, index: int, text: str) -> None:
+        """Relabel a single row in place."""
+        self.items[index] = text
+        if self.virtual:
+            self.list_view.set_line(index, text)
+        else:
+            self.rows[index].label.update(text)
+
+    def update_items(self, items: list[str], keys: Optional[list[Hashable]] = None) -> int:
+        """
+        Show `items`, reusing the rows whose key is still present: kept rows
+        are relabelled only if their text changed, and only new rows are
+        mounted. The cursor stays on the row with the same key, or at the
+        same position if that row is gone. Returns the number of rows
+        mounted, removed or relabelled.
+        """
+        if keys is None:
+            keys = list(range(len(items)))
+
+        old_items, old_keys, old_rows = self.items, self.keys, self.rows
+        self.items, self.keys = items, keys
 
         if not self.is_mounted:
+            return 0
+
+        if self.virtual:
+            return self._update_lines(old_items, old_keys)
+
+        if self._pending:
+            # The DOM is behind; keep aiming for where the last update left the cursor
+            cursor_key, index = self._cursor_target
+        else:
+            index = self.list_view.index
+            cursor_key = old_keys[index] if index is not None and index < len(old_keys) else None
+
+        rows: list[MenuRow] = []
+        removed: list[MenuRow] = []
+        added: set[int] = set()
+        touched = 0
+
+        matcher = SequenceMatcher(None, old_keys, keys, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                for row, old, new in zip(old_rows[i1:i2], old_items[i1:i2], items[j1:j2]):
+                    if old != new:
+                        row.label.update(new)
+                        touched += 1
+                    rows.append(row)
+            else:
+                removed.extend(old_rows[i1:i2])
+                for key, item in zip(keys[j1:j2], items[j1:j2]):
+                    row = MenuRow(key, item)
+                    added.add(id(row))
+                    rows.append(row)
+
+        self.rows = rows
+        touched += len(removed) + len(added)
+
+        if not removed and not added and not self._pending:
+            # Nothing to mount or remove; the cursor can move right away
+            self._restore_cursor(cursor_key, index)
+        else:
+            # Removal only completes on a later tick, so mount and move
+            # the cursor once it has. Updates are applied in order.
+            self._pending += 1
+            self._cursor_target = (cursor_key, index)
+            self.call_later(self._apply_rows, removed, self._mounts(rows, added))
+
+        return touched
+
+    def _update_lines(self, old_items: list[str], old_keys: list[Hashable]) -> int:
+        index = self.list_view.index
+        cursor_key = old_keys[index] if index is not None and index < len(old_keys) else None
+
+        # Lines are cheap; count what would have been redrawn row by row
+        touched = sum(old != new for old, new in zip(old_items, self.items))
+        touched += abs(len(self.items) - len(old_items))
+
+        self.list_view.set_lines(list(self.items))
+        self._restore_cursor(cursor_key, index)
+        return touched
+
+    def _mounts(self, rows: list[MenuRow], added: set[int]) -> list[tuple[Optional[MenuRow], list[MenuRow]]]:
+        """Group new rows by the kept row they go before (None for the end)."""
+        mounts = []
+        batch: list[MenuRow] = []
+
+        for row in rows:
+            if id(row) not in added:
+                if batch:
+                    mounts.append((row, batch))
+                    batch = []
+            else:
+                batch.append(row)
+
+        if batch:
+            mounts.append((None, batch))
+        return mounts
+
+    async def _apply_rows(self, removed, mounts) -> None:
+        self._pending -= 1
+        # Deferred: the app may have shut down and torn the rows down since
+        if not self.list_view.is_attached:
             return
 
-        # Clear everything first
-        self.list_view.clear()
+        if removed:
+            await self.list_view.remove_children(removed)
+        for before, batch in mounts:
+            if not self.list_view.is_attached:
+                return
+            if before is not None:
+                await self.list_view.mount(*batch, before=before)
+            else:
+                await self.list_view.mount(*batch)
+
+        if not self._pending:
+            self._restore_cursor(*self._cursor_target)
+
+    def _restore_cursor(self, cursor_key: Optional[Hashable], index: Optional[int]) -> None:
+        list_view = self.list_view
+        if not list_view.is_attached:
+            return
+
+        if not self.keys:
+            list_view.index = None
+            return
+
+        if cursor_key is not None and cursor_key in self.keys:
+            new_index = self.keys.index(cursor_key)
+        else:
+            new_index = min(index or 0, len(self.keys) - 1)
+
+        if self.virtual:
+            # VirtualList.index always notifies, even for the same value
+            list_view.index = new_index
+            return
+
+        if new_index >= len(list_view.children):
+            # The rows are not mounted (yet, or any more)
+            return
+
+        if list_view.index == new_index:
+            # Same position, possibly a different row: highlight that row
+            row = list_view.children[new_index]
+            row.highlighted = True
+            list_view.scroll_to_widget(row, animate=False)
+        else:
+            list_view.index = new_index
 
-        # Now rebuild safely
-        for i, item in enumerate(items):
-            self.list_view.append(
-                ListItem(Label(item))
-            )
-        
     def set_controls_visible(self, visible: bool) -> None:
         self.show_controls = visible
         self.control_bar.display = visible
\ No newline at end of file
@@ -0,0 +1,160 @@
+#
+# Virtualized line list widget for Mesonconfig
+# 2026, Remeny
+#
+
+# ---[ Libraries ]--- #
+from typing import Optional
+# textual tui libs
+from rich.segment import Segment
+from textual.binding import Binding
+from textual.events import Click
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+# ---[ VirtualList ]--- #
+class VirtualList(ScrollView, can_focus=True):
+    """
+    A list of plain text lines drawn with the line API: only the rows in
+    the viewport are ever rendered, and no widget exists per row, so
+    memory and frame time do not grow with the number of lines.
+
+    Mirrors the parts of ListView that MenuDisplay uses: `index`,
+    cursor actions, and Highlighted/Selected messages.
+    """
+
+    COMPONENT_CLASSES = {"virtual-list--cursor"}
+
+    DEFAULT_CSS = """
+    VirtualList {
+        height: 1fr;
+        overflow-x: hidden;
+
+        & > .virtual-list--cursor {
+            text-style: bold;
+        }
+    }
+    """
+
+    BINDINGS = [
+        Binding("enter", "select_cursor", "Select", show=False),
+        Binding("up", "cursor_up", "Cursor up", show=False),
+        Binding("down", "cursor_down", "Cursor down", show=False),
+        Binding("pageup", "page_up", "Page up", show=False),
+        Binding("pagedown", "page_down", "Page down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+    ]
+
+    index: reactive[Optional[int]] = reactive(None, always_update=True)
+
+    class Highlighted(Message):
+        def __init__(self, virtual_list: "VirtualList", index: Optional[int]) -> None:
+            super().__init__()
+            self.virtual_list = virtual_list
+            self.index = index
+
+    class Selected(Message):
+        def __init__(self, virtual_list: "VirtualList", index: int) -> None:
+            super().__init__()
+            self.virtual_list = virtual_list
+            self.index = index
+
+    def __init__(self, lines: Optional[list[str]] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.lines: list[str] = []
+        self.set_lines(lines or [])
+
+    # ---- content ----
+    def set_lines(self, lines: list[str]) -> None:
+        """Replace the content. Only rows on screen get redrawn."""
+        self.lines = lines
+        width = max((len(line) for line in lines), default=0)
+        self.virtual_size = Size(width, len(lines))
+
+        # Re-validate the cursor against the new length
+        self.set_reactive(VirtualList.index, self.validate_index(self.index))
+        self.refresh()
+
+    def set_line(self, row: int, text: str) -> None:
+        self.lines[row] = text
+        self._refresh_row(row)
+
+    def validate_index(self, index: Optional[int]) -> Optional[int]:
+        if index is None or not self.lines:
+            return None
+        return max(0, min(index, len(self.lines) - 1))
+
+    def watch_index(self, old_index: Optional[int], new_index: Optional[int]) -> None:
+        if old_index is not None:
+            self._refresh_row(old_index)
+
+        if new_index is not None:
+            self._refresh_row(new_index)
+            self.scroll_to_region(Region(0, new_index, 1, 1), animate=False, force=True)
+
+        self.post_message(self.Highlighted(self, new_index))
+
+    def _refresh_row(self, row: int) -> None:
+        y = row - self.scroll_offset.y
+        if 0 <= y < self.size.height:
+            self.refresh(Region(0, y, self.size.width, 1))
+
+    # ---- rendering ----
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        row = scroll_y + y
+        width = self.size.width
+        base = self.rich_style
+
+        if row >= len(self.lines):
+            return Strip.blank(width, base)
+
+        style = base
+        if row == self.index:
+            style = base + self.get_component_rich_style("virtual-list--cursor")
+
+        strip = Strip([Segment(self.lines[row], style)])
+        return strip.crop_extend(scroll_x, scroll_x + width, style)
+
+    # ---- actions ----
+    def action_cursor_up(self) -> None:
+        if self.index is None:
+            self.index = 0 if self.lines else None
+        elif self.index > 0:
+            self.index -= 1
+
+    def action_cursor_down(self) -> None:
+        if self.index is None:
+            self.index = 0 if self.lines else None
+        elif self.index < len(self.lines) - 1:
+            self.index += 1
+
+    def action_page_up(self) -> None:
+        if self.lines:
+            self.index = (self.index or 0) - max(self.size.height - 1, 1)
+
+    def action_page_down(self) -> None:
+        if self.lines:
+            self.index = (self.index or 0) + max(self.size.height - 1, 1)
+
+    def action_first(self) -> None:
+        if self.lines:
+            self.index = 0
+
+    def action_last(self) -> None:
+        if self.lines:
+            self.index = len(self.lines) - 1
+
+    def action_select_cursor(self) -> None:
+        if self.index is not None:
+            self.post_message(self.Selected(self, self.index))
+
+    def on_click(self, event: Click) -> None:
+        row = self.scroll_offset.y + event.y
+        if 0 <= row < len(self.lines):
+            self.index = row
+            self.post_message(self.Selected(self, row))
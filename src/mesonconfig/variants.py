@@ -0,0 +1,186 @@
+#
+# Batch configuration variants for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+Generates many configurations from one KConfig tree, for build coverage:
+
+    allyesconfig    every bool option on
+    allnoconfig     every bool option off
+    alldefconfig    the KConfig defaults
+    randconfig      bool options on or off at random, from a seed
+
+Choices always end up with exactly one member selected: the default one,
+or a random one for randconfig. Ints and strings keep their defaults.
+Dependencies are enforced on every variant before it is saved.
+
+The tree is parsed once; worker processes get it pickled through the pool
+initializer instead of parsing it again. Random variant `i` draws from its
+own generator seeded with "<seed>-<i>", so its content depends only on the
+seed and the index, never on the number of workers or the order they run.
+"""
+
+# ---[ Libraries ]--- #
+import json
+import os
+import pickle
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from mesonconfig import core
+from mesonconfig.kconfig import KChoice, KConfig, KOption
+
+# ---[ Variables ]--- #
+KINDS = ("allyesconfig", "allnoconfig", "alldefconfig", "randconfig")
+
+# Lists every generated file with its kind and seed
+MANIFEST = "variants.json"
+
+# Tree of the current worker process and its choices, set by _init_worker
+_worker_tree: Optional[KConfig] = None
+_worker_choices: list[KChoice] = []
+
+# ---[ Classes ]--- #
+@dataclass(frozen=True)
+class Variant:
+    kind: str
+    index: int = 0              # randconfig only
+    seed: Optional[str] = None  # randconfig only
+
+    @property
+    def filename(self) -> str:
+        if self.kind == "randconfig":
+            return f"randconfig-{self.index:04d}.conf"
+        return f"{self.kind}.conf"
+
+
+@dataclass
+class VariantReport:
+    directory: Path
+    files: List[Path] = field(default_factory=list)
+    written: int = 0            # files whose content changed
+    elapsed: float = 0.0
+
+    @property
+    def configs_per_second(self) -> float:
+        return len(self.files) / self.elapsed if self.elapsed else 0.0
+
+# ---[ Functions ]--- #
+def plan_variants(kinds: Iterable[str], randconfigs: int = 0, seed: int = 0) -> list[Variant]:
+    """The variants to generate, in a stable order; `randconfigs` random ones go last."""
+    variants = []
+    for kind in kinds:
+        if kind not in KINDS:
+            raise ValueError(f"Unknown variant kind: {kind}")
+        if kind != "randconfig":
+            variants.append(Variant(kind))
+
+    variants.extend(Variant("randconfig", i, f"{seed}-{i}") for i in range(randconfigs))
+    return variants
+
+def _choices(kc: KConfig) -> list[KChoice]:
+    return [e for e in kc._walk_entries(kc.entries) if isinstance(e, KChoice)]
+
+def apply_variant(kc: KConfig, variant: Variant, choices: Optional[list[KChoice]] = None,
+                  enforce: bool = True) -> None:
+    """
+    Set `kc` to `variant`, starting from the defaults. Dependencies are
+    enforced unless `enforce` is False (save_config enforces them anyway).
+    """
+    kc.reset_to_defaults()
+    if variant.kind == "alldefconfig":
+        if enforce:
+            kc.enforce_dependencies()
+        return
+
+    rng = random.Random(variant.seed) if variant.kind == "randconfig" else None
+    index = kc._options_index
+
+    # In topological order, so the draws for a seed never change
+    for opt in kc._topo_order:
+        if opt.opt_type != "bool":
+            continue
+        if rng is not None:
+            kc._assign(opt, rng.random() < 0.5)
+        else:
+            kc._assign(opt, variant.kind == "allyesconfig")
+
+    for choice in choices if choices is not None else _choices(kc):
+        members = [
+            e for e in choice.entries
+            if isinstance(e, KOption) and index.get(e.name) is e
+        ]
+        if not members:
+            continue
+
+        if rng is not None:
+            picked = rng.choice(members)
+        else:
+            picked = next((m for m in members if m.default), members[0])
+        for m in members:
+            kc._assign(m, m is picked)
+
+    if enforce:
+        kc.enforce_dependencies()
+
+def _render(kc: KConfig, variant: Variant, directory: Path, choices: list[KChoice],
+            version: str) -> tuple[Path, bool]:
+    # save_config enforces dependencies, so skip the pass in apply_variant
+    apply_variant(kc, variant, choices, enforce=False)
+    path = directory / variant.filename
+    written = kc.save_config(path, tool_name="Mesonconfig", tool_version=version, backup=False)
+    return path, written
+
+def _init_worker(blob: bytes) -> None:
+    global _worker_tree, _worker_choices
+    _worker_tree = pickle.loads(blob)
+    _worker_choices = _choices(_worker_tree)
+
+def _worker_render(variant: Variant, directory: Path, version: str) -> tuple[Path, bool]:
+    return _render(_worker_tree, variant, directory, _worker_choices, version)
+
+def generate_variants(kc: KConfig, variants: list[Variant], directory: str, jobs: int = 0) -> VariantReport:
+    """
+    Write every variant into `directory`, plus a MANIFEST of what each
+    file is, using `jobs` worker processes (0 = one per CPU, 1 = in this
+    process). Files that would not change are not rewritten. `kc` is left
+    as the last variant when run in this process.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    report = VariantReport(directory)
+    version = core.get_version()
+
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(variants))
+    start = time.perf_counter()
+
+    if jobs <= 1:
+        choices = _choices(kc)
+        results = [_render(kc, v, directory, choices, version) for v in variants]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        blob = pickle.dumps(kc, protocol=pickle.HIGHEST_PROTOCOL)
+        n = len(variants)
+        # Chunks amortize the round trips; variants are small tasks
+        chunksize = max(1, n // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(blob,)) as pool:
+            results = list(pool.map(_worker_render, variants, [directory] * n, [version] * n,
+                                    chunksize=chunksize))
+
+    report.elapsed = time.perf_counter() - start
+    for path, written in results:
+        report.files.append(path)
+        report.written += written
+
+    manifest = [
+        {"file": v.filename, "kind": v.kind, "index": v.index, "seed": v.seed}
+        for v in variants
+    ]
+    core.write_if_changed(directory / MANIFEST, json.dumps(manifest, indent=2) + "\n")
+    return report
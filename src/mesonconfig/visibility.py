@@ -0,0 +1,91 @@
+#
+# Memoized per-menu visibility for Mesonconfig
+# 2026, Remeny
+#
+
+"""
+VisibilityView answers "what does this menu show right now?" for one menu
+at a time. Only the menu's direct children are evaluated, and the answer is
+kept until one of the symbols it read changes (see KConfig.changed_since).
+"""
+
+# ---[ Libraries ]--- #
+from typing import NamedTuple, Optional, Union
+
+from mesonconfig.kconfig import KChoice, KComment, KConfig, KEntry, KMenu, KOption
+
+# ---[ Classes ]--- #
+class _MenuState(NamedTuple):
+    container: Optional[Union[KMenu, KChoice]]
+    generation: int
+    symbols: frozenset
+    visible: list
+
+
+class VisibilityView:
+    def __init__(self, kconfig: KConfig) -> None:
+        self.kconfig = kconfig
+        # id(menu) (or id(None) for the top level) -> last computed state
+        self._menus: dict[int, _MenuState] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def children(self, menu: Optional[Union[KMenu, KChoice]] = None) -> list[KEntry]:
+        """
+        Visible direct children of `menu`, or of the top level if None.
+        The returned list is shared with the cache; do not modify it.
+        """
+        state = self._menus.get(id(menu))
+
+        if state is not None and state.container is menu and \
+                not self.kconfig.changed_since(state.generation, state.symbols):
+            self.hits += 1
+            return state.visible
+
+        self.misses += 1
+        state = self._compute(menu)
+        self._menus[id(menu)] = state
+        return state.visible
+
+    def clear(self) -> None:
+        self._menus.clear()
+
+    def _compute(self, menu: Optional[Union[KMenu, KChoice]]) -> _MenuState:
+        kc = self.kconfig
+        generation = kc.generation
+
+        if menu is None:
+            entries = kc.entries
+            chain: tuple[str, ...] = ()
+        else:
+            entries = menu.entries
+            chain = menu.parent_depends + ((menu.depends_on,) if menu.depends_on else ())
+
+        symbols: set[str] = set()
+        for expr in chain:
+            symbols |= kc.expr_symbols(expr)
+
+        # Everything but comments hides with the menu itself
+        menu_visible = kc._eval_all(chain)
+        visible = []
+
+        for e in entries:
+            if isinstance(e, KComment):
+                visible.append(e)
+                continue
+
+            if not isinstance(e, (KOption, KMenu, KChoice)):
+                continue
+
+            symbols |= kc.expr_symbols(e.depends_on)
+
+            if not menu_visible or not kc._eval_all((e.depends_on,)):
+                continue
+
+            # Same rule as KConfig.is_visible: only the indexed object counts
+            if isinstance(e, KOption) and kc.find_option(e.name) is not e:
+                continue
+
+            visible.append(e)
+
+        return _MenuState(menu, generation, frozenset(symbols), visible)
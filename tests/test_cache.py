@@ -0,0 +1,59 @@
+#
+# Parse cache regression tests for Mesonconfig
+# 2026, Remeny
+#
+
+# ---[ Libraries ]--- #
+from mesonconfig.cache import TreeCache
+from mesonconfig.kconfig import KConfig
+
+# ---[ Trees ]--- #
+ROOT = """\
+config ROOT
+    bool "Root"
+    default y
+source "sub.kc"
+"""
+
+SUB = """\
+config SUB
+    bool "Sub"
+    depends on ROOT
+"""
+
+# ---[ Tests ]--- #
+def _tree(tmp_path):
+    (tmp_path / "sub.kc").write_text(SUB, encoding="utf-8")
+    root = tmp_path / "KConfig"
+    root.write_text(ROOT, encoding="utf-8")
+    return str(root)
+
+def test_second_load_hits_the_cache(tmp_path):
+    root = _tree(tmp_path)
+    cache = TreeCache(tmp_path / "cache", version="test")
+
+    first = KConfig(root, cache=cache)
+    second = KConfig(root, cache=cache)
+
+    assert not first.loaded_from_cache
+    assert second.loaded_from_cache
+    assert list(second._options_index) == ["ROOT", "SUB"]
+    assert second.get_dependents("ROOT") == {"SUB"}
+
+def test_changed_sourced_file_invalidates(tmp_path):
+    root = _tree(tmp_path)
+    cache = TreeCache(tmp_path / "cache", version="test")
+    KConfig(root, cache=cache)
+
+    (tmp_path / "sub.kc").write_text(SUB + "config MORE\n    bool \"More\"\n", encoding="utf-8")
+    kc = KConfig(root, cache=cache)
+
+    assert not kc.loaded_from_cache
+    assert kc.find_option("MORE") is not None
+
+def test_other_version_misses(tmp_path):
+    root = _tree(tmp_path)
+    KConfig(root, cache=TreeCache(tmp_path / "cache", version="1"))
+
+    kc = KConfig(root, cache=TreeCache(tmp_path / "cache", version="2"))
+    assert not kc.loaded_from_cache
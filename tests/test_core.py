@@ -0,0 +1,64 @@
+#
+# Core helper regression tests for Mesonconfig
+# 2026, Remeny
+#
+
+# ---[ Libraries ]--- #
+import os
+import stat
+
+import pytest
+
+from mesonconfig import core
+
+# ---[ Tests ]--- #
+def _age(path, seconds: int = 100) -> int:
+    st = path.stat()
+    mtime = st.st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(st.st_atime_ns, mtime))
+    return mtime
+
+def test_unchanged_content_keeps_mtime(tmp_path):
+    path = tmp_path / "out.txt"
+    assert core.write_if_changed(path, "same\n")
+    mtime = _age(path)
+
+    assert not core.write_if_changed(path, "same\n")
+    assert path.stat().st_mtime_ns == mtime
+
+def test_changed_content_keeps_mode(tmp_path):
+    path = tmp_path / "out.txt"
+    core.write_if_changed(path, "old\n")
+    os.chmod(path, 0o640)
+
+    assert core.write_if_changed(path, "new\n")
+    assert path.read_text(encoding="utf-8") == "new\n"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+def test_new_file_gets_umask_mode(tmp_path, monkeypatch):
+    # As on systems without /proc: the umask read at import
+    monkeypatch.setattr(core, "_proc_umask", lambda: None)
+    monkeypatch.setattr(core, "_IMPORT_UMASK", 0o027)
+
+    path = tmp_path / "new.txt"
+    core.write_if_changed(path, "x\n")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs /proc")
+def test_umask_read_from_proc(tmp_path):
+    umask = os.umask(0o027)
+    try:
+        assert core._proc_umask() == 0o027
+        path = tmp_path / "new.txt"
+        core.write_if_changed(path, "x\n")
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+def test_backup_holds_previous_content(tmp_path):
+    path = tmp_path / "out.txt"
+    core.write_if_changed(path, "one\n")
+    core.write_if_changed(path, "two\n", backup=str(path) + ".old")
+
+    assert (tmp_path / "out.txt.old").read_text(encoding="utf-8") == "one\n"
+    assert not list(tmp_path.glob(".out.txt.*.tmp"))
@@ -0,0 +1,298 @@
+#
+# KConfig engine regression tests for Mesonconfig
+# 2026, Remeny
+#
+
+# ---[ Libraries ]--- #
+import os
+
+import pytest
+
+from mesonconfig.kconfig import KChoice, KConfig
+
+# ---[ Trees ]--- #
+CHOICE_IN_MENU = """\
+menu "M"
+config A
+    bool "A"
+    default y
+choice
+    prompt "C"
+    depends on A
+config B
+    bool "B"
+config C
+    bool "C"
+endchoice
+endmenu
+"""
+
+SELF_CYCLE = """\
+config A
+    bool "A"
+    depends on A
+"""
+
+CYCLE = """\
+config A
+    bool "A"
+    depends on B
+config B
+    bool "B"
+    depends on A
+"""
+
+# C depends on B depends on A, all on by default
+CHAIN = """\
+config A
+    bool "A"
+    default y
+config B
+    bool "B"
+    default y
+    depends on A
+config C
+    bool "C"
+    default y
+    depends on B
+config D
+    bool "D"
+    default y
+"""
+
+# LATE is declared after the option whose default reads it
+FORWARD_DEFAULT = """\
+config EARLY
+    bool "Early"
+    default y if LATE
+config LATE
+    bool "Late"
+    default y
+"""
+
+SOURCED = """\
+config ROOT
+    bool "Root"
+    default y
+source "sub.kc"
+"""
+
+SUB = """\
+config SUB
+    bool "Sub"
+    default y
+    depends on ROOT
+"""
+
+# ---[ Tests ]--- #
+def _load(tmp_path, text: str) -> KConfig:
+    path = tmp_path / "KConfig"
+    path.write_text(text, encoding="utf-8")
+    return KConfig(str(path))
+
+def test_choice_depends_inside_menu(tmp_path):
+    # 'depends on' belongs to the choice, not to the menu around it
+    kc = _load(tmp_path, CHOICE_IN_MENU)
+    menu = kc.entries[0]
+    choice = next(e for e in menu.entries if isinstance(e, KChoice))
+
+    assert menu.depends_on is None
+    assert choice.depends_on == "A"
+    assert kc.find_option("A").value is True
+    assert kc.is_visible(kc.find_option("B"))
+
+def test_self_cycle_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Dependency cycle"):
+        _load(tmp_path, SELF_CYCLE)
+
+def test_cycle_error_names_file_and_line(tmp_path):
+    with pytest.raises(ValueError) as info:
+        _load(tmp_path, CYCLE)
+
+    message = str(info.value)
+    assert "A (KConfig:1)" in message
+    assert "B (KConfig:4)" in message
+
+def test_set_value_propagates_to_dependents(tmp_path):
+    kc = _load(tmp_path, CHAIN)
+
+    changed = kc.set_value("A", "n")
+
+    assert changed == {"A", "B", "C"}
+    assert [kc.find_option(n).value for n in "ABCD"] == [False, False, False, True]
+    assert kc.get_dependents("A") >= {"B"}
+
+def test_plan_propagation_matches_set_value(tmp_path):
+    kc = _load(tmp_path, CHAIN)
+    kc.find_option("A").value = False
+
+    planned = kc.plan_propagation(["A"])
+
+    assert planned == {"B": False, "C": False}
+    # Planning changes nothing
+    assert kc.find_option("B").value is True
+
+def test_defaults_follow_dependency_order(tmp_path):
+    kc = _load(tmp_path, FORWARD_DEFAULT)
+    assert kc.find_option("EARLY").value is True
+
+def test_unsaved_changes_tracking(tmp_path):
+    kc = _load(tmp_path, CHAIN)
+    config = tmp_path / "local.conf"
+    kc.save_config(str(config))
+
+    assert kc.unsaved_changes == 0
+    assert not kc.has_changes(str(config))
+
+    kc.set_value("D", "n")
+    assert kc.unsaved_changes == 1
+    assert kc.has_changes(str(config))
+
+    # Back to the saved value: clean again
+    kc.set_value("D", "y")
+    assert kc.unsaved_changes == 0
+    assert not kc.has_changes(str(config))
+
+def test_has_changes_notices_edits_on_disk(tmp_path):
+    kc = _load(tmp_path, CHAIN)
+    config = tmp_path / "local.conf"
+    kc.save_config(str(config))
+
+    text = config.read_text(encoding="utf-8").replace("D = true", "D = false")
+    config.write_text(text, encoding="utf-8")
+    st = config.stat()
+    os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert kc.has_changes(str(config))
+
+def test_reload_rolls_back_on_error(tmp_path):
+    (tmp_path / "sub.kc").write_text(SUB, encoding="utf-8")
+    kc = _load(tmp_path, SOURCED)
+    kc.set_value("SUB", "n")
+
+    (tmp_path / "sub.kc").write_text("config SUB\n    bool \"Sub\"\n  endmenu\n", encoding="utf-8")
+    with pytest.raises((SyntaxError, ValueError)):
+        kc.reload()
+
+    # The tree and the values from before the failed reload are intact
+    sub = kc.find_option("SUB")
+    assert sub is not None and sub.value is False
+    assert kc.get_dependents("ROOT") == {"SUB"}
+
+    (tmp_path / "sub.kc").write_text(SUB + "config EXTRA\n    bool \"Extra\"\n", encoding="utf-8")
+    assert kc.reload()
+    assert kc.find_option("EXTRA") is not None
+    assert kc.find_option("SUB").value is False
+
+#  -- Parallel parsing --  #
+# The help text mentions a file that is never really sourced
+HELP_MENTIONS_SOURCE = """\
+config A
+    bool "A"
+    help
+      To add boards, write
+      source broken.kc
+      in your own tree.
+source "real.kc"
+"""
+
+def _parallel_tree(tmp_path, real: str) -> str:
+    (tmp_path / "broken.kc").write_text("menu \"Never closed\"\n", encoding="utf-8")
+    (tmp_path / "real.kc").write_text(real, encoding="utf-8")
+    root = tmp_path / "KConfig"
+    root.write_text(HELP_MENTIONS_SOURCE, encoding="utf-8")
+    return str(root)
+
+def test_parallel_load_ignores_over_reported_sources(tmp_path):
+    root = _parallel_tree(tmp_path, "config REAL\n    bool \"Real\"\n")
+
+    serial = KConfig(root, jobs=1)
+    parallel = KConfig(root, jobs=4)
+
+    assert list(parallel._options_index) == list(serial._options_index) == ["A", "REAL"]
+    assert sorted(parallel._units) == sorted(serial._units)
+
+def test_parallel_load_raises_like_serial(tmp_path):
+    root = _parallel_tree(tmp_path, "config REAL\n    bool \"Real\"\nendmenu\n")
+
+    with pytest.raises(SyntaxError) as serial:
+        KConfig(root, jobs=1)
+    with pytest.raises(SyntaxError) as parallel:
+        KConfig(root, jobs=4)
+
+    assert str(parallel.value) == str(serial.value)
+
+#  -- Saving --  #
+SOURCED_TWICE = """\
+menu "One"
+source "shared.kc"
+endmenu
+menu "Two"
+source "shared.kc"
+endmenu
+"""
+
+def test_fragment_sourced_twice_is_written_once(tmp_path):
+    import configparser
+
+    from mesonconfig.cli import build_meson_options
+
+    (tmp_path / "shared.kc").write_text("config SH\n    bool \"Shared\"\n    default y\n", encoding="utf-8")
+    kc = _load(tmp_path, SOURCED_TWICE)
+
+    config = tmp_path / "local.conf"
+    kc.save_config(str(config))
+    # Meson reads machine files with configparser, which rejects duplicates
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(config, encoding="utf-8")
+    assert parser["project options"]["SH"] == "true"
+
+    options = tmp_path / "meson_options.txt"
+    build_meson_options(kc, str(options))
+    assert options.read_text(encoding="utf-8").count("option('SH'") == 1
+
+def test_enforce_option_then_propagate(tmp_path):
+    # What the TUI does: assign now, fix up dependents later
+    kc = _load(tmp_path, CHAIN)
+    kc.set_option("A", "n")
+
+    assert not kc.enforce_option("A")
+    assert kc.find_option("B").value is True
+
+    assert kc.propagate(["A"]) == {"B", "C"}
+    assert kc.find_option("C").value is False
+
+    kc.set_option("A", "y")
+    kc.set_option("B", "y")
+    kc.set_option("A", "n")
+    assert kc.enforce_option("B")
+    assert kc.find_option("B").value is False
+
+def test_save_config_backup_is_optional(tmp_path):
+    kc = _load(tmp_path, CHAIN)
+    config = tmp_path / "local.conf"
+
+    kc.save_config(str(config), backup=False)
+    kc.set_value("D", "n")
+    kc.save_config(str(config), backup=False)
+    assert not (tmp_path / "local.conf.old").exists()
+
+    kc.set_value("D", "y")
+    kc.save_config(str(config))
+    assert "D = false" in (tmp_path / "local.conf.old").read_text(encoding="utf-8")
+
+def test_merge_provenance_covers_every_symbol(tmp_path):
+    kc = _load(tmp_path, CHAIN)
+    fragment = tmp_path / "frag.conf"
+    fragment.write_text("[project options]\nA = false\nC = true\n", encoding="utf-8")
+
+    report = kc.merge_configs([str(fragment)])
+    origins = {name: (a.origin, a.location) for name, a in report.provenance.items()}
+
+    assert list(origins) == ["A", "B", "C", "D"]
+    assert origins["A"] == ("file", f"{fragment}:2")
+    # B lost its default to A, and C its assignment
+    assert origins["B"] == ("enforced", "KConfig:4")
+    assert origins["C"] == ("enforced", "KConfig:8")
+    assert origins["D"] == ("default", "KConfig:12")
+    assert [(a.name, reason) for a, reason in report.ignored] == [("C", "dependencies not met")]
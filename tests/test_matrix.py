@@ -0,0 +1,56 @@
+#
+# Matrix runner regression tests for Mesonconfig
+# 2026, Remeny
+#
+
+# ---[ Libraries ]--- #
+import os
+import sys
+import time
+
+import pytest
+
+from mesonconfig import matrix
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "killpg"), reason="needs process groups")
+
+# ---[ Tests ]--- #
+# Records its pid, then outlives the test unless it is killed
+SLOW = "echo $$ > {builddir}/pid; case {name} in fast) exit 0;; esac; exec sleep 60"
+
+def _wait_for(path, seconds: float = 10.0) -> None:
+    deadline = time.monotonic() + seconds
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+def test_interrupt_kills_running_jobs(tmp_path):
+    jobs = matrix.plan_jobs([str(tmp_path / "fast.conf"), str(tmp_path / "slow.conf")], str(tmp_path / "out"))
+
+    def interrupt(result):
+        # What Ctrl-C does: KeyboardInterrupt in the main thread
+        _wait_for(jobs[1].builddir / "pid")
+        raise KeyboardInterrupt
+
+    start = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        matrix.run_matrix(jobs, ["sh", "-c", SLOW], str(tmp_path / "out"), workers=2, on_result=interrupt)
+
+    assert time.monotonic() - start < matrix.KILL_GRACE
+    pid = int((jobs[1].builddir / "pid").read_text())
+    assert not _alive(pid)
+
+def test_killed_pool_starts_no_more_jobs(tmp_path):
+    job = matrix.plan_jobs([str(tmp_path / "late.conf")], str(tmp_path / "out"))[0]
+
+    with matrix.JobPool(1) as pool:
+        pool.kill_all()
+        result = pool.submit(job, [sys.executable, "-c", "pass"]).result()
+
+    assert result.status == "error"
@@ -0,0 +1,78 @@
+#
+# Headless startup regression tests for Mesonconfig
+# 2026, Remeny
+#
+
+# ---[ Libraries ]--- #
+import json
+import subprocess
+import sys
+
+import pytest
+
+# ---[ Variables ]--- #
+# Generous on purpose: this catches an eager import of the TUI stack, not
+# milliseconds; benchmarks/bench_startup.py holds the real 150 ms budget
+IMPORT_BUDGET_MS = 1000.0
+
+FORBIDDEN = ("textual", "rich", "mesonconfig.tui.app")
+
+TREE = """\
+mainmenu "Startup"
+config A
+    bool "A"
+    default y
+menu "M"
+choice
+    prompt "Pick"
+config B
+    bool "B"
+config C
+    bool "C"
+endchoice
+endmenu
+"""
+
+_PROBE = """
+import json, sys
+from mesonconfig import cli
+argv, forbidden = json.loads(sys.argv[1]), json.loads(sys.argv[2])
+sys.argv = ["mesonconfig"] + argv
+try:
+    cli.main()
+except SystemExit:
+    pass
+loaded = sorted(m for m in sys.modules if any(m == f or m.startswith(f + ".") for f in forbidden))
+print(json.dumps(loaded), file=sys.stderr)
+"""
+
+# ---[ Tests ]--- #
+def _import_time_ms(module: str) -> float:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+@pytest.mark.parametrize("argv", [
+    ["--version"],
+    ["--help"],
+    ["--build-meson-options", "--no-cache", "KConfig"],
+    ["list", "--no-cache", "--kconfig-file", "KConfig"],
+])
+def test_headless_paths_skip_tui(tmp_path, argv):
+    (tmp_path / "KConfig").write_text(TREE, encoding="utf-8")
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE, json.dumps(argv), json.dumps(FORBIDDEN)],
+        capture_output=True, text=True, cwd=tmp_path,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert json.loads(proc.stderr.strip().splitlines()[-1]) == []
+
+def test_cli_import_within_budget():
+    best = min(_import_time_ms("mesonconfig.cli") for _ in range(3))
+    assert best <= IMPORT_BUDGET_MS